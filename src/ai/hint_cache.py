@@ -0,0 +1,183 @@
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional
+from src.core.bitboard import canonical_code, from_canonical_slot
+from src.core.config import HINT_CACHE_SIZE, POSITION_DATABASE_PATH
+from src.ai.position_db import PositionDatabase
+from src.ai.solver import NO_MOVE, solve
+from src.utils.logger import get_logger
+
+
+class HintCache:
+    """
+    Cache LRU de melhores jogadas, indexado pela posição canônica.
+
+    Muitas salas chegam às mesmas posições (a menos de rotação ou
+    reflexão), então a maior parte das dicas sai do cache sem busca.
+    Numa falta, a jogada vem do banco de posições, se houver, ou
+    do solver.
+
+    Attributes:
+        max_size (int): Quantidade máxima de posições guardadas.
+        database (PositionDatabase | None): Banco consultado nas faltas.
+        hits (int): Dicas respondidas pelo cache.
+        misses (int): Dicas que precisaram de consulta ou busca.
+        evictions (int): Posições descartadas por falta de espaço.
+    """
+    def __init__(
+        self,
+        max_size: int = HINT_CACHE_SIZE,
+        database: Optional[PositionDatabase] = None
+        ) -> None:
+        self.max_size = max_size
+        self.database = database
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[int, int]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+#! ========= COMMANDS =========
+
+    def get_hint(self, code: int, size: int = 3) -> Optional[int]:
+        """
+        Pega a melhor jogada de uma posição.
+
+        Args:
+            code (int): Código empacotado da posição
+                (veja `TicTacToe.pack`).
+            size (int): Lado do tabuleiro.
+
+        Returns:
+            (int | None): A casa da melhor jogada, ou None se a
+                posição já acabou ou não pode ser resolvida.
+        """
+        canonical, symmetry = canonical_code(code, size)
+        key = canonical << 3 | size
+        with self._lock:
+            move = self._entries.get(key)
+            if move is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if move is None:
+            move = self._compute(canonical, size)
+            self._store(key, move)
+        if move == NO_MOVE:
+            return None
+        return from_canonical_slot(move, symmetry, size)
+
+    def resize(self, max_size: int) -> None:
+        """
+        Muda o tamanho máximo do cache, descartando as
+        posições mais antigas se preciso.
+
+        Args:
+            max_size (int): Novo tamanho máximo.
+        """
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        """Esvazia o cache e zera os contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+#! ========= GETTERS =========
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Pega os contadores do cache.
+
+        Returns:
+            Dict[str, int]: hits, misses, evictions e size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries)
+        }
+
+#! ========= PROCESSING =========
+
+    def _compute(self, canonical: int, size: int) -> int:
+        """
+        Calcula a melhor jogada de uma posição canônica.
+
+        Args:
+            canonical (int): Código canônico.
+            size (int): Lado do tabuleiro.
+
+        Returns:
+            int: A jogada na posição canônica, ou `NO_MOVE`.
+        """
+        if self.database is not None:
+            info = self.database.lookup(canonical, size)
+            if info is not None:
+                move = info[1]
+                return NO_MOVE if move is None else move
+        if size != 3:
+            return NO_MOVE
+        return solve(canonical, size)[1]
+
+    def _store(self, key: int, move: int) -> None:
+        with self._lock:
+            self._entries[key] = move
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+_hint_cache: Optional[HintCache] = None
+_hint_cache_lock = Lock()
+
+
+def open_position_database(path: str = POSITION_DATABASE_PATH) -> Optional[PositionDatabase]:
+    """
+    Abre o banco de posições, se ele existe.
+
+    Args:
+        path (str): Caminho do banco.
+
+    Returns:
+        (PositionDatabase | None): O banco mapeado, ou None se o
+            arquivo não existe ou é inválido (as dicas saem do solver).
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        return PositionDatabase(path)
+    except (OSError, ValueError) as e:
+        get_logger().warning("position_database_unavailable", path=path, error=repr(e))
+        return None
+
+
+def get_hint_cache() -> HintCache:
+    """
+    Pega o cache de dicas compartilhado pelo processo.
+
+    Na criação, o banco em `POSITION_DATABASE_PATH` é aberto; como
+    ele é mapeado em memória, todos os processos dividem a mesma
+    tabela resolvida no page cache.
+
+    Returns:
+        HintCache: A instância única do processo.
+    """
+    global _hint_cache # pylint: disable=global-statement
+    if _hint_cache is None:
+        with _hint_cache_lock:
+            if _hint_cache is None:
+                _hint_cache = HintCache(database=open_position_database())
+    return _hint_cache
@@ -0,0 +1,344 @@
+from math import log, sqrt
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from src.core.bitboard import (
+    board_size,
+    cell_win_masks,
+    has_line,
+    join_code,
+    pack_board,
+    split_code
+)
+from src.core.config import (
+    MCTS_TIME_BUDGET,
+    MCTS_MAX_MOVE_TIME,
+    MCTS_EXPLORATION
+)
+from src.core.types import GameBoard
+
+# Resultado de uma posição: o jogador vencedor (0 ou 1) ou um destes.
+ONGOING = -2
+DRAW = -1
+
+
+def play(
+    circle: int,
+    cross: int,
+    player: int,
+    slot: int,
+    size: int
+    ) -> Tuple[int, int, int]:
+    """
+    Faz uma jogada sobre as máscaras e diz o resultado.
+
+    Só as linhas que passam pela casa jogada são verificadas.
+
+    Args:
+        circle (int): Casas do jogador 0.
+        cross (int): Casas do jogador 1.
+        player (int): Jogador que joga.
+        slot (int): Casa jogada.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Tuple[int, int, int]: As novas máscaras e o resultado
+            (`ONGOING`, `DRAW` ou o vencedor).
+    """
+    bit = 1 << slot
+    if player == 0:
+        circle |= bit
+        own = circle
+    else:
+        cross |= bit
+        own = cross
+    for mask in cell_win_masks(size)[slot]:
+        if own & mask == mask:
+            return circle, cross, player
+    if circle | cross == (1 << size * size) - 1:
+        return circle, cross, DRAW
+    return circle, cross, ONGOING
+
+
+def playout(
+    circle: int,
+    cross: int,
+    player: int,
+    size: int,
+    rng: Random
+    ) -> int:
+    """
+    Joga aleatoriamente até o fim da partida.
+
+    Trabalha só com inteiros, sem criar objetos `TicTacToe`.
+
+    Args:
+        circle (int): Casas do jogador 0.
+        cross (int): Casas do jogador 1.
+        player (int): Jogador da vez.
+        size (int): Lado do tabuleiro.
+        rng (Random): Gerador de números aleatórios.
+
+    Returns:
+        int: O vencedor ou `DRAW`.
+    """
+    occupied = circle | cross
+    empty = [i for i in range(size * size) if not occupied >> i & 1]
+    rng.shuffle(empty)
+    masks = cell_win_masks(size)
+    for slot in empty:
+        bit = 1 << slot
+        if player == 0:
+            circle |= bit
+            own = circle
+        else:
+            cross |= bit
+            own = cross
+        for mask in masks[slot]:
+            if own & mask == mask:
+                return player
+        player ^= 1
+    return DRAW
+
+
+class MCTSNode: # pylint: disable=too-few-public-methods
+    """
+    Nó da árvore de busca.
+
+    Attributes:
+        code (int): Código da posição depois de `move`.
+        move (int): Casa jogada para chegar ao nó.
+        parent (MCTSNode | None): Nó pai.
+        children (List[MCTSNode]): Filhos já expandidos.
+        untried (List[int]): Jogadas ainda não expandidas.
+        visits (int): Simulações que passaram pelo nó.
+        wins (float): Pontuação das simulações para quem fez `move`.
+        result (int): Resultado da posição (`ONGOING`, `DRAW`
+            ou o vencedor).
+    """
+    __slots__ = ("code", "move", "parent", "children", "untried", "visits", "wins", "result")
+
+    def __init__(
+        self,
+        code: int,
+        move: int,
+        parent: Optional["MCTSNode"],
+        result: int,
+        size: int
+        ) -> None:
+        self.code = code
+        self.move = move
+        self.parent = parent
+        self.children: List["MCTSNode"] = []
+        self.visits = 0
+        self.wins = 0.0
+        self.result = result
+        if result == ONGOING:
+            circle, cross, _ = split_code(code, size)
+            occupied = circle | cross
+            self.untried = [i for i in range(size * size) if not occupied >> i & 1]
+        else:
+            self.untried = []
+
+
+class MCTSBot:
+    """
+    Bot de Monte Carlo Tree Search para tabuleiros NxN.
+
+    A busca de cada jogada tem um orçamento de tempo e nunca passa
+    de `max_move_time`. Entre os turnos, a subárvore da jogada
+    escolhida (e da resposta do adversário) é reaproveitada.
+
+    Attributes:
+        time_budget (float): Segundos de busca por jogada.
+        max_move_time (float): Limite rígido por jogada.
+        exploration (float): Constante de exploração do UCT.
+        max_iterations (int | None): Limite de simulações por
+            jogada. Útil para resultados reproduzíveis.
+        last_iterations (int): Simulações feitas na última jogada.
+    """
+    def __init__(
+        self,
+        time_budget: float = MCTS_TIME_BUDGET,
+        max_move_time: float = MCTS_MAX_MOVE_TIME,
+        exploration: float = MCTS_EXPLORATION,
+        max_iterations: Optional[int] = None,
+        seed: Optional[int] = None
+        ) -> None:
+        self.time_budget = time_budget
+        self.max_move_time = max_move_time
+        self.exploration = exploration
+        self.max_iterations = max_iterations
+        self.last_iterations = 0
+        self._rng = Random(seed)
+        self._root: Optional[MCTSNode] = None
+        self._size = 0
+
+#! ========= COMMANDS =========
+
+    def choose_move(self, board: GameBoard, current_player: int) -> int:
+        """
+        Escolhe uma jogada para o jogador da vez.
+
+        Args:
+            board (GameBoard): Tabuleiro atual.
+            current_player (int): Jogador da vez (0 ou 1).
+
+        Returns:
+            int: A casa escolhida.
+        """
+        size = board_size(len(board))
+        root = self._get_root(pack_board(board, current_player), size)
+        if root.result != ONGOING:
+            raise ValueError("A partida já acabou, não há jogadas possíveis")
+        deadline = perf_counter() + min(self.time_budget, self.max_move_time)
+        self.last_iterations = self.search(root, deadline, size)
+        chosen = max(root.children, key=lambda child: child.visits)
+        chosen.parent = None
+        self._root = chosen
+        return chosen.move
+
+    def root_statistics(
+        self,
+        code: int,
+        size: int,
+        deadline: float,
+        moves: Optional[List[int]] = None
+        ) -> Dict[int, Tuple[int, float]]:
+        """
+        Faz uma busca numa árvore nova sem escolher jogada.
+
+        Usado pela busca paralela, que junta as estatísticas da
+        raiz de várias árvores (ou de partes da raiz).
+
+        Args:
+            code (int): Código da posição.
+            size (int): Lado do tabuleiro.
+            deadline (float): Fim da busca (`time.perf_counter`).
+            moves (List[int] | None): Jogadas da raiz que podem ser
+                exploradas. Se None, todas as jogadas legais.
+
+        Returns:
+            Dict[int, Tuple[int, float]]: (visitas, pontuação) de
+                cada jogada da raiz.
+        """
+        self._root = None
+        root = self._get_root(code, size)
+        if moves is not None:
+            root.untried = [move for move in root.untried if move in moves]
+        if root.untried:
+            self.last_iterations = self.search(root, deadline, size)
+        self._root = None
+        return {child.move: (child.visits, child.wins) for child in root.children}
+
+    def reset(self) -> None:
+        """Descarta a árvore guardada."""
+        self._root = None
+
+    def search(self, root: MCTSNode, deadline: float, size: int) -> int:
+        """
+        Roda simulações a partir de `root` até o prazo.
+
+        Faz ao menos uma simulação, para sempre haver uma jogada.
+
+        Args:
+            root (MCTSNode): Raiz da busca.
+            deadline (float): Fim da busca (`time.perf_counter`).
+            size (int): Lado do tabuleiro.
+
+        Returns:
+            int: Quantidade de simulações feitas.
+        """
+        rng = self._rng
+        iterations = 0
+        while True:
+            node = root
+            while not node.untried and node.children:
+                node = self._select(node)
+
+            if node.untried:
+                slot = node.untried.pop(rng.randrange(len(node.untried)))
+                circle, cross, player = split_code(node.code, size)
+                circle, cross, result = play(circle, cross, player, slot, size)
+                child = MCTSNode(
+                    join_code(circle, cross, player ^ 1, size), slot, node, result, size
+                )
+                node.children.append(child)
+                node = child
+
+            result = node.result
+            if result == ONGOING:
+                circle, cross, player = split_code(node.code, size)
+                result = playout(circle, cross, player, size, rng)
+
+            while node is not None:
+                node.visits += 1
+                mover = split_code(node.code, size)[2] ^ 1
+                if result == mover:
+                    node.wins += 1
+                elif result == DRAW:
+                    node.wins += 0.5
+                node = node.parent
+
+            iterations += 1
+            if self.max_iterations is not None and iterations >= self.max_iterations:
+                break
+            if perf_counter() >= deadline:
+                break
+        return iterations
+
+#! ========= GETTERS =========
+
+    def _get_root(self, code: int, size: int) -> MCTSNode:
+        """
+        Pega a raiz para uma posição, reaproveitando a árvore
+        anterior quando a posição é ela mesma ou uma resposta
+        do adversário já expandida.
+
+        Args:
+            code (int): Código da posição atual.
+            size (int): Lado do tabuleiro.
+
+        Returns:
+            MCTSNode: A raiz da busca.
+        """
+        root = self._root
+        if root is not None and self._size == size:
+            if root.code == code:
+                return root
+            for child in root.children:
+                if child.code == code:
+                    child.parent = None
+                    self._root = child
+                    return child
+        self._size = size
+        circle, cross, _ = split_code(code, size)
+        full = (1 << size * size) - 1
+        result = DRAW if circle | cross == full else ONGOING
+        for player, bits in enumerate((circle, cross)):
+            if has_line(bits, size):
+                result = player
+        self._root = MCTSNode(code, -1, None, result, size)
+        return self._root
+
+    def _select(self, node: MCTSNode) -> MCTSNode:
+        """
+        Escolhe o filho com maior UCT.
+
+        Args:
+            node (MCTSNode): Nó totalmente expandido.
+
+        Returns:
+            MCTSNode: O filho escolhido.
+        """
+        log_visits = log(node.visits)
+        exploration = self.exploration
+        best, best_score = node.children[0], -1.0
+        for child in node.children:
+            if child.result != ONGOING and child.result != DRAW:
+                # Jogada vencedora: não há o que explorar
+                return child
+            score = child.wins / child.visits + exploration * sqrt(log_visits / child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
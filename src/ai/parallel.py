@@ -0,0 +1,279 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from time import perf_counter
+from typing import Dict, List, Literal, Optional, Tuple
+from src.core.bitboard import board_size, pack_board, split_code
+from src.core.config import (
+    MCTS_TIME_BUDGET,
+    MCTS_MAX_MOVE_TIME,
+    PARALLEL_SEARCH_WORKERS,
+    PARALLEL_SPLIT_MIN_VISITS
+)
+from src.core.types import GameBoard
+from src.ai.mcts import MCTSBot
+
+SearchMode = Literal["trees", "split"]
+RootStatistics = Dict[int, Tuple[int, float]]
+
+# Folga para a ida e volta do resultado entre os processos.
+IPC_MARGIN = 0.05
+
+
+def _search_worker(
+    code: int,
+    size: int,
+    seconds: float,
+    max_iterations: Optional[int],
+    seed: int,
+    moves: Optional[List[int]]
+    ) -> RootStatistics:
+    """
+    Roda uma árvore MCTS independente num processo do pool.
+
+    Recebe a posição empacotada, então só inteiros passam pelo IPC.
+
+    Args:
+        code (int): Código da posição.
+        size (int): Lado do tabuleiro.
+        seconds (float): Tempo de busca.
+        max_iterations (int | None): Limite de simulações.
+        seed (int): Semente da árvore.
+        moves (List[int] | None): Jogadas da raiz desta árvore.
+
+    Returns:
+        RootStatistics: (visitas, pontuação) de cada jogada da raiz.
+    """
+    bot = MCTSBot(max_iterations=max_iterations, seed=seed)
+    return bot.root_statistics(code, size, perf_counter() + seconds, moves)
+
+
+def _free_slots(code: int, size: int) -> List[int]:
+    circle, cross, _ = split_code(code, size)
+    occupied = circle | cross
+    return [i for i in range(size * size) if not occupied >> i & 1]
+
+
+def _best_split_move(
+    statistics: RootStatistics,
+    min_visits: int = PARALLEL_SPLIT_MIN_VISITS
+    ) -> int:
+    """
+    Escolhe a jogada do modo "split" pela taxa de vitória.
+
+    Uma jogada com poucas visitas tem taxa de vitória instável
+    (1 vitória em 1 visita vale 100%), então só concorrem as que
+    têm `min_visits`. Se nenhuma chega lá, vence a mais visitada.
+
+    Args:
+        statistics (RootStatistics): Estatísticas da raiz.
+        min_visits (int): Visitas mínimas para concorrer.
+
+    Returns:
+        int: A casa escolhida.
+    """
+    candidates = [move for move, (visits, _) in statistics.items() if visits >= min_visits]
+    if not candidates:
+        return max(statistics, key=lambda move: statistics[move][0])
+    return max(candidates, key=lambda move: statistics[move][1] / statistics[move][0])
+
+
+class ParallelSearch:
+    """
+    Busca MCTS paralela na raiz, sobre um pool persistente de processos.
+
+    - "trees": cada processo roda uma árvore independente da mesma
+        posição e as visitas das jogadas da raiz são somadas.
+    - "split": as jogadas da raiz são divididas entre os processos
+        e vence a jogada com a maior taxa de vitória entre as que
+        têm visitas suficientes (veja `_best_split_move`).
+
+    Attributes:
+        workers (int): Quantidade de processos.
+        mode (SearchMode): Como a busca é dividida.
+        max_iterations (int | None): Limite de simulações da busca
+            toda, dividido entre os processos. Mais processos deixam
+            a jogada mais rápida com a mesma força, não mais forte.
+    """
+    def __init__(
+        self,
+        workers: int = PARALLEL_SEARCH_WORKERS,
+        mode: SearchMode = "trees",
+        max_iterations: Optional[int] = None,
+        seed: int = 0
+        ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.mode = mode
+        self.max_iterations = max_iterations
+        self._seed = seed
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelSearch":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+#! ========= COMMANDS =========
+
+    def search(
+        self,
+        code: int,
+        size: int,
+        seconds: float,
+        timeout: Optional[float] = None
+        ) -> RootStatistics:
+        """
+        Busca uma posição em todos os processos e junta o resultado.
+
+        Args:
+            code (int): Código da posição.
+            size (int): Lado do tabuleiro.
+            seconds (float): Tempo de busca de cada processo.
+            timeout (float | None): Limite rígido, em segundos, para
+                esperar os processos. Os que não responderem a tempo
+                ficam de fora do resultado.
+
+        Returns:
+            RootStatistics: (visitas, pontuação) juntas de cada
+                jogada da raiz.
+        """
+        deadline = None if timeout is None else perf_counter() + timeout
+        pool = self._get_pool()
+        tasks = self._split_moves(code, size)
+        iterations = self._split_iterations(len(tasks))
+        self._seed += len(tasks)
+        futures = [
+            pool.submit(
+                _search_worker, code, size, seconds,
+                iterations[i], self._seed + i, moves
+            )
+            for i, moves in enumerate(tasks)
+        ]
+        merged: RootStatistics = {}
+        for future in futures:
+            remaining = None if deadline is None else max(deadline - perf_counter(), 0.0)
+            try:
+                result = future.result(timeout=remaining)
+            except FutureTimeout:
+                future.cancel()
+                continue
+            for move, (visits, wins) in result.items():
+                total_visits, total_wins = merged.get(move, (0, 0.0))
+                merged[move] = (total_visits + visits, total_wins + wins)
+        return merged
+
+    def best_move(
+        self,
+        code: int,
+        size: int,
+        seconds: float,
+        timeout: Optional[float] = None
+        ) -> int:
+        """
+        Escolhe a melhor jogada de uma posição.
+
+        Args:
+            code (int): Código da posição.
+            size (int): Lado do tabuleiro.
+            seconds (float): Tempo de busca de cada processo.
+            timeout (float | None): Limite rígido da busca (veja
+                `search`). Se nenhum processo respondeu a tempo,
+                a primeira casa livre é jogada.
+
+        Returns:
+            int: A casa escolhida.
+
+        Raises:
+            ValueError: Se a partida já acabou.
+        """
+        statistics = self.search(code, size, seconds, timeout)
+        if not statistics:
+            moves = _free_slots(code, size)
+            if not moves:
+                raise ValueError("A partida já acabou, não há jogadas possíveis")
+            return moves[0]
+        if self.mode == "split":
+            return _best_split_move(statistics)
+        return max(statistics, key=lambda move: statistics[move][0])
+
+    def close(self) -> None:
+        """Encerra o pool de processos."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+#! ========= GETTERS =========
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Cria o pool na primeira busca e o mantém entre as jogadas."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _split_moves(self, code: int, size: int) -> List[Optional[List[int]]]:
+        """
+        Monta as tarefas da busca, uma por processo.
+
+        Args:
+            code (int): Código da posição.
+            size (int): Lado do tabuleiro.
+
+        Returns:
+            List[List[int] | None]: As jogadas da raiz de cada
+                tarefa (None para todas).
+        """
+        if self.mode == "trees":
+            return [None] * self.workers
+        moves = _free_slots(code, size)
+        return [moves[i::self.workers] for i in range(min(self.workers, len(moves)))]
+
+    def _split_iterations(self, tasks: int) -> List[Optional[int]]:
+        """
+        Divide `max_iterations` entre as tarefas.
+
+        Args:
+            tasks (int): Quantidade de tarefas.
+
+        Returns:
+            List[int | None]: O limite de cada tarefa (None sem limite).
+        """
+        if self.max_iterations is None:
+            return [None] * tasks
+        base, extra = divmod(self.max_iterations, tasks)
+        return [max(base + (i < extra), 1) for i in range(tasks)]
+
+
+class ParallelBot:
+    """
+    Bot que usa uma `ParallelSearch` para escolher as jogadas.
+
+    Attributes:
+        search (ParallelSearch): Busca paralela usada.
+        time_budget (float): Segundos de busca por jogada.
+        max_move_time (float): Limite rígido por jogada, já
+            descontada a folga do IPC.
+    """
+    def __init__(
+        self,
+        search: ParallelSearch,
+        time_budget: float = MCTS_TIME_BUDGET,
+        max_move_time: float = MCTS_MAX_MOVE_TIME
+        ) -> None:
+        self.search = search
+        self.time_budget = time_budget
+        self.max_move_time = max_move_time
+
+    def choose_move(self, board: GameBoard, current_player: int) -> int:
+        """
+        Escolhe uma jogada para o jogador da vez.
+
+        Args:
+            board (GameBoard): Tabuleiro atual.
+            current_player (int): Jogador da vez (0 ou 1).
+
+        Returns:
+            int: A casa escolhida.
+        """
+        seconds = max(min(self.time_budget, self.max_move_time - IPC_MARGIN), 0.0)
+        code = pack_board(board, current_player)
+        return self.search.best_move(code, board_size(len(board)), seconds, self.max_move_time)
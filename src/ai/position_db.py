@@ -0,0 +1,187 @@
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Optional, Tuple
+from src.core.bitboard import canonical_code, from_canonical_slot
+from src.ai.solver import NO_MOVE, iter_positions, solve
+
+# Formato do arquivo (little-endian):
+#   cabeçalho: magic | versão (u16) | quantidade de seções (u16)
+#   tabela:    uma entrada por lado de tabuleiro -> (lado, registros, offset)
+#   seções:    registros `RECORD` ordenados pelo código canônico
+# Os registros têm tamanho fixo, então a busca é binária direto
+# sobre o mapeamento, sem carregar nada para a memória do processo.
+DATABASE_MAGIC = b"TTTD"
+DATABASE_VERSION = 1
+HEADER = struct.Struct("<4sHH")
+SECTION = struct.Struct("<BxxxIQ")
+RECORD = struct.Struct("<QbB")
+# O código tem 2 * casas + 1 bits e precisa caber na chave u64
+MAX_BOARD_SIZE = 5
+
+PositionEntry = Tuple[int, int, int]
+PositionInfo = Tuple[int, Optional[int]]
+
+
+def write_database(
+    path: str,
+    sections: Dict[int, Iterable[PositionEntry]]
+    ) -> None:
+    """
+    Escreve um banco de posições.
+
+    O arquivo é gravado ao lado e trocado atomicamente, então
+    processos que já mapearam a versão anterior continuam lendo
+    um arquivo consistente.
+
+    Args:
+        path (str): Caminho do arquivo.
+        sections (Dict[int, Iterable[PositionEntry]]): Registros
+            por lado de tabuleiro. Cada registro é (código canônico,
+            resultado, melhor jogada na posição canônica).
+
+    Raises:
+        ValueError: Se um lado passa de `MAX_BOARD_SIZE`.
+    """
+    too_large = [size for size in sections if size > MAX_BOARD_SIZE]
+    if too_large:
+        raise ValueError(f"Tabuleiros maiores que {MAX_BOARD_SIZE}x{MAX_BOARD_SIZE} não cabem no banco: {too_large}")
+    sorted_sections = {
+        size: sorted(entries) for size, entries in sorted(sections.items())
+    }
+    offset = HEADER.size + SECTION.size * len(sorted_sections)
+    temp_path = path + ".tmp"
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(DATABASE_MAGIC, DATABASE_VERSION, len(sorted_sections)))
+        for size, entries in sorted_sections.items():
+            file.write(SECTION.pack(size, len(entries), offset))
+            offset += RECORD.size * len(entries)
+        for entries in sorted_sections.values():
+            for code, outcome, move in entries:
+                file.write(RECORD.pack(code, outcome, move))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def build_solved_database(
+    path: str,
+    books: Optional[Dict[int, Iterable[PositionEntry]]] = None
+    ) -> int:
+    """
+    Resolve todas as posições do 3x3 e grava o banco.
+
+    Args:
+        path (str): Caminho do arquivo.
+        books (Dict[int, Iterable[PositionEntry]] | None): Livros
+            de abertura de tabuleiros maiores, gravados junto.
+
+    Returns:
+        int: Quantidade de posições 3x3 gravadas.
+    """
+    entries: Dict[int, PositionEntry] = {}
+    for code in iter_positions(3):
+        canonical, _ = canonical_code(code, 3)
+        if canonical not in entries:
+            outcome, move = solve(canonical, 3)
+            entries[canonical] = (canonical, outcome, move)
+    sections: Dict[int, Iterable[PositionEntry]] = dict(books or {})
+    sections[3] = entries.values()
+    write_database(path, sections)
+    return len(entries)
+
+
+class PositionDatabase:
+    """
+    Leitura de um banco de posições mapeado em memória (read-only).
+
+    Qualquer quantidade de processos pode abrir o mesmo arquivo:
+    o sistema operacional mantém uma única cópia no page cache.
+
+    Attributes:
+        path (str): Caminho do arquivo.
+        sections (Dict[int, Tuple[int, int]]): (offset, registros)
+            de cada lado de tabuleiro presente.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, section_count = HEADER.unpack_from(self._map, 0)
+        if magic != DATABASE_MAGIC or version != DATABASE_VERSION:
+            self._map.close()
+            raise ValueError(f"Banco de posições inválido: {path}")
+        self.sections: Dict[int, Tuple[int, int]] = {}
+        for i in range(section_count):
+            size, count, offset = SECTION.unpack_from(self._map, HEADER.size + i * SECTION.size)
+            self.sections[size] = (offset, count)
+
+    def __enter__(self) -> "PositionDatabase":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(count for _, count in self.sections.values())
+
+    def close(self) -> None:
+        """Desfaz o mapeamento do arquivo."""
+        self._map.close()
+
+    def lookup(self, code: int, size: int = 3) -> Optional[PositionInfo]:
+        """
+        Procura uma posição pelo código empacotado
+        (veja `TicTacToe.pack`).
+
+        Args:
+            code (int): Código da posição, em qualquer orientação.
+            size (int): Lado do tabuleiro.
+
+        Returns:
+            (PositionInfo | None): (resultado, melhor jogada) com
+                a jogada já na orientação de `code`, ou None se a
+                posição não está no banco.
+        """
+        if size not in self.sections:
+            return None
+        canonical, symmetry = canonical_code(code, size)
+        record = self._find(canonical, size)
+        if record is None:
+            return None
+        outcome, move = record
+        if move == NO_MOVE:
+            return outcome, None
+        return outcome, from_canonical_slot(move, symmetry, size)
+
+    def _find(self, canonical: int, size: int) -> Optional[Tuple[int, int]]:
+        """
+        Busca binária de um código canônico na seção do tabuleiro.
+
+        Args:
+            canonical (int): Código canônico.
+            size (int): Lado do tabuleiro.
+
+        Returns:
+            (Tuple[int, int] | None): (resultado, jogada) do registro.
+        """
+        section = self.sections.get(size)
+        if section is None:
+            return None
+        offset, count = section
+        low, high = 0, count
+        record_size = RECORD.size
+        data = self._map
+        while low < high:
+            middle = (low + high) // 2
+            key, outcome, move = RECORD.unpack_from(data, offset + middle * record_size)
+            if key == canonical:
+                return outcome, move
+            if key < canonical:
+                low = middle + 1
+            else:
+                high = middle
+        return None
@@ -0,0 +1,137 @@
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+from src.core.bitboard import has_line, join_code, split_code
+
+# Resultados do ponto de vista do jogador da vez.
+WIN = 1
+DRAW = 0
+LOSS = -1
+
+NO_MOVE = 255
+
+Solution = Tuple[int, int]
+
+
+def solve(code: int, size: int = 3) -> Solution:
+    """
+    Resolve uma posição por busca exaustiva (negamax com memória).
+
+    Só é viável para o 3x3; tabuleiros maiores devem usar um
+    livro de aberturas ou o MCTS.
+
+    Args:
+        code (int): Código empacotado da posição.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Solution: (resultado, melhor jogada). O resultado é `WIN`,
+            `DRAW` ou `LOSS` para o jogador da vez; a jogada é
+            `NO_MOVE` se a posição já acabou.
+    """
+    circle, cross, player = split_code(code, size)
+    if player == 0:
+        score, move = _negamax(circle, cross, size)
+    else:
+        score, move = _negamax(cross, circle, size)
+    return (score > 0) - (score < 0), move
+
+
+def best_move(code: int, size: int = 3) -> Optional[int]:
+    """
+    Pega a melhor jogada de uma posição.
+
+    Args:
+        code (int): Código empacotado da posição.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        (int | None): A casa da melhor jogada, ou None se
+            a posição já acabou.
+    """
+    move = solve(code, size)[1]
+    return None if move == NO_MOVE else move
+
+
+def is_terminal(code: int, size: int = 3) -> bool:
+    """
+    Verifica se uma posição já acabou (vitória ou empate).
+
+    Args:
+        code (int): Código empacotado da posição.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        bool: True se não há mais jogadas.
+    """
+    circle, cross, _ = split_code(code, size)
+    full = (1 << size * size) - 1
+    return has_line(circle, size) or has_line(cross, size) or circle | cross == full
+
+
+def iter_positions(size: int = 3) -> Iterator[int]:
+    """
+    Percorre todas as posições não terminais alcançáveis a
+    partir do tabuleiro vazio, começando com qualquer jogador.
+
+    Args:
+        size (int): Lado do tabuleiro.
+
+    Yields:
+        int: Código de cada posição, sem repetição.
+    """
+    seen = set()
+    stack = [join_code(0, 0, 0, size), join_code(0, 0, 1, size)]
+    cells = size * size
+    while stack:
+        code = stack.pop()
+        if code in seen or is_terminal(code, size):
+            continue
+        seen.add(code)
+        yield code
+        circle, cross, player = split_code(code, size)
+        empty = ~(circle | cross)
+        for i in range(cells):
+            bit = 1 << i
+            if empty & bit:
+                if player == 0:
+                    stack.append(join_code(circle | bit, cross, 1, size))
+                else:
+                    stack.append(join_code(circle, cross | bit, 0, size))
+
+
+@lru_cache(maxsize=None)
+def _negamax(own: int, opponent: int, size: int) -> Solution:
+    """
+    Negamax sobre as máscaras do jogador da vez e do adversário.
+
+    A pontuação cresce com as casas livres que sobram no fim,
+    então entre duas vitórias a mais rápida é a escolhida (e
+    entre duas derrotas, a mais demorada).
+
+    Args:
+        own (int): Casas do jogador da vez.
+        opponent (int): Casas do adversário.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Solution: (pontuação, melhor jogada).
+    """
+    cells = size * size
+    occupied = own | opponent
+    free = cells - bin(occupied).count("1")
+    if has_line(opponent, size):
+        return -(free + 1), NO_MOVE
+    if free == 0:
+        return 0, NO_MOVE
+
+    best_score, best_slot = -cells - 2, NO_MOVE
+    for i in range(cells):
+        bit = 1 << i
+        if occupied & bit:
+            continue
+        score = -_negamax(opponent, own | bit, size)[0]
+        if score > best_score:
+            best_score, best_slot = score, i
+            if score == free:
+                break
+    return best_score, best_slot
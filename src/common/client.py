@@ -1,33 +1,198 @@
 import socket
 import threading
-from src.core.types import ConectionPort, IpAddress, ResponseMessage
-from src.common.connection_handler import ConnectionHandler
-from src.protocols.message_protocol import create_error_message
-from src.core.config import RESPONSE_CODES
+from queue import Empty, Queue
+from typing import Optional
+from src.core.types import (
+    ConectionPort, IpAddress, MessageType,
+    PayLoad, ResponseMessage, SystemMessage, Transport
+    )
+from src.common.transport import TcpTransport
+from src.protocols.enums import ConnectionActions, ServerWarning
+from src.protocols.framing import FrameDecoder, frame
+from src.protocols.message_protocol import create_error_message, create_message
+from src.protocols.serialize import serialize, deserialize
+from src.core.config import HEARTBEAT_INTERVAL, RECV_BUFFER_SIZE
+from src.utils.logger import get_logger
 from src.utils.validation_utils import was_successful
 
 class Client:
+    """
+    Client do jogo.
+
+    As mensagens do server são lidas por uma thread (`listen`) e
+    guardadas em `messages`, na ordem em que chegaram. Outra thread
+    (`heartbeat`) manda um `HEARTBEAT` a cada `heartbeat_interval`,
+    para o `IdleReaper` não fechar um client que só está esperando;
+    as respostas desses heartbeats não entram em `messages`. Os
+    deltas que o server empurra quando outro jogador da sala age
+    vão para `updates`, para não ocupar o lugar de uma resposta.
+
+    Attributes:
+        host (IpAddress): Endereço do server.
+        port (ConectionPort): Porta do server.
+        transport (Transport): Como o client conecta. Por padrão,
+            TCP em `host:port`; veja `src/common/transport.py`.
+        heartbeat_interval (float | None): Segundos entre os
+            heartbeats. Com None, nenhum é mandado.
+        sock (SocketConection | None): Socket conectado.
+        messages (Queue): Mensagens recebidas. Um None indica
+            que a conexão fechou.
+        updates (Queue): `STATE_DELTA`s das ações dos outros
+            jogadores da sala.
+        connection_result (ResponseMessage): Resultado do `connect`.
+    """
     def __init__(
         self,
-        host: IpAddress,
-        port: ConectionPort
+        host: IpAddress = "127.0.0.1",
+        port: ConectionPort = 5000,
+        transport: Optional[Transport] = None,
+        heartbeat_interval: Optional[float] = HEARTBEAT_INTERVAL
         ) -> None:
         self.host = host
         self.port = port
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.connect()
+        self.transport = transport if transport is not None else TcpTransport(host, port)
+        self.heartbeat_interval = heartbeat_interval
+        self.sock: Optional[socket.socket] = None
+        self.messages: "Queue[Optional[SystemMessage]]" = Queue()
+        self.updates: "Queue[SystemMessage]" = Queue()
+        self._listener: Optional[threading.Thread] = None
+        self._heartbeat: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._send_lock = threading.Lock()
+        # Acks ainda esperados dos heartbeats automáticos
+        self._pending_acks = 0
+        self._ack_lock = threading.Lock()
+        self.connection_result = self.connect()
+
+#! ========= COMMANDS =========
 
     def listen(self) -> None:
+        """Lê os frames do server até a conexão fechar."""
+        assert self.sock is not None
+        decoder = FrameDecoder()
+        try:
+            while True:
+                data = self.sock.recv(RECV_BUFFER_SIZE)
+                if not data:
+                    break
+                for message in decoder.feed(data):
+                    message = deserialize(message)
+                    if self._is_automatic_ack(message):
+                        continue
+                    if _is_pushed_delta(message):
+                        self.updates.put(message)
+                        continue
+                    self.messages.put(message)
+        except OSError:
+            pass
+        finally:
+            self._closed.set()
+            self.messages.put(None)
 
+    def heartbeat(self) -> None:
+        """Manda um `HEARTBEAT` a cada `heartbeat_interval` até a conexão fechar."""
+        assert self.heartbeat_interval is not None
+        while not self._closed.wait(self.heartbeat_interval):
+            with self._ack_lock:
+                self._pending_acks += 1
+            try:
+                self.send(ConnectionActions.HEARTBEAT, {})
+            except OSError:
+                break
 
     def connect(self) -> ResponseMessage:
+        """
+        Conecta ao server e começa a ouvir as mensagens.
+
+        Returns:
+            ResponseMessage: Mensagem de resposta da operação.
+        """
         result = self._try_connection()
         if not was_successful(result['code']):
             return result
 
-        socket_thread = threading.Thread(target=self.listen)
+        self._listener = threading.Thread(target=self.listen, daemon=True)
+        self._listener.start()
+        if self.heartbeat_interval is not None:
+            self._heartbeat = threading.Thread(target=self.heartbeat, daemon=True)
+            self._heartbeat.start()
+        get_logger().info("client_connected_to_server", transport=repr(self.transport))
+        return result
+
+    def send(self, msg_type: MessageType, payload: PayLoad) -> None:
+        """
+        Envia uma mensagem ao server.
+
+        Args:
+            msg_type (MessageType): Tipo da mensagem.
+            payload (PayLoad): Informação útil da mensagem.
+        """
+        assert self.sock is not None
+        data = frame(serialize(create_message(msg_type, payload)))
+        with self._send_lock:
+            self.sock.sendall(data)
+
+    def receive(self, timeout: Optional[float] = None) -> Optional[SystemMessage]:
+        """
+        Pega a próxima mensagem do server.
+
+        Args:
+            timeout (float | None): Segundos de espera. Com None,
+                espera até chegar uma mensagem.
+
+        Returns:
+            (SystemMessage | None): A mensagem, ou None se a
+                conexão fechou ou o tempo acabou.
+        """
+        try:
+            return self.messages.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def request(
+        self,
+        msg_type: MessageType,
+        payload: PayLoad,
+        timeout: Optional[float] = None
+        ) -> Optional[SystemMessage]:
+        """
+        Envia uma mensagem e espera a resposta.
+
+        Args:
+            msg_type (MessageType): Tipo da mensagem.
+            payload (PayLoad): Informação útil da mensagem.
+            timeout (float | None): Segundos de espera.
+
+        Returns:
+            (SystemMessage | None): A resposta. Veja `receive`.
+        """
+        self.send(msg_type, payload)
+        return self.receive(timeout)
+
+    def close(self) -> None:
+        """Fecha a conexão e espera as threads de leitura e de heartbeat."""
+        if self.sock is None:
+            return
+        self._closed.set()
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        if self._listener is not None:
+            self._listener.join()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
 
-        print(f"Conectado em {self.host}:{self.port}")
+    def _is_automatic_ack(self, message: SystemMessage) -> bool:
+        # Os acks são iguais; descartar qualquer um deles basta.
+        if message.get("type") != ServerWarning.HEARTBEAT_ACK.value:
+            return False
+        with self._ack_lock:
+            if not self._pending_acks:
+                return False
+            self._pending_acks -= 1
+            return True
 
     def _try_connection(self) -> ResponseMessage:
         """
@@ -37,7 +202,7 @@ class Client:
             ResponseMessage: Mensagem de resposta da operação.
         """
         try:
-            self.sock.connect((self.host, self.port))
+            self.sock = self.transport.connect()
             result = create_error_message(0)
         except socket.gaierror:
             result = create_error_message(1001)
@@ -50,3 +215,8 @@ class Client:
         except Exception as e: # pylint: disable=broad-exception-caught
             result = create_error_message(1000, e)
         return result
+
+
+def _is_pushed_delta(message: SystemMessage) -> bool:
+    # A resposta do `sync` também é um STATE_DELTA, mas sem `seq`
+    return message.get("type") == ServerWarning.STATE_DELTA.value and "seq" in message["payload"]
@@ -1,33 +1,343 @@
 import socket
-from src.core.types import SocketConection, Address
+from threading import Lock
+from typing import Dict, Mapping, Optional, Tuple
+from src.core.config import GameSymbols, RECV_BUFFER_SIZE, ROOM_RATE_LIMITS
+from src.core.types import (
+    SocketConection, Address, SystemMessage,
+    SystemComunication, PlayerId, PayLoad, ActionResponse
+    )
 from src.managers.game_manager import GameManager
+from src.managers.session_manager import Session, SessionManager
+from src.protocols.enums import ConnectionActions, GameActions, ServerWarning
+from src.protocols.errors import GameError
+from src.protocols.framing import FrameDecoder, frame
+from src.protocols.message_protocol import create_message
 from src.protocols.serialize import serialize, deserialize
+from src.protocols.state_sync import push_frame, state_delta, state_since, state_snapshot
+from src.protocols.validation import validate_message
+from src.common.idle_reaper import IdleReaper
+from src.common.rate_limiter import RateLimiter
+from src.utils.logger import get_logger
+
+HEARTBEAT_ACK = frame(serialize(create_message(ServerWarning.HEARTBEAT_ACK, {})))
+RATE_LIMITED = frame(serialize(create_message(
+    GameError.RATE_LIMITED,
+    {"success": False, "error": GameError.RATE_LIMITED}
+)))
+
 
 class ConnectionHandler:
+    """
+    Atende um client conectado.
+
+    Attributes:
+        client_socket (SocketConection): Socket do client.
+        addr (Address): Endereço do client.
+        game_manager (GameManager): Sala do client.
+        reaper (IdleReaper | None): Fecha a conexão se o
+            client ficar calado por tempo demais.
+        rate_limiter (RateLimiter): Limite de mensagens da conexão.
+        room_limiter (RateLimiter | None): Limite compartilhado
+            pelas conexões da sala. Veja `create_room_limiter`.
+        sessions (SessionManager): Sessões dos jogadores. Deve ser
+            compartilhado pelas conexões para o `resume` funcionar.
+        session (Session | None): Sessão do client, aberta pelo `join`.
+            Quando a conexão cai, a vaga fica reservada por
+            `SessionManager.grace_period`.
+        player_id (PlayerId | None): Jogador do client na sala.
+            Sem sessão, é removido da sala quando a conexão acaba.
+        closed (bool): Indica que a conexão foi fechada.
+    """
     def __init__(
         self,
         conn: SocketConection,
-        addr: Address
+        addr: Address,
+        game_manager: Optional[GameManager] = None,
+        reaper: Optional[IdleReaper] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        room_limiter: Optional[RateLimiter] = None,
+        sessions: Optional[SessionManager] = None
         ) -> None:
         self.client_socket = conn
         self.addr = addr
-        self.game_manager = GameManager()
+        self.game_manager = game_manager if game_manager is not None else GameManager()
+        self.reaper = reaper
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.room_limiter = room_limiter
+        self.sessions = sessions if sessions is not None else SessionManager()
+        self.session: Optional[Session] = None
+        self.player_id: Optional[PlayerId] = None
+        self.closed = False
+        self._send_lock = Lock()
 
     def run(self) -> None:
-        print(f"Cliente conectado: {self.addr}")
+        """
+        Atende o client até a conexão fechar. Cada mensagem chega
+        num frame (veja `src/protocols/framing.py`).
+        """
+        logger = get_logger()
+        logger.info("client_connected", addr=self.addr)
+        if self.reaper is not None:
+            self.reaper.touch(self)
+        decoder = FrameDecoder()
         try:
             while True:
-                client_data = deserialize(self.client_socket.recv(1024))
-                if not client_data:
+                data = self.client_socket.recv(RECV_BUFFER_SIZE)
+                if not data:
                     break
-
-                self.game_manager.apply_action(client_data)
+                if self.reaper is not None:
+                    self.reaper.touch(self)
+                for message in decoder.feed(data):
+                    try:
+                        decoded = deserialize(message)
+                    except (ValueError, UnicodeDecodeError):
+                        # JSON inválido ou bytes fora do UTF-8: o frame se
+                        # perde, mas a conexão continua.
+                        self.send(_INVALID_MESSAGES[GameError.INVALID_COMMAND])
+                        continue
+                    self.handle_message(decoded)
         except Exception as e: # pylint: disable=<broad-exception-caught>
-            print(f"Erro com o cliente {self.addr}: {e}")
+            if not self.closed:
+                logger.error("client_error", addr=self.addr, error=repr(e))
         finally:
-            try:
-                self.client_socket.shutdown(socket.SHUT_RDWR)
-                self.client_socket.close()
-            except:
-                pass
-            print(f'Cliente {self.addr} foi desconectado com sucesso.')
+            self.release()
+            logger.info("client_disconnected", addr=self.addr)
+
+    def handle_message(self, message: SystemMessage) -> None:
+        """
+        Trata uma mensagem do client e envia a resposta.
+
+        As mensagens acima do limite da conexão ou da sala
+        recebem `GameError.RATE_LIMITED` sem chegar ao jogo. As
+        malformadas recebem o erro da validação (veja
+        `src/protocols/validation.py`).
+
+        Args:
+            message (SystemMessage): Mensagem recebida.
+        """
+        raw_type = message.get("type") if isinstance(message, Mapping) else None
+        # Só tipos em texto têm limite próprio; o resto é barrado na validação
+        message_type = raw_type if isinstance(raw_type, str) else ""
+        if not self.rate_limiter.allow(message_type) or (
+            self.room_limiter is not None and not self.room_limiter.allow(message_type)
+        ):
+            get_logger().warning("client_throttled", addr=self.addr, type=message_type)
+            self.send(RATE_LIMITED)
+            return
+        invalid = validate_message(message)
+        if invalid is not None:
+            self.send(_INVALID_MESSAGES[invalid])
+            return
+        if message_type == ConnectionActions.HEARTBEAT.value:
+            self.send(HEARTBEAT_ACK)
+            return
+        if message_type == ConnectionActions.JOIN.value:
+            response = self._process_join(message["payload"])
+        elif message_type == ConnectionActions.RESUME.value:
+            response = self._process_resume(message["payload"])
+        elif message_type == ConnectionActions.SYNC.value:
+            response = self._process_sync(message["payload"])
+        else:
+            # O delta e o `seq` são tirados na ordem das ações, mas os
+            # envios ficam fora da trava: um socket lento não segura a sala.
+            room = self.game_manager
+            peer_data = b""
+            with room.lock:
+                if message_type == GameActions.EXIT.value and self.player_id is not None:
+                    # Sair no meio da partida é desistir (veja `GameManager.forfeit`)
+                    room.forfeit(self.player_id)
+                response = room.apply_action(message)
+                if response["payload"].get("success", False):
+                    response, peer_data = self._attach_delta(response)
+            self.send(frame(serialize(response)))
+            if peer_data:
+                self.sessions.broadcast(room, peer_data, exclude=self)
+            # Uma sala do pool cuja partida acabou volta para ele
+            room.recycle()
+            return
+        self.send(frame(serialize(response)))
+
+    def send(self, data: bytes) -> None:
+        """
+        Envia bytes já em frame ao client. Outras conexões da sala
+        também chamam (veja `SessionManager.broadcast`), então os envios
+        passam por um lock para os frames não se misturarem.
+
+        Args:
+            data (bytes): Frame(s) enviados.
+        """
+        with self._send_lock:
+            self.client_socket.sendall(data)
+
+    def close(self) -> None:
+        """
+        Fecha a conexão. Pode ser chamado de outra thread: o
+        `recv` bloqueado em `run` retorna e a conexão é liberada.
+        """
+        self.closed = True
+        try:
+            self.client_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def release(self) -> None:
+        """
+        Fecha o socket e tira o jogador da sala. Com sessão, a
+        vaga fica reservada até o fim do prazo de reconexão.
+        """
+        self.closed = True
+        if self.reaper is not None:
+            self.reaper.forget(self)
+        if self.session is not None:
+            self.sessions.suspend(self.session, self)
+            self.session = None
+            self.player_id = None
+        elif self.player_id is not None:
+            self.game_manager.remove_player(self.player_id)
+            self.game_manager.publish_state()
+            self.game_manager.recycle()
+            self.player_id = None
+        try:
+            self.client_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.client_socket.close()
+
+    def _process_join(self, payload: PayLoad) -> SystemMessage:
+        """
+        Coloca o client na sala e abre a sessão dele.
+
+        Args:
+            payload (PayLoad): Com `name` e `symbol`.
+
+        Returns:
+            SystemMessage: `ServerWarning.SESSION_OPENED` com o
+                `token` e o `seq` atual da sala, ou o erro.
+        """
+        if self.session is not None:
+            return _error_message(GameError.INVALID_ACTION)
+        try:
+            symbol = GameSymbols(payload.get("symbol"))
+        except ValueError:
+            return _error_message(GameError.INVALID_PAYLOAD)
+        result, session = self.sessions.open(
+            self.game_manager, payload.get("name", ""), symbol, self.client_socket, self
+        )
+        if session is None:
+            return _error_message(result)
+        self.session = session
+        self.player_id = session.player_id
+        # Os outros recebem a entrada como delta; este client, o estado completo
+        self.sessions.push_state(session.room, exclude=self)
+        snapshot = state_snapshot(session.room)["payload"]
+        return create_message(ServerWarning.SESSION_OPENED, {
+            "success": True,
+            "player_id": session.player_id,
+            "token": session.token,
+            "seq": self.sessions.last_seq(session.room),
+            "version": snapshot.get("version", 0),
+            "state": snapshot.get("state", {})
+        })
+
+    def _process_resume(self, payload: PayLoad) -> SystemMessage:
+        """
+        Religa o client à sessão dele.
+
+        Args:
+            payload (PayLoad): Com o `token` e o `seq` da última
+                mensagem recebida.
+
+        Returns:
+            SystemMessage: `ServerWarning.SESSION_RESUMED` com as
+                mensagens perdidas em `actions`. Se o log da sala
+                não as tem mais, `resync` vem True e o estado
+                completo vem em `state`. Com um token inválido,
+                `GameError.INVALID_SESSION`.
+        """
+        if self.session is not None:
+            return _error_message(GameError.INVALID_ACTION)
+        session, missed = self.sessions.resume(payload.get("token", ""), payload.get("seq", 0), self)
+        if session is None:
+            return _error_message(GameError.INVALID_SESSION)
+        self.session = session
+        self.player_id = session.player_id
+        self.game_manager = session.room
+        with session.room.lock:
+            player = session.room.get_player(session.player_id)
+            if player is not None:
+                player.client = self.client_socket
+        resumed: PayLoad = {
+            "success": True,
+            "player_id": session.player_id,
+            "seq": self.sessions.last_seq(session.room),
+            "actions": missed if missed is not None else [],
+            "resync": missed is None
+        }
+        if missed is None:
+            snapshot = state_snapshot(session.room)["payload"]
+            resumed["version"] = snapshot.get("version", 0)
+            resumed["state"] = snapshot.get("state", {})
+        return create_message(ServerWarning.SESSION_RESUMED, resumed)
+
+    def _process_sync(self, payload: PayLoad) -> SystemMessage:
+        """
+        Manda o estado da sala a partir da versão que o client tem.
+
+        Args:
+            payload (PayLoad): Com a `version` do client.
+
+        Returns:
+            SystemMessage: Um `ServerWarning.STATE_DELTA` desde a
+                versão do client ou, se ela ficou para trás demais,
+                um `ServerWarning.STATE_SNAPSHOT`.
+        """
+        return state_since(self.game_manager, payload.get("version", 0))
+
+    def _attach_delta(self, response: ActionResponse) -> Tuple[SystemMessage, bytes]:
+        """
+        Junta à resposta de uma ação as mudanças de estado
+        que ela causou (`version` e `state`) e a registra no log
+        da sessão. Deve ser chamado com a trava da sala.
+
+        Args:
+            response (ActionResponse): Resposta de `apply_action`.
+                Não é alterada; ela pode ser compartilhada.
+
+        Returns:
+            Tuple[SystemMessage, bytes]: Uma cópia da resposta com
+                os campos novos e o delta para as outras conexões da
+                sala (vazio se nada mudou; veja `push_frame`).
+        """
+        payload: PayLoad = response["payload"].copy()
+        message: SystemMessage = {"type": response["type"], "payload": payload}
+        delta = state_delta(self.game_manager)
+        payload["version"] = self.game_manager.version
+        if delta is not None:
+            payload["state"] = delta["payload"].get("state", {})
+        if self.session is not None:
+            payload["seq"] = self.sessions.record(self.game_manager, message)
+        if delta is None:
+            return message, b""
+        return message, push_frame(delta, payload.get("seq", 0))
+
+
+def _error_message(error: SystemComunication) -> SystemMessage:
+    return create_message(error, {"success": False, "error": error})
+
+
+# Respostas já serializadas (e em frames) para as mensagens malformadas
+_INVALID_MESSAGES: Dict[GameError, bytes] = {
+    error: frame(serialize(_error_message(error)))
+    for error in (GameError.INVALID_COMMAND, GameError.INVALID_ACTION, GameError.INVALID_PAYLOAD)
+}
+
+
+def create_room_limiter() -> RateLimiter:
+    """
+    Cria um limitador para ser compartilhado pelas conexões
+    de uma sala. Só limita os tipos de `ROOM_RATE_LIMITS`.
+
+    Returns:
+        RateLimiter: O limitador da sala.
+    """
+    return RateLimiter(ROOM_RATE_LIMITS, default=None)
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, List, Optional, TYPE_CHECKING
+from src.core.config import IDLE_TIMEOUT
+
+if TYPE_CHECKING:
+    from src.common.connection_handler import ConnectionHandler
+
+
+class IdleReaper:
+    """
+    Fecha as conexões que ficaram caladas por mais de `timeout`.
+
+    As conexões ficam num `OrderedDict` ordenado pela última
+    atividade: cada mensagem move a conexão para o fim, então as
+    ociosas estão sempre no começo. `reap` para na primeira conexão
+    ainda viva e custa O(conexões expiradas), não O(conexões).
+
+    Attributes:
+        timeout (float): Segundos sem mensagens até o fechamento.
+        clock (Callable[[], float]): Relógio usado nas medidas.
+        reaped (int): Conexões fechadas por ociosidade.
+    """
+    def __init__(
+        self,
+        timeout: float = IDLE_TIMEOUT,
+        clock: Callable[[], float] = monotonic
+        ) -> None:
+        self.timeout = timeout
+        self.clock = clock
+        self.reaped = 0
+        self._last_seen: "OrderedDict[ConnectionHandler, float]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._last_seen)
+
+#! ========= COMMANDS =========
+
+    def touch(self, handler: "ConnectionHandler") -> None:
+        """
+        Marca atividade numa conexão, começando a acompanhá-la
+        se preciso.
+
+        Args:
+            handler (ConnectionHandler): Conexão ativa.
+        """
+        now = self.clock()
+        with self._lock:
+            self._last_seen[handler] = now
+            self._last_seen.move_to_end(handler)
+
+    def forget(self, handler: "ConnectionHandler") -> None:
+        """
+        Para de acompanhar uma conexão.
+
+        Args:
+            handler (ConnectionHandler): Conexão encerrada.
+        """
+        with self._lock:
+            self._last_seen.pop(handler, None)
+
+    def reap(self, now: Optional[float] = None) -> int:
+        """
+        Fecha as conexões ociosas.
+
+        Os sockets são fechados fora do lock; o próprio
+        `ConnectionHandler` libera o jogador da sala ao sair do loop.
+
+        Args:
+            now (float | None): Momento atual. Por padrão, `clock()`.
+
+        Returns:
+            int: Quantidade de conexões fechadas.
+        """
+        if now is None:
+            now = self.clock()
+        limit = now - self.timeout
+        expired: List["ConnectionHandler"] = []
+        with self._lock:
+            while self._last_seen:
+                handler, last_seen = next(iter(self._last_seen.items()))
+                if last_seen > limit:
+                    break
+                self._last_seen.popitem(last=False)
+                expired.append(handler)
+
+        for handler in expired:
+            handler.close()
+        self.reaped += len(expired)
+        return len(expired)
@@ -0,0 +1,115 @@
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Mapping, Optional, Tuple
+from src.core.config import RATE_LIMITS, RATE_LIMIT_DEFAULT
+
+Limit = Tuple[float, int]
+
+
+class TokenBucket: # pylint: disable=too-few-public-methods
+    """
+    Balde de tokens reabastecido preguiçosamente.
+
+    Os tokens são repostos no momento do consumo, pelo tempo
+    passado desde a última vez, então não há thread nem timer.
+
+    Attributes:
+        rate (float): Tokens repostos por segundo.
+        capacity (int): Máximo de tokens (a rajada permitida).
+        tokens (float): Tokens disponíveis.
+        updated (float): Momento da última reposição.
+    """
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: int, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def consume(self, now: float) -> bool:
+        """
+        Tenta gastar um token.
+
+        Args:
+            now (float): Momento atual.
+
+        Returns:
+            bool: True se havia token.
+        """
+        tokens = self.tokens + (now - self.updated) * self.rate
+        self.updated = now
+        if tokens > self.capacity:
+            tokens = self.capacity
+        if tokens < 1.0:
+            self.tokens = tokens
+            return False
+        self.tokens = tokens - 1.0
+        return True
+
+
+class RateLimiter:
+    """
+    Limita as mensagens por tipo com um balde de tokens para cada.
+
+    Usado pelo `ConnectionHandler` antes de `GameManager.apply_action`:
+    um por conexão e, opcionalmente, um compartilhado pela sala.
+    Cada verificação é O(1).
+
+    Attributes:
+        limits (Mapping[str, Limit]): (tokens por segundo, rajada)
+            por tipo de mensagem.
+        default (Limit | None): Limite dos tipos fora de `limits`.
+            Com None, esses tipos não são limitados.
+        clock (Callable[[], float]): Relógio dos baldes.
+        throttled (Dict[str, int]): Mensagens recusadas por tipo.
+            Os tipos fora de `limits` contam em "".
+    """
+    def __init__(
+        self,
+        limits: Mapping[str, Limit] = RATE_LIMITS,
+        default: Optional[Limit] = RATE_LIMIT_DEFAULT,
+        clock: Callable[[], float] = monotonic
+        ) -> None:
+        self.limits = limits
+        self.default = default
+        self.clock = clock
+        self.throttled: Dict[str, int] = {}
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = Lock()
+
+    def allow(self, message_type: str) -> bool:
+        """
+        Verifica se uma mensagem pode passar, gastando um token.
+
+        Args:
+            message_type (str): Tipo da mensagem (o valor do
+                `GameActions`, por exemplo).
+
+        Returns:
+            bool: True se a mensagem pode ser processada.
+        """
+        # Tipos desconhecidos dividem um balde só, para um client
+        # não criar baldes à vontade.
+        key = message_type if isinstance(message_type, str) and message_type in self.limits else ""
+        with self._lock:
+            try:
+                bucket = self._buckets[key]
+            except KeyError:
+                # None no dict é um tipo sem limite, então a falta é a exceção
+                bucket = self._create_bucket(key)
+            if bucket is None or bucket.consume(self.clock()):
+                return True
+            self.throttled[key] = self.throttled.get(key, 0) + 1
+            return False
+
+    @property
+    def total_throttled(self) -> int:
+        """Total de mensagens recusadas."""
+        return sum(self.throttled.values())
+
+    def _create_bucket(self, key: str) -> Optional[TokenBucket]:
+        limit = self.limits.get(key, self.default)
+        bucket = None if limit is None else TokenBucket(limit[0], limit[1], self.clock())
+        self._buckets[key] = bucket
+        return bucket
@@ -1,5 +1,19 @@
 import socket
-from threading import Thread
+from threading import Event, Thread
+from typing import Any, List, Mapping, Optional, Sequence
+from src.core.config import (
+    IDLE_TIMEOUT, RATE_LIMIT_DEFAULT, RATE_LIMITS,
+    REAPER_INTERVAL, TIMER_WHEEL_TICK
+    )
+from src.core.types import Listener, SocketConection, Transport
+from src.common.connection_handler import ConnectionHandler
+from src.common.idle_reaper import IdleReaper
+from src.common.rate_limiter import Limit, RateLimiter
+from src.common.transport import TcpTransport
+from src.managers.game_manager import GameManager
+from src.managers.session_manager import SessionManager
+from src.utils.timer_wheel import get_timer_wheel
+from src.utils.logger import get_logger
 
 # Recebe a ação.
 # Valida.
@@ -7,15 +21,141 @@ from threading import Thread
 # Envia a resposta para todos os clientes (broadcast).
 
 class Server:
-    def __init__(self, host="0.0.0.0", port=5000) -> None:
+    """
+    Aceita conexões e cria um `ConnectionHandler` para cada uma.
+
+    Pode escutar em vários transportes ao mesmo tempo, por exemplo
+    TCP para os jogadores e um socket Unix para os bots e o gateway
+    da mesma máquina. Todos usam o mesmo framing, as mesmas sessões
+    e a mesma sala.
+
+    Attributes:
+        host (str): Endereço do TCP, se `transport` não é passado.
+        port (int): Porta do TCP, se `transport` não é passado.
+        transport (Transport): Como o server escuta. Por padrão, TCP
+            em `host:port`; veja `src/common/transport.py`.
+        transports (List[Transport]): `transport` e os de
+            `extra_transports`, cada um com o seu listener.
+        listeners (List[Listener]): Listeners, na ordem de
+            `transports`. `server_socket` é o primeiro.
+        game_manager (GameManager | None): Sala compartilhada pelas
+            conexões. Com None, cada conexão tem a sua.
+        rate_limits (Mapping[str, Limit]): Limites de cada conexão
+            (veja `RateLimiter`).
+        rate_limit_default (Limit | None): Limite dos tipos fora de
+            `rate_limits`.
+        reaper (IdleReaper): Fecha as conexões ociosas.
+        sessions (SessionManager): Sessões dos jogadores.
+        running (bool): Indica que o loop de `start_server` roda.
+    """
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 5000,
+        idle_timeout: float = IDLE_TIMEOUT,
+        transport: Optional[Transport] = None,
+        game_manager: Optional[GameManager] = None,
+        rate_limits: Mapping[str, Limit] = RATE_LIMITS,
+        rate_limit_default: Optional[Limit] = RATE_LIMIT_DEFAULT,
+        extra_transports: Sequence[Transport] = ()
+        ) -> None:
         self.host = host
         self.port = port
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen()
+        self.transport: Transport = transport if transport is not None else TcpTransport(host, port)
+        self.transports: List[Transport] = [self.transport, *extra_transports]
+        self.listeners: List[Listener] = []
+        try:
+            for transport_ in self.transports:
+                self.listeners.append(transport_.listen())
+        except OSError:
+            for listener in self.listeners:
+                listener.close()
+            raise
+        self.server_socket = self.listeners[0]
+        self.game_manager = game_manager
+        self.rate_limits = rate_limits
+        self.rate_limit_default = rate_limit_default
+        self.reaper = IdleReaper(idle_timeout)
+        self.sessions = SessionManager()
+        self.running = False
+        self._stopped = Event()
+        self._finished = Event()
+        self._finished.set()
 
     def start_server(self) -> None:
-        print(f"O servidor está ligado em: {self.host}:{self.port}")
-        while True:
-            client_socket, addr = self.server_socket.accept()
-            
+        """
+        Aceita conexões até `stop` ser chamado.
+
+        Cada listener extra tem a sua thread de `accept`. O loop do
+        primeiro acorda a cada `REAPER_INTERVAL` para fechar as
+        conexões ociosas. A roda de temporizadores tem a sua thread,
+        que avança a cada `TIMER_WHEEL_TICK`, para os relógios de
+        jogo dispararem na hora e não só a cada `REAPER_INTERVAL`.
+        """
+        logger = get_logger()
+        names = [repr(transport) for transport in self.transports]
+        logger.info("server_started", transports=names)
+        self.running = True
+        self._stopped.clear()
+        self._finished.clear()
+        threads = [
+            Thread(target=self._accept_loop, args=(listener, False), daemon=True)
+            for listener in self.listeners[1:]
+        ]
+        threads.append(Thread(target=self._drive_wheel, daemon=True))
+        for thread in threads:
+            thread.start()
+        self._accept_loop(self.server_socket, True)
+        for thread in threads:
+            thread.join()
+        logger.info("server_stopped", transports=names)
+        self._finished.set()
+
+    def stop(self, timeout: Optional[float] = REAPER_INTERVAL) -> None:
+        """
+        Para os loops de `start_server`, fecha os listeners e espera
+        o logger escrever o que está na fila, como o `server_stopped`.
+
+        Args:
+            timeout (float | None): Espera máxima pelo fim de
+                `start_server` em outra thread.
+        """
+        self.running = False
+        self._stopped.set()
+        for listener in self.listeners:
+            listener.close()
+        self._finished.wait(timeout)
+        get_logger().flush()
+
+    def _accept_loop(self, listener: Listener, maintain: bool) -> None:
+        logger = get_logger()
+        listener.settimeout(REAPER_INTERVAL)
+        while self.running:
+            try:
+                client_socket, addr = listener.accept()
+            except socket.timeout:
+                pass
+            except OSError:
+                # Listener fechado por `stop`
+                break
+            else:
+                self._spawn_handler(client_socket, addr)
+            if not maintain:
+                continue
+            reaped = self.reaper.reap()
+            if reaped:
+                logger.info("idle_connections_reaped", count=reaped)
+
+    def _drive_wheel(self) -> None:
+        wheel = get_timer_wheel()
+        while not self._stopped.wait(TIMER_WHEEL_TICK):
+            wheel.advance()
+
+    def _spawn_handler(self, client_socket: SocketConection, addr: Any) -> None:
+        client_socket.setblocking(True)
+        handler = ConnectionHandler(
+            client_socket, addr, game_manager=self.game_manager,
+            reaper=self.reaper, sessions=self.sessions,
+            rate_limiter=RateLimiter(self.rate_limits, self.rate_limit_default)
+        )
+        Thread(target=handler.run, daemon=True).start()
@@ -0,0 +1,216 @@
+import os
+import socket
+import stat
+from itertools import count
+from queue import Empty, Queue
+from threading import Event
+from typing import Any, Optional, Tuple
+from src.core.config import UNIX_SOCKET_PATH
+from src.core.types import ConectionPort, IpAddress, SocketConection
+
+
+class TcpTransport:
+    """
+    Transporte TCP (`AF_INET`).
+
+    Attributes:
+        host (IpAddress): Endereço do server.
+        port (ConectionPort): Porta do server. Com 0, o sistema
+            escolhe uma porta livre no `listen` e ela fica aqui.
+    """
+    def __init__(self, host: IpAddress = "0.0.0.0", port: ConectionPort = 5000) -> None:
+        self.host = host
+        self.port = port
+
+    def __repr__(self) -> str:
+        return f"tcp://{self.host}:{self.port}"
+
+    def listen(self) -> socket.socket:
+        """
+        Abre o socket que escuta.
+
+        Returns:
+            socket.socket: O socket, já escutando.
+        """
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server_socket.bind((self.host, self.port))
+        server_socket.listen()
+        self.port = server_socket.getsockname()[1]
+        return server_socket
+
+    def connect(self) -> SocketConection:
+        """
+        Conecta ao server.
+
+        Returns:
+            SocketConection: O socket conectado.
+
+        Raises:
+            OSError: Se a conexão falha (veja `Client.connect`).
+        """
+        host = "127.0.0.1" if self.host == "0.0.0.0" else self.host
+        return socket.create_connection((host, self.port))
+
+
+class UnixTransport:
+    """
+    Transporte por socket Unix (`AF_UNIX`), para bots e gateways na
+    mesma máquina do server. O tráfego não passa pela pilha TCP/IP;
+    o framing e o `ConnectionHandler` são os mesmos do TCP.
+
+    Attributes:
+        path (str): Arquivo do socket.
+    """
+    def __init__(self, path: str = UNIX_SOCKET_PATH) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"unix://{self.path}"
+
+    def listen(self) -> socket.socket:
+        """
+        Abre o socket que escuta. Um socket velho no mesmo caminho
+        (de um server que caiu) é removido antes.
+
+        Returns:
+            socket.socket: O socket, já escutando.
+
+        Raises:
+            FileExistsError: Se o caminho existe e não é um socket.
+        """
+        try:
+            mode = os.stat(self.path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"{self.path} existe e não é um socket.")
+            os.unlink(self.path)
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server_socket.bind(self.path)
+            server_socket.listen()
+        except OSError:
+            server_socket.close()
+            raise
+        return server_socket
+
+    def connect(self) -> SocketConection:
+        """
+        Conecta ao server.
+
+        Returns:
+            SocketConection: O socket conectado.
+
+        Raises:
+            ConnectionRefusedError: Se ninguém escuta em `path`.
+            OSError: Se a conexão falha por outro motivo.
+        """
+        client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client_socket.connect(self.path)
+        except FileNotFoundError as e:
+            client_socket.close()
+            raise ConnectionRefusedError(f"Nenhum server em {self.path}.") from e
+        except OSError:
+            client_socket.close()
+            raise
+        return client_socket
+
+
+class InProcessListener:
+    """
+    Lado do server do `InProcessTransport`. Tem a mesma interface
+    do socket que escuta (`accept`, `settimeout` e `close`).
+    """
+    def __init__(self) -> None:
+        self._pending: "Queue[Tuple[SocketConection, Any]]" = Queue()
+        self._timeout: Optional[float] = None
+        self._closed = Event()
+
+    def accept(self) -> Tuple[SocketConection, Any]:
+        """
+        Espera uma conexão.
+
+        Returns:
+            Tuple[SocketConection, Any]: O socket do server e o
+                "endereço" do client.
+
+        Raises:
+            socket.timeout: Se passou o tempo de `settimeout`.
+            OSError: Se o listener foi fechado.
+        """
+        if self._closed.is_set():
+            raise OSError("Listener fechado.")
+        try:
+            connection = self._pending.get(timeout=self._timeout)
+        except Empty:
+            raise socket.timeout("timed out") from None
+        if connection[0] is None:
+            raise OSError("Listener fechado.")
+        return connection
+
+    def settimeout(self, value: Optional[float]) -> None:
+        """Define o tempo máximo de espera do `accept`."""
+        self._timeout = value
+
+    def close(self) -> None:
+        """Fecha o listener; um `accept` bloqueado retorna com OSError."""
+        self._closed.set()
+        self._pending.put((None, None)) # type: ignore
+
+    def push(self, server_side: SocketConection, addr: Any) -> None:
+        """Entrega uma conexão nova ao `accept`."""
+        if self._closed.is_set():
+            raise ConnectionRefusedError("Listener fechado.")
+        self._pending.put((server_side, addr))
+
+
+class InProcessTransport:
+    """
+    Transporte dentro do próprio processo, com `socket.socketpair()`.
+
+    Cada `connect` cria um par de sockets ligados: um vai para o
+    `accept` do server e o outro volta para o client. O server, os
+    `ConnectionHandler`s e os clients rodam sem TCP nem portas, o
+    que deixa os testes de ponta a ponta determinísticos e tira o
+    ruído da pilha TCP dos benchmarks.
+    """
+    def __init__(self) -> None:
+        self._listener: Optional[InProcessListener] = None
+        self._ids = count(1)
+
+    def __repr__(self) -> str:
+        return "inprocess://"
+
+    def listen(self) -> InProcessListener:
+        """
+        Cria o listener.
+
+        Returns:
+            InProcessListener: O lado do server.
+        """
+        self._listener = InProcessListener()
+        return self._listener
+
+    def connect(self) -> SocketConection:
+        """
+        Conecta ao server.
+
+        Returns:
+            SocketConection: O lado do client do par.
+
+        Raises:
+            ConnectionRefusedError: Se o server não está escutando.
+        """
+        if self._listener is None:
+            raise ConnectionRefusedError("Nenhum server escutando.")
+        server_side, client_side = socket.socketpair()
+        try:
+            self._listener.push(server_side, ("inprocess", next(self._ids)))
+        except ConnectionRefusedError:
+            server_side.close()
+            client_side.close()
+            raise
+        return client_side
@@ -0,0 +1,298 @@
+from functools import lru_cache
+from math import isqrt
+from typing import List, Optional, Tuple
+from src.core.types import GameBoard
+
+# Código empacotado de uma posição num tabuleiro NxN (`cells` = N * N):
+#   bits [0, cells)            -> casas do jogador 0 (circle)
+#   bits [cells, 2 * cells)    -> casas do jogador 1 (cross)
+#   bit  2 * cells             -> 1 se for a vez do jogador 1
+# Um tabuleiro 3x3 cabe em 19 bits e um 5x5 em 51, sempre dentro
+# de um inteiro de 64 bits.
+
+Permutation = Tuple[int, ...]
+
+
+def board_size(cells: int) -> int:
+    """
+    Pega o lado de um tabuleiro quadrado pelo número de casas.
+
+    Args:
+        cells (int): Quantidade de casas do tabuleiro.
+
+    Returns:
+        int: O lado do tabuleiro.
+    """
+    size = isqrt(cells)
+    if size * size != cells:
+        raise ValueError(f"Tabuleiro não quadrado: {cells} casas")
+    return size
+
+
+def pack_board(board: GameBoard, current_player: Optional[int] = None) -> int:
+    """
+    Empacota um tabuleiro num código inteiro.
+
+    Args:
+        board (GameBoard): Tabuleiro com None, 0 ou 1 em cada casa.
+        current_player (int | None): Jogador da vez. None é
+            tratado como o jogador 0.
+
+    Returns:
+        int: Código empacotado da posição.
+    """
+    cells = len(board)
+    circle = cross = 0
+    for i, cell in enumerate(board):
+        if cell == 0:
+            circle |= 1 << i
+        elif cell == 1:
+            cross |= 1 << i
+    return circle | cross << cells | (1 if current_player == 1 else 0) << (2 * cells)
+
+
+def unpack_board(code: int, size: int = 3) -> Tuple[GameBoard, int]:
+    """
+    Desempacota o código de uma posição.
+
+    Args:
+        code (int): Código empacotado.
+        size (int): Lado do tabuleiro. Por padrão é 3.
+
+    Returns:
+        Tuple[GameBoard, int]: O tabuleiro e o jogador da vez.
+    """
+    cells = size * size
+    circle, cross, player = split_code(code, size)
+    board: GameBoard = [None] * cells
+    for i in range(cells):
+        if circle >> i & 1:
+            board[i] = 0
+        elif cross >> i & 1:
+            board[i] = 1
+    return board, player
+
+
+def split_code(code: int, size: int = 3) -> Tuple[int, int, int]:
+    """
+    Separa um código nas máscaras de cada jogador.
+
+    Args:
+        code (int): Código empacotado.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Tuple[int, int, int]: Máscara do jogador 0, máscara
+            do jogador 1 e o jogador da vez.
+    """
+    cells = size * size
+    full = (1 << cells) - 1
+    return code & full, code >> cells & full, code >> (2 * cells) & 1
+
+
+def join_code(circle: int, cross: int, player: int, size: int = 3) -> int:
+    """Inverso de `split_code`."""
+    cells = size * size
+    return circle | cross << cells | player << (2 * cells)
+
+
+@lru_cache(maxsize=None)
+def win_lines(size: int = 3) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Gera as linhas vencedoras de um tabuleiro NxN.
+
+    Para o 3x3 são as mesmas linhas de `VICTORIOUS_INDEX_MOVES`.
+
+    Args:
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: As casas de cada linha,
+            coluna e diagonal.
+    """
+    lines: List[Tuple[int, ...]] = []
+    for row in range(size):
+        lines.append(tuple(row * size + col for col in range(size)))
+    for col in range(size):
+        lines.append(tuple(row * size + col for row in range(size)))
+    lines.append(tuple(i * size + i for i in range(size)))
+    lines.append(tuple(i * size + size - 1 - i for i in range(size)))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def win_masks(size: int = 3) -> Tuple[int, ...]:
+    """
+    Gera as máscaras das linhas vencedoras de um tabuleiro NxN.
+
+    Args:
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Tuple[int, ...]: Uma máscara por linha de `win_lines`.
+    """
+    return tuple(sum(1 << i for i in line) for line in win_lines(size))
+
+
+@lru_cache(maxsize=None)
+def cell_win_masks(size: int = 3) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Agrupa as máscaras vencedoras pelas casas que elas contêm.
+
+    Depois de uma jogada, só as linhas que passam pela casa
+    jogada precisam ser verificadas.
+
+    Args:
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: As máscaras de cada casa.
+    """
+    return tuple(
+        tuple(mask for mask in win_masks(size) if mask >> i & 1)
+        for i in range(size * size)
+    )
+
+
+def has_line(bits: int, size: int = 3) -> bool:
+    """
+    Verifica se uma máscara de jogador completa alguma linha.
+
+    Args:
+        bits (int): Casas de um jogador.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        bool: True se o jogador venceu.
+    """
+    for mask in win_masks(size):
+        if bits & mask == mask:
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def symmetries(size: int = 3) -> Tuple[Permutation, ...]:
+    """
+    Gera as 8 simetrias (rotações e reflexões) do tabuleiro.
+
+    Cada simetria é uma permutação onde `perm[i]` é a casa para
+    onde a casa `i` vai. A primeira é sempre a identidade.
+
+    Args:
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Tuple[Permutation, ...]: As 8 permutações.
+    """
+    def rotate(row: int, col: int) -> Tuple[int, int]:
+        return col, size - 1 - row
+
+    perms: List[Permutation] = []
+    for mirror in (False, True):
+        for turns in range(4):
+            perm = []
+            for i in range(size * size):
+                row, col = divmod(i, size)
+                if mirror:
+                    col = size - 1 - col
+                for _ in range(turns):
+                    row, col = rotate(row, col)
+                perm.append(row * size + col)
+            perms.append(tuple(perm))
+    return tuple(perms)
+
+
+@lru_cache(maxsize=None)
+def inverse_symmetries(size: int = 3) -> Tuple[Permutation, ...]:
+    """Permutações inversas de `symmetries`, na mesma ordem."""
+    inverses = []
+    for perm in symmetries(size):
+        inverse = [0] * len(perm)
+        for src, dst in enumerate(perm):
+            inverse[dst] = src
+        inverses.append(tuple(inverse))
+    return tuple(inverses)
+
+
+@lru_cache(maxsize=None)
+def _symmetry_tables(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Tabelas de transformação por byte de máscara para cada simetria.
+
+    Transformar uma máscara vira algumas consultas por byte em vez
+    de um laço por casa.
+    """
+    tables = []
+    cells = size * size
+    for perm in symmetries(size):
+        table = []
+        for chunk in range((cells + 7) // 8):
+            for byte in range(256):
+                out = 0
+                for bit in range(8):
+                    i = chunk * 8 + bit
+                    if i < cells and byte >> bit & 1:
+                        out |= 1 << perm[i]
+                table.append(out)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+def transform_bits(bits: int, symmetry: int, size: int = 3) -> int:
+    """
+    Aplica uma simetria numa máscara de casas.
+
+    Args:
+        bits (int): Máscara de casas.
+        symmetry (int): Índice em `symmetries(size)`.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        int: A máscara transformada.
+    """
+    table = _symmetry_tables(size)[symmetry]
+    out = 0
+    offset = 0
+    while bits:
+        out |= table[offset + (bits & 0xFF)]
+        bits >>= 8
+        offset += 256
+    return out
+
+
+def canonical_code(code: int, size: int = 3) -> Tuple[int, int]:
+    """
+    Pega o código canônico de uma posição: o menor código
+    entre as 8 simetrias.
+
+    Args:
+        code (int): Código empacotado.
+        size (int): Lado do tabuleiro.
+
+    Returns:
+        Tuple[int, int]: O código canônico e o índice da
+            simetria que leva a posição original até ele.
+    """
+    circle, cross, player = split_code(code, size)
+    best_code, best_symmetry = code, 0
+    for symmetry in range(1, 8):
+        candidate = join_code(
+            transform_bits(circle, symmetry, size),
+            transform_bits(cross, symmetry, size),
+            player,
+            size
+        )
+        if candidate < best_code:
+            best_code, best_symmetry = candidate, symmetry
+    return best_code, best_symmetry
+
+
+def to_canonical_slot(slot: int, symmetry: int, size: int = 3) -> int:
+    """Leva uma casa da posição original para a canônica."""
+    return symmetries(size)[symmetry][slot]
+
+
+def from_canonical_slot(slot: int, symmetry: int, size: int = 3) -> int:
+    """Leva uma casa da posição canônica para a original."""
+    return inverse_symmetries(size)[symmetry][slot]
@@ -1,9 +1,14 @@
 from enum import Enum
+from types import MappingProxyType
 
 class GameSymbols(Enum):
     CIRCLE = 'o'
     CROSS = 'x'
 
+class GameVariant(Enum):
+    CLASSIC = 'classic' # Jogo da velha NxN
+    ULTIMATE = 'ultimate' # 3x3 de tabuleiros 3x3
+
 GAME_REPR_SYMBOLS = {
     GameSymbols.CIRCLE: 0,
     GameSymbols.CROSS: 1
@@ -32,3 +37,105 @@ RESPONSE_MESSAGES = {
     1004: "Erro: Um erro na rede ocorreu.",
     1000: "Erro: Algum erro desonhecido ocorreu."
 }
+
+# Journal de partidas (veja `src/storage/journal.py`)
+JOURNAL_SHARDS = 4
+JOURNAL_GROUP_COMMIT_SIZE = 64 # Registros acumulados antes de um fsync
+JOURNAL_GROUP_COMMIT_INTERVAL = 0.05 # Segundos máximos sem fsync
+JOURNAL_SNAPSHOT_INTERVAL = 4096 # Registros por shard entre snapshots
+
+# Banco de posições resolvidas (veja `src/ai/position_db.py`)
+POSITION_DATABASE_PATH = "data/positions.bin"
+
+# Cache de dicas de jogada (veja `src/ai/hint_cache.py`)
+HINT_CACHE_SIZE = 4096 # Posições canônicas mantidas
+
+# Bot MCTS (veja `src/ai/mcts.py`)
+MCTS_TIME_BUDGET = 0.1 # Segundos de busca por jogada
+MCTS_MAX_MOVE_TIME = 0.5 # Limite rígido, em segundos, por jogada
+MCTS_EXPLORATION = 1.414 # Constante de exploração do UCT
+
+# Busca paralela (veja `src/ai/parallel.py`)
+PARALLEL_SEARCH_WORKERS = 0 # 0 usa `os.cpu_count()`
+PARALLEL_SPLIT_MIN_VISITS = 20 # Visitas para uma jogada concorrer no modo "split"
+
+# Pool de salas (veja `src/managers/room_pool.py`)
+ROOM_POOL_HIGH_WATER = 1024 # Salas livres mantidas por variante
+
+# Matchmaking (veja `src/managers/matchmaking.py`)
+MATCHMAKING_RATING_BUCKET = 200 # Largura da faixa de rating; 0 ignora o rating
+
+# Roda de temporizadores (veja `src/utils/timer_wheel.py`)
+TIMER_WHEEL_TICK = 0.01 # Segundos por tick
+TIMER_WHEEL_SLOTS = 256 # Posições por nível (potência de 2)
+TIMER_WHEEL_LEVELS = 4 # Níveis; alcançam slots ** levels ticks
+
+# Heartbeat e conexões ociosas (veja `src/common/idle_reaper.py`)
+HEARTBEAT_INTERVAL = 10.0 # Segundos entre heartbeats do client
+IDLE_TIMEOUT = 30.0 # Segundos sem mensagens até a conexão ser fechada
+REAPER_INTERVAL = 1.0 # Segundos entre as verificações do server
+
+# Limite de mensagens (veja `src/common/rate_limiter.py`)
+# Tipo da mensagem -> (tokens por segundo, rajada máxima). Somente
+# leitura: são os valores padrão do `RateLimiter` e do `Server`.
+RATE_LIMITS = MappingProxyType({
+    "make_movement": (5.0, 10),
+    "restart": (0.5, 2),
+    "start": (0.5, 2),
+    "exit": (1.0, 2),
+    "hint": (1.0, 3),
+    "heartbeat": (1.0, 3),
+    "join": (0.5, 2),
+    "resume": (0.5, 2),
+    "sync": (1.0, 3),
+})
+RATE_LIMIT_DEFAULT = (5.0, 10) # Tipos fora de RATE_LIMITS
+ROOM_RATE_LIMITS = MappingProxyType({
+    "make_movement": (10.0, 20),
+    "restart": (1.0, 4),
+})
+
+# Sessões (veja `src/managers/session_manager.py`)
+SESSION_GRACE_PERIOD = 30.0 # Segundos que a vaga fica reservada após a queda
+ACTION_LOG_SIZE = 256 # Mensagens guardadas por sala para reenvio
+
+# Sincronização de estado (veja `src/protocols/state_sync.py`)
+STATE_HISTORY_SIZE = 32 # Deltas guardados por sala antes de mandar snapshot
+
+# Logs estruturados (veja `src/utils/logger.py`)
+LOG_LEVEL = "info"
+LOG_QUEUE_SIZE = 10000 # Registros na fila antes de começar a descartar
+# Somente leitura: são os valores padrão do `StructuredLogger`
+LOG_SAMPLE_RATES = MappingProxyType({}) # Evento -> fração mantida, ex.: {"heartbeat": 0.01}
+LOG_RATE_CAPS = MappingProxyType({ # Evento -> registros por segundo
+    "client_connected": 100,
+    "client_disconnected": 100,
+    "client_error": 20,
+    "client_throttled": 10,
+})
+
+# Histórico de partidas (veja `src/storage/match_store.py`)
+MATCH_STORE_QUEUE_SIZE = 4096 # Partidas na fila antes de começar a descartar
+MATCH_STORE_BATCH_SIZE = 256 # Partidas máximas por transação
+
+# Leaderboard (veja `src/managers/leaderboard.py`)
+LEADERBOARD_INITIAL_RATING = 1200
+LEADERBOARD_K_FACTOR = 32 # Variação máxima do rating por partida
+LEADERBOARD_MAX_RATING = 4000 # Ratings ficam entre 0 e este valor
+LEADERBOARD_SAVE_INTERVAL = 60.0 # Segundos entre os saves
+
+# Exportação do histórico (veja `src/tools/export_matches.py`)
+EXPORT_CHUNK_SIZE = 10000 # Partidas lidas do banco por bloco
+
+# Análise de replays (veja `src/tools/replay_analyzer.py`)
+ANALYZER_WORKERS = 0 # Processos do pool; 0 usa `os.cpu_count()`
+
+# Transporte e framing (veja `src/common/transport.py` e `src/protocols/framing.py`)
+MAX_FRAME_SIZE = 64 * 1024 # Bytes máximos de uma mensagem
+RECV_BUFFER_SIZE = 4096 # Bytes pedidos por `recv`
+UNIX_SOCKET_PATH = "/tmp/tictactoe.sock" # Arquivo do socket Unix do server
+
+# Snapshots das salas em memória compartilhada (veja `src/storage/room_snapshots.py`)
+SNAPSHOT_SLOTS = 1024 # Salas por região
+SNAPSHOT_MAX_CELLS = 81 # Casas do maior tabuleiro (Ultimate)
+SNAPSHOT_READ_RETRIES = 10000 # Leituras de um slot em escrita antes de desistir
@@ -1,6 +1,7 @@
 from typing import Tuple, Optional, Union
 from src.core.types import GameBoard
-from src.core.config import GameSymbols, GAME_REPR_SYMBOLS, VICTORIOUS_INDEX_MOVES
+from src.core.bitboard import pack_board, win_lines
+from src.core.config import GameSymbols, GameVariant, GAME_REPR_SYMBOLS
 from src.core.exceptions import DrawError, GameEndsError, PlayerNotDefinedError
 
 # Coord no tabuleiro:
@@ -32,22 +33,33 @@ class TicTacToe:
     Representa um jogo de Jogo da Velha.
 
     Attributes:
+        size (int): Lado do tabuleiro. Por padrão é 3.
         board (GameBoard): Tabuleiro do jogo. É definido
-            com 9 valores inicialmente None;
+            com `size * size` valores inicialmente None;
         current_player (int | None): O player atual. Representado
             por 0 (circle) ou 1 (cross). Inicialmente é None.
     """
-    def __init__(self) -> None:
+    __slots__ = ("size", "board", "current_player", "winner")
+    variant = GameVariant.CLASSIC
+
+    def __init__(self, size: int = 3) -> None:
         """Inicializa a classe TicTacToe."""
-        self.board: GameBoard = [None] * 9
+        self.size = size
+        self.board: GameBoard = [None] * (size * size)
         self.current_player: Optional[int] = None
         self.winner: Optional[int] = None
 
 #! ========== COMMANDS ==========
 
     def reset(self) -> None:
-        """Reseta todo o tabuleiro e os atributos."""
-        self.board = [None] * 9
+        """
+        Reseta todo o tabuleiro e os atributos.
+
+        O tabuleiro é limpo no lugar, sem criar uma lista nova.
+        """
+        board = self.board
+        for i in range(len(board)):
+            board[i] = None
         self.current_player = None
         self.winner = None
 
@@ -55,7 +67,7 @@ class TicTacToe:
         """Mostra o tabuleiro com os valores formatados."""
         for i, value in enumerate(self.board):
             end = ' | '
-            if i % 3 == 2:
+            if i % self.size == self.size - 1:
                 end = '\n'
             if value is not None:
                 value = self.get_player_repr(value).value
@@ -73,7 +85,8 @@ class TicTacToe:
 
         Args:
             slot (int): Slot do tabuleiro que terá
-                o movimento feito. Deve ser de 0 até 8.
+                o movimento feito. Deve ser de 0 até
+                `size * size - 1`.
         """
         self.board[slot] = self.current_player
 
@@ -107,7 +120,7 @@ class TicTacToe:
         #   4 | 5 | 6
         #   7 | 8 | 9
 
-        for block in VICTORIOUS_INDEX_MOVES:
+        for block in win_lines(self.size):
             values = self._get_board_block_values(block)
             if None in values:
                 continue
@@ -122,6 +135,46 @@ class TicTacToe:
         return None
 
 
+#! ========== PREDICATES ==========
+
+    def is_valid_slot(self, slot: int) -> bool:
+        """
+        Verifica se um slot existe no tabuleiro.
+
+        Args:
+            slot (int): Slot verificado.
+
+        Returns:
+            bool: True se o slot está dentro do tabuleiro.
+        """
+        return 0 <= slot < self.size * self.size
+
+    def is_occupied(self, slot: int) -> bool:
+        """
+        Verifica se um slot já foi usado.
+
+        Args:
+            slot (int): Slot verificado. Deve ser válido.
+
+        Returns:
+            bool: True se o slot já tem um símbolo.
+        """
+        return self.board[slot] is not None
+
+    def is_playable(self, slot: int) -> bool: # pylint: disable=unused-argument
+        """
+        Verifica se as regras da variante permitem jogar num
+        slot livre. No jogo clássico, qualquer slot livre pode
+        ser jogado.
+
+        Args:
+            slot (int): Slot livre verificado.
+
+        Returns:
+            bool: True se a jogada é permitida.
+        """
+        return True
+
 #! ========== SETTERS ==========
 
     def set_current_player(self, player: GameSymbols) -> None:
@@ -164,9 +217,18 @@ class TicTacToe:
             if value == target
         )
 
+    def pack(self) -> int:
+        """
+        Empacota a posição atual num código inteiro.
+
+        Returns:
+            int: Código da posição. Veja `src/core/bitboard.py`.
+        """
+        return pack_board(self.board, self.current_player)
+
     def _get_board_block_values(
         self,
-        block: Tuple[int, int, int]
+        block: Tuple[int, ...]
         ) -> Tuple[Optional[int], ...]:
         """
         Pega os valores de um determinado bloco
@@ -0,0 +1,45 @@
+from typing import Any, List, Optional
+from src.core.config import GameSymbols
+from src.core.types import PlayerId, SocketConection
+
+
+class Player:
+    """
+    Representa um jogador numa sala.
+
+    Usa `__slots__` para não ter um `__dict__` por jogador. O
+    acesso por chave (`player["symbol"]`) continua funcionando,
+    como no antigo `PlayerDict`.
+
+    Attributes:
+        id (PlayerId): Id do jogador na sala.
+        name (str): Nome do jogador.
+        symbol (GameSymbols): Símbolo do jogador.
+        client (SocketConection | None): Socket do jogador, ou
+            None para bots e jogadores recuperados do journal.
+    """
+    __slots__ = ("id", "name", "symbol", "client")
+
+    def __init__(
+        self,
+        player_id: PlayerId,
+        name: str,
+        symbol: GameSymbols,
+        client: Optional[SocketConection]
+        ) -> None:
+        self.id = player_id
+        self.name = name
+        self.symbol = symbol
+        self.client = client
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __repr__(self) -> str:
+        return f"Player(id={self.id}, name={self.name!r}, symbol={self.symbol})"
+
+
+PlayerList = List[Player]
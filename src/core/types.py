@@ -1,9 +1,12 @@
 # from __future__ import annotations
 import socket
 from typing import (
+    Any,
+    Dict,
     Tuple,
     TypeAlias,
     List,
+    Mapping,
     Protocol,
     Literal,
     Optional,
@@ -12,7 +15,6 @@ from typing import (
 )
 from src.protocols.enums import GameWarning, ServerWarning, GameActions
 from src.protocols.errors import GameError
-from src.core.config import GameSymbols
 
 IpAddress: TypeAlias = str
 ConectionPort: TypeAlias = int
@@ -45,6 +47,15 @@ class PayLoad(TypedDict, total=False):
     success: bool
     action: GameActions
     error: Optional[SystemComunication]
+    name: str
+    symbol: str
+    token: str
+    seq: int
+    actions: List["SystemMessage"]
+    resync: bool
+    version: int
+    base: int
+    state: Dict[str, Any]
 
 class SystemMessage(TypedDict):
     """
@@ -55,10 +66,29 @@ class SystemMessage(TypedDict):
     type: MessageType
     payload: PayLoad
 
-class PlayerDict(TypedDict):
-    id: PlayerId
-    name: str
-    symbol: GameSymbols
-    client: SocketConection
+# Resposta de `GameManager.apply_action`: uma `SystemMessage` somente
+# leitura (`MappingProxyType`), compartilhada entre chamadas.
+ActionResponse: TypeAlias = Mapping[str, Any]
+
+class BotPlayer(Protocol): # pylint: disable=too-few-public-methods
+    def choose_move(self, board: GameBoard, current_player: int) -> int:
+        ...
+
+class Listener(Protocol):
+    """Lado do server de um transporte. Imita o socket que escuta."""
+    def accept(self) -> Tuple[SocketConection, Any]:
+        ...
+
+    def settimeout(self, value: Optional[float]) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+class Transport(Protocol):
+    """Como o server escuta e o client conecta. Veja `src/common/transport.py`."""
+    def listen(self) -> Listener:
+        ...
 
-PlayerList: TypeAlias = List[PlayerDict]
+    def connect(self) -> SocketConection:
+        ...
@@ -0,0 +1,221 @@
+from typing import List, Optional, Union
+from src.core.bitboard import pack_board, split_code
+from src.core.types import GameBoard
+from src.core.config import GameSymbols, GameVariant, VICTORIOUS_INDEX_MOVES
+from src.core.exceptions import DrawError
+from src.core.game import TicTacToe, valide_conditions
+
+# Coord no Ultimate Tic-Tac-Toe:
+# O slot é `sub_tabuleiro * 9 + casa`, com os sub-tabuleiros e as
+# casas numerados como no jogo clássico:
+#   0 | 1 | 2
+#   3 | 4 | 5
+#   6 | 7 | 8
+# Cada jogador é uma máscara de 81 bits no mesmo layout, então as
+# casas do sub-tabuleiro `b` são os bits [9b, 9b + 9).
+
+SUB_BOARD_FULL = 0x1FF
+ALL_CELLS = (1 << 81) - 1
+SUB_BOARD_MASKS = tuple(SUB_BOARD_FULL << (9 * b) for b in range(9))
+ANY_SUB_BOARD = -1
+
+# LINE_TABLE[m] é 1 se a máscara 3x3 `m` completa alguma linha.
+# Serve tanto para os sub-tabuleiros quanto para o meta-tabuleiro.
+_LINE_MASKS = tuple(sum(1 << i for i in line) for line in VICTORIOUS_INDEX_MOVES)
+LINE_TABLE = bytes(
+    any(mask & line == line for line in _LINE_MASKS) for mask in range(512)
+)
+
+
+class UltimateTicTacToe(TicTacToe):
+    """
+    Representa uma partida de Ultimate Tic-Tac-Toe: um 3x3 de
+    tabuleiros 3x3 onde a casa jogada escolhe o sub-tabuleiro
+    do adversário.
+
+    O estado é guardado em máscaras de bits; vitórias locais e
+    globais são consultas em `LINE_TABLE`, e as jogadas legais
+    são uma máscara (veja `legal_moves`).
+
+    Attributes:
+        cells (List[int]): Máscara de 81 bits de cada jogador.
+        meta (List[int]): Sub-tabuleiros vencidos por cada jogador.
+        closed (int): Sub-tabuleiros vencidos ou cheios.
+        next_board (int): Sub-tabuleiro onde a próxima jogada deve
+            ser feita, ou `ANY_SUB_BOARD`.
+    """
+    __slots__ = ("cells", "meta", "closed", "next_board")
+    variant = GameVariant.ULTIMATE
+
+    def __init__(self) -> None: # pylint: disable=super-init-not-called
+        """Inicializa a classe UltimateTicTacToe."""
+        self.size = 9
+        self.cells: List[int] = [0, 0]
+        self.meta: List[int] = [0, 0]
+        self.closed = 0
+        self.next_board = ANY_SUB_BOARD
+        self.current_player: Optional[int] = None
+        self.winner: Optional[int] = None
+
+    @property
+    def board(self) -> GameBoard: # type: ignore[override]
+        """Tabuleiro no formato de lista, com 81 casas."""
+        circle, cross = self.cells
+        return [
+            0 if circle >> i & 1 else 1 if cross >> i & 1 else None
+            for i in range(81)
+        ]
+
+    @board.setter
+    def board(self, board: GameBoard) -> None:
+        circle, cross, _ = split_code(pack_board(board), 9)
+        self.cells = [circle, cross]
+        self.meta = [0, 0]
+        self.closed = 0
+        for b in range(9):
+            self._update_sub_board(b)
+
+#! ========== COMMANDS ==========
+
+    def reset(self) -> None:
+        """Reseta todo o tabuleiro e os atributos."""
+        self.cells[0] = self.cells[1] = 0
+        self.meta[0] = self.meta[1] = 0
+        self.closed = 0
+        self.next_board = ANY_SUB_BOARD
+        self.current_player = None
+        self.winner = None
+
+    def show_board(self) -> None:
+        """Mostra o tabuleiro com os sub-tabuleiros separados."""
+        board = self.board
+        for row in range(9):
+            values = []
+            for col in range(9):
+                slot = (row // 3 * 3 + col // 3) * 9 + row % 3 * 3 + col % 3
+                value = board[slot]
+                values.append("-" if value is None else self.get_player_repr(value).value)
+            print(" | ".join(" ".join(values[i:i + 3]) for i in (0, 3, 6)))
+            if row % 3 == 2 and row != 8:
+                print("------+-------+------")
+
+    @valide_conditions
+    def make_movement(
+        self,
+        slot: int
+        ) -> None:
+        """
+        Faz um movimento no tabuleiro.
+
+        Args:
+            slot (int): Slot do tabuleiro que terá o movimento
+                feito. Deve ser de 0 até 80 e estar em `legal_moves`.
+        """
+        player = self.current_player
+        assert player is not None
+        self.cells[player] |= 1 << slot
+        self._update_sub_board(slot // 9)
+        target = slot % 9
+        self.next_board = ANY_SUB_BOARD if self.closed >> target & 1 else target
+
+    @valide_conditions
+    def check_winner(
+        self,
+        with_symbols: bool = False
+        ) -> Optional[Union[int, GameSymbols]]:
+        """
+        Verifica se algum jogador venceu o meta-tabuleiro.
+
+        Args:
+            with_symbols (bool): Indica se o retorno deve
+                ser formatado para o símbolo do vencedor.
+
+        Raises:
+            DrawError: Todos os sub-tabuleiros foram fechados sem
+                vencedor no meta-tabuleiro.
+
+        Returns:
+            (GameSymbols | int | None): O vencedor, ou None para
+                nenhum vencedor até o momento.
+        """
+        for player in (0, 1):
+            if LINE_TABLE[self.meta[player]]:
+                self.winner = player
+                if with_symbols:
+                    return self.get_player_repr(player)
+                return player
+        if self.closed == SUB_BOARD_FULL:
+            raise DrawError("Houve um EMPATE")
+        return None
+
+#! ========== PREDICATES ==========
+
+    def is_valid_slot(self, slot: int) -> bool:
+        """Verifica se um slot existe no tabuleiro (0 até 80)."""
+        return 0 <= slot < 81
+
+    def is_occupied(self, slot: int) -> bool:
+        """Verifica se um slot já foi usado."""
+        return bool((self.cells[0] | self.cells[1]) >> slot & 1)
+
+    def is_playable(self, slot: int) -> bool:
+        """
+        Verifica se um slot livre está num sub-tabuleiro
+        permitido para a jogada atual.
+        """
+        return bool(self.legal_moves() >> slot & 1)
+
+#! ========== GETTERS ==========
+
+    def legal_moves(self) -> int:
+        """
+        Calcula as jogadas legais.
+
+        Returns:
+            int: Máscara de 81 bits com os slots que podem ser
+                jogados agora.
+        """
+        empty = ~(self.cells[0] | self.cells[1]) & ALL_CELLS
+        if self.next_board != ANY_SUB_BOARD:
+            return empty & SUB_BOARD_MASKS[self.next_board]
+        open_boards = 0
+        for b in range(9):
+            if not self.closed >> b & 1:
+                open_boards |= SUB_BOARD_MASKS[b]
+        return empty & open_boards
+
+    def pack(self) -> int:
+        """
+        Empacota a posição num código inteiro.
+
+        Returns:
+            int: Máscara do jogador 0, do jogador 1 (deslocada em
+                81 bits), o sub-tabuleiro alvo + 1 (4 bits, 0 para
+                qualquer um) e o jogador da vez.
+        """
+        return (
+            self.cells[0]
+            | self.cells[1] << 81
+            | (self.next_board + 1) << 162
+            | (1 if self.current_player == 1 else 0) << 166
+        )
+
+#! ========== PROCESSING ==========
+
+    def _update_sub_board(self, sub_board: int) -> None:
+        """
+        Atualiza o meta-tabuleiro depois de uma mudança num
+        sub-tabuleiro.
+
+        Args:
+            sub_board (int): Sub-tabuleiro alterado.
+        """
+        shift = 9 * sub_board
+        bit = 1 << sub_board
+        for player in (0, 1):
+            if LINE_TABLE[self.cells[player] >> shift & SUB_BOARD_FULL]:
+                self.meta[player] |= bit
+                self.closed |= bit
+                return
+        if (self.cells[0] | self.cells[1]) >> shift & SUB_BOARD_FULL == SUB_BOARD_FULL:
+            self.closed |= bit
@@ -0,0 +1,24 @@
+from src.core.config import GameVariant
+from src.core.game import TicTacToe
+from src.core.ultimate import UltimateTicTacToe
+
+
+def create_game(
+    variant: GameVariant = GameVariant.CLASSIC,
+    size: int = 3
+    ) -> TicTacToe:
+    """
+    Cria o motor de jogo de uma variante.
+
+    Args:
+        variant (GameVariant): Variante do jogo. Por padrão
+            é o jogo clássico.
+        size (int): Lado do tabuleiro clássico. Ignorado no
+            Ultimate, que é sempre 9x9.
+
+    Returns:
+        TicTacToe: O motor de jogo da variante.
+    """
+    if variant == GameVariant.ULTIMATE:
+        return UltimateTicTacToe()
+    return TicTacToe(size)
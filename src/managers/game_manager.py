@@ -1,23 +1,61 @@
 # from __future__ import annotations
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 from random import choice
+from threading import RLock
+from time import time
 from src.protocols.enums import (
     GameStatus, GameWarning,
     GameActions, ServerWarning
     )
 from src.protocols.errors import GameError
 from src.protocols.message_protocol import create_message
-from src.core.config import GameSymbols
+from src.protocols.state_sync import state_delta
+from src.protocols.validation import validate_payload
+from src.core.config import GameSymbols, GameVariant
 from src.core.game import TicTacToe
+from src.core.variants import create_game
+from src.core.player import Player, PlayerList
+from src.core.exceptions import DrawError
+from src.core.bitboard import board_size
+from src.ai.hint_cache import get_hint_cache
 from src.core.types import (
     SystemMessage, PayLoad,
     SystemComunication, ValidationResult,
-    PlayerList, PlayerDict,
-    SocketConection, PlayerId
+    SocketConection, PlayerId,
+    BotPlayer, ActionResponse
     )
 from src.utils.validation_utils import was_successful
 
+# Tipo da mensagem (Enum ou valor) -> ação, sem passar por `GameActions(t)`
+ACTIONS_BY_TYPE: Dict[Any, GameActions] = {
+    **{action.value: action for action in GameActions},
+    **{action: action for action in GameActions}
+}
+
+# Resultados que não são erro
+SAFE_RESULTS = frozenset((
+    GameWarning.OK,
+    ServerWarning.GAME_READY_TO_START,
+    ServerWarning.DISCONNECT_CLIENT
+))
+
+# Respostas somente leitura por (ação, resultado). Veja `_get_response`.
+_RESPONSES: Dict[Tuple[Optional[GameActions], SystemComunication], ActionResponse] = {}
+
+if TYPE_CHECKING:
+    from src.storage.journal import MatchJournal
+    from src.managers.turn_clock import TurnClock
+    from src.utils.timer_wheel import TimerWheel
+    from src.protocols.state_sync import StateTracker
+    from src.managers.room_registry import RoomRegistry
+    from src.storage.match_store import MatchStore
+    from src.managers.leaderboard import Leaderboard
+    from src.storage.room_snapshots import SnapshotPublisher
+    from src.managers.room_pool import RoomPool
+    from src.managers.session_manager import SessionManager
+
 
 class GameManager:
     """
@@ -25,6 +63,8 @@ class GameManager:
 
     Attributes:
         game (TicTacToe): Um instância do jogo Tic-Tac-Toe.
+            O lado do tabuleiro é definido por `size` e o
+            motor pela `variant` (veja `create_game`).
         player (PlayerList): Lista de players ativos.
         next_player_id (int): Contador de id dos players.
             Indica o id do próximo jogador a se conectar.
@@ -33,13 +73,96 @@ class GameManager:
         status (GameStatus): Indica o status atual do jogo.
             Veja `GameStatus.__doc__` para as informações
             dos status.
+        room_id (int): Id da sala. Usado pelo journal.
+        journal (MatchJournal | None): Journal onde as
+            mudanças de estado são registradas. Veja
+            `MatchJournal.attach`.
+        last_hint (int | None): A última jogada sugerida
+            pela ação `hint`.
+        bots (Dict[PlayerId, BotPlayer] | None): Jogadores
+            controlados por bots. Veja `add_bot` e `play_bot_turn`.
+            Só é criado quando o primeiro bot entra.
+        clock (TurnClock | None): Relógio de jogo da sala.
+            Veja `set_time_control`.
+        version (int): Versão do estado publicado aos clients.
+            Só cresce. Veja `src/protocols/state_sync.py`.
+        state_tracker (StateTracker | None): Último estado
+            publicado, usado para calcular os deltas.
+        registry (RoomRegistry | None): Registry que indexa a sala
+            pelo status e pelas vagas livres. É avisado a cada
+            mudança. Veja `RoomRegistry.register`.
+        moves (List[int]): Casas jogadas na partida atual, em ordem.
+        started_at (float | None): Início da partida atual
+            (`time.time`), ou None se nenhuma começou.
+        finished_at (float | None): Fim da última partida.
+        store (MatchStore | None): Onde as partidas terminadas
+            são gravadas. Veja `MatchStore.attach`.
+        leaderboard (Leaderboard | None): Ranking atualizado com
+            as partidas terminadas. Veja `Leaderboard.attach`.
+        lock (RLock): Serializa as mudanças da sala entre as threads
+            dos `ConnectionHandler`s e a da roda de temporizadores.
+            Todo método que muda a sala e a registra no journal roda
+            com ela, então o snapshot do journal nunca pega uma
+            mudança pela metade (veja `MatchJournal.snapshot`).
+        snapshots (SnapshotPublisher | None): Memória compartilhada
+            onde cada versão do estado é publicada para os processos
+            de espectadores. Veja `SnapshotPublisher.attach`.
+        pool (RoomPool | None): Pool que entregou a sala. Ela volta
+            para ele quando fica ociosa (veja `recycle`).
+        sessions (SessionManager | None): Sessões dos jogadores da
+            sala. Recebem os deltas das mudanças feitas fora das
+            ações (veja `publish_state`).
+
+    **Note**: A classe usa `__slots__` para reduzir o custo por
+        sala. Veja `room_memory_report`.
     """
-    def __init__(self) -> None:
-        self.game: TicTacToe = TicTacToe()
+    __slots__ = (
+        "game", "players", "next_player_id", "winner", "_status",
+        "room_id", "journal", "last_hint", "bots", "clock",
+        "version", "state_tracker", "registry",
+        "moves", "started_at", "finished_at", "store", "leaderboard",
+        "snapshots", "lock", "pool", "sessions"
+    )
+
+    def __init__(
+        self,
+        size: int = 3,
+        variant: GameVariant = GameVariant.CLASSIC
+        ) -> None:
+        self.registry: Optional["RoomRegistry"] = None
+        self.game: TicTacToe = create_game(variant, size)
         self.players: PlayerList = []
         self.next_player_id: PlayerId = 0
         self.winner: Optional[PlayerId] = None
-        self.status: GameStatus = GameStatus.WAITING
+        self._status: GameStatus = GameStatus.WAITING
+        self.room_id: int = 0
+        self.journal: Optional["MatchJournal"] = None
+        self.last_hint: Optional[int] = None
+        self.bots: Optional[Dict[PlayerId, BotPlayer]] = None
+        self.clock: Optional["TurnClock"] = None
+        self.version: int = 0
+        self.state_tracker: Optional["StateTracker"] = None
+        self.moves: List[int] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.store: Optional["MatchStore"] = None
+        self.leaderboard: Optional["Leaderboard"] = None
+        self.snapshots: Optional["SnapshotPublisher"] = None
+        self.lock = RLock()
+        self.pool: Optional["RoomPool"] = None
+        self.sessions: Optional["SessionManager"] = None
+
+    @property
+    def status(self) -> GameStatus:
+        """Status atual do jogo. Veja `GameStatus.__doc__`."""
+        return self._status
+
+    @status.setter
+    def status(self, status: GameStatus) -> None:
+        if status is not self._status:
+            self._status = status
+            if self.registry is not None:
+                self.registry.update(self)
 
 #! ========= COMMANDS =========
 
@@ -59,25 +182,35 @@ class GameManager:
                 inicial aleatório. Só irá funcionar se um player
                 inicial ainda não foi escolhido.
         """
-        current_player_id = self.get_current_player()
-        if current_player_id is not None:
-            len_players = len(self.players)
-            current_player_dict = self.get_player(current_player_id)
-            assert current_player_dict is not None
-            current_player_index = self.players.index(current_player_dict)
-            next_player_id = self.players[(current_player_index + 1) % len_players]["id"]
-        else:
-            next_player_id = (
-                choice(self.players)["id"] if
-                random_initial_player else
-                self.players[0]["id"]
-            )
-        self.set_current_player(next_player_id)
+        with self.lock:
+            current_player_id = self.get_current_player()
+            if current_player_id is not None:
+                len_players = len(self.players)
+                current_player_dict = self.get_player(current_player_id)
+                assert current_player_dict is not None
+                current_player_index = self.players.index(current_player_dict)
+                next_player_id = self.players[(current_player_index + 1) % len_players].id
+            else:
+                next_player_id = (
+                    choice(self.players).id if
+                    random_initial_player else
+                    self.players[0].id
+                )
+            self.set_current_player(next_player_id)
 
     def start_game(self) -> None:
         """Começa o jogo."""
-        self.status = GameStatus.ONGOING
-        self.reset_board()
+        with self.lock:
+            self.status = GameStatus.ONGOING
+            self.winner = None
+            self.reset_board()
+            self.moves.clear()
+            self.started_at = time()
+            self.finished_at = None
+            if self.clock is not None:
+                self.clock.reset()
+            if self.journal is not None:
+                self.journal.record_begin(self.room_id)
 
     def reset_all(self) -> None:
         """
@@ -85,15 +218,23 @@ class GameManager:
 
         Isso inclui: Jogadores, atributos, partidas e o tabuleiro.
         """
-        self.reset_board()
-        self.remove_all_player()
-        self.reset_manager()
+        with self.lock:
+            self.reset_board()
+            self.remove_all_player()
+            self.reset_manager()
+            if self.clock is not None:
+                self.clock.stop()
+            if self.journal is not None:
+                self.journal.record_reset(self.room_id)
 
     def reset_manager(self) -> None:
         """Reseta todos os atributos do GameManager."""
         self.next_player_id: PlayerId = 0
         self.winner: Optional[PlayerId] = None
-        self.status: GameStatus = GameStatus.WAITING
+        self.status = GameStatus.WAITING
+        self.moves.clear()
+        self.started_at = None
+        self.finished_at = None
 
     def reset_board(self) -> None:
         """Reseta o tabuleiro."""
@@ -110,10 +251,19 @@ class GameManager:
                 - GameWarning.OK: Indica que todos os
                     jogadores foram removidos com sucesso.
         """
-        if not self.players:
-            return GameError.EMPTY_PARTY
-        self.players = []
-        return GameWarning.OK
+        with self.lock:
+            if not self.players:
+                return GameError.EMPTY_PARTY
+            # A sala muda antes dos registros, como em `apply_action`
+            removed = [player.id for player in self.players]
+            self.players.clear()
+            self.bots = None
+            if self.journal is not None:
+                for player_id in removed:
+                    self.journal.record_leave(self.room_id, player_id)
+            if self.registry is not None:
+                self.registry.update(self)
+            return GameWarning.OK
 
     def remove_player(
         self,
@@ -135,15 +285,22 @@ class GameManager:
                 - GameWarning.OK: O jogador for
                     removido.
         """
-        if not self.players:
-            return GameError.EMPTY_PARTY
-        for i, player in enumerate(self.players):
-            if player["id"] == player_id:
-                self.players.pop(i)
-                break
-        else:
-            return GameError.NON_EXISTENT_PLAYER
-        return GameWarning.OK
+        with self.lock:
+            if not self.players:
+                return GameError.EMPTY_PARTY
+            for i, player in enumerate(self.players):
+                if player.id == player_id:
+                    self.players.pop(i)
+                    break
+            else:
+                return GameError.NON_EXISTENT_PLAYER
+            if self.bots is not None:
+                self.bots.pop(player_id, None)
+            if self.journal is not None:
+                self.journal.record_leave(self.room_id, player_id)
+            if self.registry is not None:
+                self.registry.update(self)
+            return GameWarning.OK
 
     def add_player(
         self,
@@ -177,52 +334,208 @@ class GameManager:
         **Note**: Para verificar os jogadores ativos no jogo e
             suas informações, veja o atributo `players`.
         """
-        if len(self.players) >= 2:
-            return GameError.FULL_PARTY
-        validation_result = self._validate_player_symbol(symbol)
-        if not was_successful(validation_result):
-            return validation_result
+        with self.lock:
+            if len(self.players) >= 2:
+                return GameError.FULL_PARTY
+            validation_result = self._validate_player_symbol(symbol)
+            if not was_successful(validation_result):
+                return validation_result
+            player_id = self.next_player_id
+            self.next_player_id += 1
+            self.players.append(Player(player_id, player_name, symbol, client))
+            if self.journal is not None:
+                self.journal.record_join(self.room_id, player_id, player_name, symbol)
+            if self.registry is not None:
+                self.registry.update(self)
+            return GameWarning.OK
+
+    def add_bot(
+        self,
+        player_name: str,
+        symbol: GameSymbols,
+        bot: BotPlayer
+        ) -> ValidationResult:
+        """
+        Adiciona um jogador controlado por um bot.
+
+        Segue as mesmas regras de `add_player`; o jogador
+        não tem socket.
+
+        Args:
+            player_name (str): Nome do jogador.
+            symbol (GameSymbols): Símbolo do jogador.
+            bot (BotPlayer): Bot que escolhe as jogadas.
+
+        Returns:
+            ValidationResult: O resultado de `add_player`.
+        """
         player_id = self.next_player_id
-        self.next_player_id += 1
-        self.players.append(
-            {
-                "id": player_id,
-                "name": player_name,
-                "symbol": symbol,
-                "client": client
-            }
+        result = self.add_player(player_name, symbol, None) # type: ignore
+        if was_successful(result):
+            if self.bots is None:
+                self.bots = {}
+            self.bots[player_id] = bot
+        return result
+
+    def play_bot_turn(self) -> Optional[ActionResponse]:
+        """
+        Faz a jogada do jogador atual, se ele for um bot.
+
+        Returns:
+            (ActionResponse | None): O resultado da jogada, ou None
+                se o jogo não está em andamento ou a vez não é
+                de um bot.
+        """
+        if self.status != GameStatus.ONGOING or self.game.current_player is None:
+            return None
+        if self.bots is None:
+            return None
+        bot = self.bots.get(self.get_current_player()) # type: ignore
+        if bot is None:
+            return None
+        slot = bot.choose_move(self.game.board, self.game.current_player)
+        return self.apply_action(
+            {"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}}
         )
-        return GameWarning.OK
+
+    def set_time_control(
+        self,
+        wheel: "TimerWheel",
+        move_time: float,
+        bank: Optional[float] = None
+        ) -> None:
+        """
+        Liga o relógio de jogo da sala.
+
+        O relógio do jogador da vez corre enquanto o jogo está
+        em andamento. Quando ele acaba, o jogador perde a partida
+        (veja `forfeit`).
+
+        Args:
+            wheel (TimerWheel): Roda onde os prazos são agendados.
+                Normalmente `get_timer_wheel()`.
+            move_time (float): Segundos por jogada.
+            bank (float | None): Segundos totais por jogador na
+                partida. Com None, só há o limite por jogada.
+        """
+        from src.managers.turn_clock import TurnClock # pylint: disable=import-outside-toplevel
+
+        if self.clock is not None:
+            self.clock.stop()
+        self.clock = TurnClock(self, wheel, move_time, bank)
+
+    def forfeit(self, player_id: PlayerId) -> ValidationResult:
+        """
+        Encerra a partida com a derrota de um jogador, por exemplo
+        quando o tempo dele acaba.
+
+        Args:
+            player_id (PlayerId): Id do jogador que perde.
+
+        Returns:
+            ValidationResult: Resultado da ação.
+                - GameError.GAME_NOT_STARTED: O jogo não
+                    está em andamento.
+                - GameError.NON_EXISTENT_PLAYER: O jogador
+                    não existe.
+                - GameWarning.OK: A partida foi encerrada.
+        """
+        with self.lock:
+            if self.status != GameStatus.ONGOING:
+                return GameError.GAME_NOT_STARTED
+            if self.get_player(player_id) is None:
+                return GameError.NON_EXISTENT_PLAYER
+            winner = next((p.id for p in self.players if p.id != player_id), None)
+            self._finish_game(winner)
+            if self.journal is not None:
+                self.journal.record_forfeit(self.room_id, player_id)
+            return GameWarning.OK
+
+    def publish_state(self) -> None:
+        """
+        Publica as mudanças feitas fora de `apply_action`, como o
+        fim da partida pelo relógio, a saída de um jogador ou o
+        começo pelo matchmaking. O delta (veja `state_delta`) leva
+        a nova versão aos `snapshots` e às conexões das `sessions`.
+        Salas sem `state_tracker` não são acompanhadas por ninguém e
+        ficam de fora. Deve ser chamado fora do `lock`.
+        """
+        if self.state_tracker is None:
+            return
+        sessions = self.sessions
+        if sessions is not None:
+            sessions.push_state(self)
+            return
+        with self.lock:
+            state_delta(self)
+
+    def recycle(self) -> bool:
+        """
+        Devolve a sala ao `pool` se a partida acabou ou todos
+        saíram (veja `RoomPool.release_if_idle`). Deve ser chamado
+        fora do `lock`, depois que a mudança chegou aos clients.
+
+        Returns:
+            bool: True se a sala foi devolvida e guardada.
+        """
+        pool = self.pool
+        return pool is not None and pool.release_if_idle(self)
 
     def apply_action(
         self,
         message: SystemMessage
-        ) -> SystemMessage:
+        ) -> ActionResponse:
         """
         Valida, processa e aplica as seguintes ações:
             - GameActions.MAKE_MOVEMENT.
             - GameActions.RESTART.
             - GameActions.EXIT.
             - GameActions.START.
+            - GameActions.HINT.
+
+        Mensagens malformadas (tipo desconhecido, payload ausente
+        ou com campos de tipo errado) recebem uma resposta de erro
+        sem passar pelo jogo. Veja `src/protocols/validation.py`.
+
+        A ação roda com `lock`, então não se mistura com um
+        `forfeit` disparado pelo relógio em outra thread.
 
         Args:
             message (SystemMessage): Requisição da ação.
                 Veja `/core/types.py` para ver o formato da mensagem.
 
         Returns:
-            SystemMessage: Mensagem com as informações do
-                resultado a aplicação e processamento.
-        """
-        t, pl = message["type"], message["payload"]
-        action = GameActions(t)
-        result = self._process_action(action, pl)
-        error = self._get_error_return(result)
-        payload: PayLoad = {
-            "success": error is None,
-            "action": action,
-            "error": error
-        }
-        return create_message(result, payload)
+            ActionResponse: Mensagem com as informações do
+                resultado a aplicação e processamento. A
+                mensagem é somente leitura e pode ser a mesma
+                entre chamadas (veja `_get_response`).
+        """
+        t, pl = message.get("type"), message.get("payload")
+        action = ACTIONS_BY_TYPE.get(t) if t.__hash__ is not None else None
+        if action is None:
+            return self._get_response(None, GameError.INVALID_ACTION, GameError.INVALID_ACTION)
+        invalid = validate_payload(action, pl)
+        if invalid is not None:
+            return self._get_response(action, invalid, invalid)
+        with self.lock:
+            # As mudanças feitas dentro da ação (como a troca de turno)
+            # são refeitas no replay, então só a ação vai para o journal.
+            journal, self.journal = self.journal, None
+            try:
+                result = self._process_action(action, pl)
+            finally:
+                self.journal = journal
+            error = self._get_error_return(result)
+            if error is None and journal is not None:
+                journal.record_action(self.room_id, action, pl)
+            if action == GameActions.HINT and error is None:
+                return create_message(result, {
+                    "success": True,
+                    "action": action,
+                    "error": None,
+                    "slot": self.last_hint
+                })
+            return self._get_response(action, result, error)
 
 #! ========= PROCESSING =========
 
@@ -245,21 +558,10 @@ class GameManager:
             SystemComunication: O resultado
                 do processo da ação.
         """
-        if action == GameActions.MAKE_MOVEMENT:
-            result = self._process_make_movement(payload)
-
-        elif action == GameActions.RESTART:
-            result = self._process_restart()
-
-        elif action == GameActions.EXIT:
-            result = self._process_exit()
-
-        elif action == GameActions.START:
-            result = self._process_start()
-
-        else:
+        handler = _ACTION_HANDLERS.get(action)
+        if handler is None:
             return GameError.INVALID_ACTION
-        return result
+        return handler(self, payload)
 
     def _process_start(self) -> SystemComunication:
         """
@@ -287,21 +589,60 @@ class GameManager:
         validation = self._validate_restart()
         if was_successful(validation):
             self.status = GameStatus.WAITING
+            self.winner = None
             self.game.reset()
+            self.moves.clear()
+            self.started_at = None
+            if self.clock is not None:
+                self.clock.stop()
         return validation
 
     def _process_exit(self) -> ServerWarning:
         """
         Processa a ação `exit`.
 
+        A ação não diz quem saiu, então uma partida em andamento
+        termina sem contar no `leaderboard`. A conexão do jogador
+        chama `forfeit` antes, e a saída conta como derrota dele.
+
         Returns:
             ServerWarning: Indica um aviso ao Server.
             - ServerWarning.DISCONNECT_CLIENT: Indica
                 que o player em questão, quer se desconectar.
         """
-        self.status = GameStatus.FINISHED
+        self._finish_game(self.winner, rated=False)
         return ServerWarning.DISCONNECT_CLIENT
 
+    def _process_hint(self) -> ValidationResult:
+        """
+        Processa a ação `hint`. A jogada sugerida fica em
+        `last_hint`.
+
+        Returns:
+            ValidationResult: Resultado do processamento.
+                - GameError.INVALID_ACTION: Indica que a variante
+                    do jogo não tem dicas.
+                - GameError.GAME_NOT_STARTED: Indica que ainda
+                    não há jogador da vez.
+                - GameError.GAME_ALREADY_FINISHED: Indica que a
+                    partida acabou.
+                - GameError.HINT_UNAVAILABLE: Indica que a posição
+                    não está no banco de posições e o solver não
+                    resolve o tamanho do tabuleiro (4x4 ou 5x5).
+                - GameWarning.OK: Indica sucesso do processamento.
+        """
+        if self.game.variant != GameVariant.CLASSIC:
+            return GameError.INVALID_ACTION
+        if self.status is GameStatus.FINISHED or self.winner is not None:
+            return GameError.GAME_ALREADY_FINISHED
+        if self.game.current_player is None:
+            return GameError.GAME_NOT_STARTED
+        size = board_size(len(self.game.board))
+        self.last_hint = get_hint_cache().get_hint(self.game.pack(), size)
+        if self.last_hint is None:
+            return GameError.HINT_UNAVAILABLE
+        return GameWarning.OK
+
     def _process_make_movement(
         self,
         payload: PayLoad
@@ -328,19 +669,59 @@ class GameManager:
             "slot",
             GameError.GAME_ACTION_ERROR
         )
-        if not isinstance(result, int):
+        if result is GameError.GAME_ACTION_ERROR:
             return result
+        if not isinstance(result, int):
+            return GameError.INVALID_PAYLOAD
 
         validation = self._validate_movement_action(result)
         if was_successful(validation):
             self.game.make_movement(result)
-            # winner = self.game.check_winner(with_symbols=True)
-            # if isinstance(winner, GameSymbols):
-            #     self.winner = winner
-            #     self.status = GameStatus.FINISHED
-            #     return GameWarning.WINNER_REACHED
+            self.moves.append(result)
+            self._process_movement_result()
         return validation
 
+    def _process_movement_result(self) -> None:
+        """
+        Verifica o fim da partida depois de uma jogada.
+
+        Com vitória ou empate o status vira `GameStatus.FINISHED`
+        (e `winner` recebe o id do vencedor); caso contrário a vez
+        passa para o próximo jogador.
+        """
+        try:
+            winner = self.game.check_winner(with_symbols=True)
+        except DrawError:
+            self._finish_game(None)
+            return
+        if isinstance(winner, GameSymbols):
+            self._finish_game(self.get_player_id(winner))
+        elif self.players:
+            self.switch_current_player()
+
+    def _finish_game(self, winner: Optional[PlayerId], rated: bool = True) -> None:
+        """
+        Encerra a partida e para o relógio. Se a partida estava em
+        andamento, ela é enviada ao `store` e ao `leaderboard`.
+
+        Args:
+            winner (PlayerId | None): O vencedor, ou None
+                com empate.
+            rated (bool): Se a partida conta no `leaderboard`.
+                Partidas abandonadas sem um perdedor não contam.
+        """
+        was_ongoing = self.status == GameStatus.ONGOING
+        self.winner = winner
+        self.status = GameStatus.FINISHED
+        if self.clock is not None:
+            self.clock.stop()
+        if was_ongoing:
+            self.finished_at = time()
+            if self.store is not None:
+                self.store.submit(self)
+            if rated and self.leaderboard is not None:
+                self.leaderboard.record_match(self)
+
 #! ========= VALIDATIONS =========
 
     def _validate_restart(self) -> ValidationResult:
@@ -375,7 +756,7 @@ class GameManager:
                 - GameWarning.OK: Indica que o símbolo está disponível
                     para uso.
         """
-        if any(player["symbol"] == symbol for player in self.players):
+        if any(player.symbol == symbol for player in self.players):
             return GameError.SYMBOL_ALREADY_SELECTED
         return GameWarning.OK
 
@@ -420,6 +801,7 @@ class GameManager:
                 - GameWarning.WINNER_REACHED
                 - GameError.INVALID_SLOT
                 - GameError.OCCUPIED_SLOT
+                - GameError.ILLEGAL_MOVEMENT
                 - GameWarning.OK
 
         **Note**
@@ -427,10 +809,12 @@ class GameManager:
         """
         if self.winner is not None: # Já tem um vencedor
             return GameWarning.WINNER_REACHED
-        if not 0 <= slot < len(self.game.board): # Slot fora do intervalo
+        if not self.game.is_valid_slot(slot): # Slot fora do intervalo
             return GameError.INVALID_SLOT
-        if self.game.board[slot] is not None: # Slot usado
+        if self.game.is_occupied(slot): # Slot usado
             return GameError.OCCUPIED_SLOT
+        if not self.game.is_playable(slot): # Proibido pela variante
+            return GameError.ILLEGAL_MOVEMENT
         return GameWarning.OK # Tudo certo
 
     def _validate_start_action(self) -> ValidationResult:
@@ -470,11 +854,16 @@ class GameManager:
                     não existe.
                 - GameWarning.OK: Sucesso na operação.
         """
-        player = self.get_player(player_id)
-        if player is not None:
-            self.game.set_current_player(player["symbol"])
-            return GameWarning.OK
-        return GameError.NON_EXISTENT_PLAYER
+        with self.lock:
+            player = self.get_player(player_id)
+            if player is not None:
+                self.game.set_current_player(player.symbol)
+                if self.journal is not None:
+                    self.journal.record_turn(self.room_id, player_id)
+                if self.clock is not None and self.status == GameStatus.ONGOING:
+                    self.clock.start_turn(player_id)
+                return GameWarning.OK
+            return GameError.NON_EXISTENT_PLAYER
 
 #! ========= PREDICATES =========
 
@@ -504,7 +893,7 @@ class GameManager:
             bool: True, caso o slot foi usado, False
                 caso contrário.
         """
-        return self.game.board[slot] is not None
+        return self.game.is_occupied(slot)
 
     def board_was_used(self) -> bool:
         """
@@ -548,7 +937,7 @@ class GameManager:
         """
         return next(
             (
-                player["id"] for player in self.players if player["symbol"] == symbol
+                player.id for player in self.players if player.symbol == symbol
             ), None
         )
 
@@ -566,7 +955,7 @@ class GameManager:
             return self.get_player_id(symbol)
         return None
 
-    def get_player(self, player_id: PlayerId) -> Optional[PlayerDict]:
+    def get_player(self, player_id: PlayerId) -> Optional[Player]:
         """
         Procura um player pelo id.
 
@@ -574,12 +963,12 @@ class GameManager:
             player_id (PlayerId): Id do player procurado.
 
         Returns:
-            (PlayerDict | None): As informações do player,
+            (Player | None): As informações do player,
                 ou None para nenhum player encontrado.
         """
         return next(
             (
-                player for player in self.players if player["id"] == player_id
+                player for player in self.players if player.id == player_id
             ), None
         )
 
@@ -599,9 +988,52 @@ class GameManager:
             (SystemComunication | None): O erro detectado, caso
                 contrário, None.
         """
-        safe_return = [
-            GameWarning.OK,
-            ServerWarning.GAME_READY_TO_START,
-            ServerWarning.DISCONNECT_CLIENT
-        ]
-        return value if value not in safe_return else None
+        return value if value not in SAFE_RESULTS else None
+
+    @staticmethod
+    def _get_response(
+        action: Optional[GameActions],
+        result: SystemComunication,
+        error: Optional[SystemComunication]
+        ) -> ActionResponse:
+        """
+        Pega a resposta de uma ação.
+
+        A resposta só depende da ação e do resultado, então cada
+        combinação é montada uma vez e reaproveitada. Ela é
+        somente leitura (`MappingProxyType`); quem precisar
+        acrescentar campos deve copiá-la.
+
+        Args:
+            action (GameActions | None): Ação processada, ou None
+                se o tipo da mensagem é desconhecido.
+            result (SystemComunication): Resultado da ação.
+            error (SystemComunication | None): O erro, se houve.
+
+        Returns:
+            ActionResponse: A resposta da ação.
+        """
+        key = (action, result)
+        response = _RESPONSES.get(key)
+        if response is None:
+            message = create_message(result, {
+                "success": error is None,
+                "action": action,
+                "error": error
+            })
+            response = MappingProxyType({
+                "type": message["type"],
+                "payload": MappingProxyType(message["payload"])
+            })
+            _RESPONSES[key] = response
+        return response
+
+
+# Ação -> processamento. Todos recebem a sala e o payload.
+_ACTION_HANDLERS: Dict[GameActions, Callable[[GameManager, PayLoad], SystemComunication]] = {
+    GameActions.MAKE_MOVEMENT: GameManager._process_make_movement, # pylint: disable=protected-access
+    GameActions.RESTART: lambda manager, _: manager._process_restart(), # pylint: disable=protected-access
+    GameActions.EXIT: lambda manager, _: manager._process_exit(), # pylint: disable=protected-access
+    GameActions.START: lambda manager, _: manager._process_start(), # pylint: disable=protected-access
+    GameActions.HINT: lambda manager, _: manager._process_hint(), # pylint: disable=protected-access
+}
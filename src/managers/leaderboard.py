@@ -0,0 +1,395 @@
+import json
+import os
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from src.core.config import (
+    LEADERBOARD_INITIAL_RATING,
+    LEADERBOARD_K_FACTOR,
+    LEADERBOARD_MAX_RATING,
+    LEADERBOARD_SAVE_INTERVAL
+)
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+    from src.utils.timer_wheel import Timer, TimerWheel
+
+LEADERBOARD_VERSION = 1
+
+
+class FenwickTree:
+    """
+    Árvore de Fenwick (Binary Indexed Tree) de contagens.
+
+    Guarda uma contagem por posição (0 a `size - 1`) e responde
+    somas de prefixo e a busca da k-ésima unidade em O(log n).
+
+    Attributes:
+        size (int): Quantidade de posições.
+    """
+    __slots__ = ("size", "_tree", "_top")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._tree = [0] * (size + 1)
+        self._top = 1 << size.bit_length()
+
+    def add(self, index: int, delta: int) -> None:
+        """
+        Soma `delta` à contagem da posição `index`.
+
+        Args:
+            index (int): Posição.
+            delta (int): Valor somado.
+        """
+        index += 1
+        tree, size = self._tree, self.size
+        while index <= size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix(self, index: int) -> int:
+        """
+        Soma das contagens das posições 0 até `index`, inclusive.
+
+        Args:
+            index (int): Última posição somada. Com -1, soma 0.
+
+        Returns:
+            int: A soma.
+        """
+        index = min(index + 1, self.size)
+        tree, total = self._tree, 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, k: int) -> int:
+        """
+        Acha a posição da k-ésima unidade, contando da posição 0.
+
+        Args:
+            k (int): Unidade procurada, começando em 1.
+
+        Returns:
+            int: A menor posição com `prefix(posição) >= k`.
+        """
+        tree, size = self._tree, self.size
+        position, step = 0, self._top
+        while step:
+            nxt = position + step
+            if nxt <= size and tree[nxt] < k:
+                position = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return position
+
+
+class PlayerStats: # pylint: disable=too-few-public-methods
+    """
+    Estatísticas de um jogador.
+
+    Attributes:
+        name (str): Nome do jogador.
+        rating (int): Rating Elo.
+        wins (int): Vitórias.
+        losses (int): Derrotas.
+        draws (int): Empates.
+        streak (int): Sequência atual. Positiva com vitórias
+            seguidas, negativa com derrotas e 0 após um empate.
+        best_streak (int): Maior sequência de vitórias.
+    """
+    __slots__ = ("name", "rating", "wins", "losses", "draws", "streak", "best_streak")
+
+    def __init__(self, name: str, rating: int = LEADERBOARD_INITIAL_RATING) -> None:
+        self.name = name
+        self.rating = rating
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.streak = 0
+        self.best_streak = 0
+
+    @property
+    def games(self) -> int:
+        """Partidas jogadas."""
+        return self.wins + self.losses + self.draws
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converte as estatísticas num dicionário.
+
+        Returns:
+            Dict[str, Any]: Os atributos e `games`.
+        """
+        data = {attr: getattr(self, attr) for attr in self.__slots__}
+        data["games"] = self.games
+        return data
+
+
+class Leaderboard:
+    """
+    Ranking dos jogadores, atualizado a cada partida terminada.
+
+    Os ratings são inteiros de 0 a `max_rating`; uma árvore de
+    Fenwick conta os jogadores por rating, então a posição de um
+    jogador e cada passo do top-K custam O(log `max_rating`), sem
+    reordenar nem reler o histórico de partidas.
+
+    Attributes:
+        k_factor (int): Fator K do Elo.
+        max_rating (int): Maior rating possível.
+        players (Dict[str, PlayerStats]): Jogadores pelo nome.
+        dirty (bool): Indica mudanças ainda não salvas.
+    """
+    def __init__(
+        self,
+        k_factor: int = LEADERBOARD_K_FACTOR,
+        max_rating: int = LEADERBOARD_MAX_RATING
+        ) -> None:
+        self.k_factor = k_factor
+        self.max_rating = max_rating
+        self.players: Dict[str, PlayerStats] = {}
+        self.dirty = False
+        self._counts = FenwickTree(max_rating + 1)
+        self._by_rating: Dict[int, Set[str]] = {}
+        self._save_timer: Optional["Timer"] = None
+        self._revision = 0
+        self._lock = Lock()
+        self._save_lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+#! ========= COMMANDS =========
+
+    def attach(self, manager: "GameManager") -> None:
+        """
+        Liga uma sala ao leaderboard. As partidas dela passam a
+        contar quando terminam.
+
+        Args:
+            manager (GameManager): Sala ligada.
+        """
+        manager.leaderboard = self
+
+    def record_match(self, manager: "GameManager") -> bool:
+        """
+        Conta a partida terminada de uma sala.
+
+        Args:
+            manager (GameManager): Sala com a partida terminada.
+
+        Returns:
+            bool: True se a partida foi contada. Só partidas com
+                dois jogadores contam.
+        """
+        if len(manager.players) != 2:
+            return False
+        first, second = manager.players
+        if manager.winner is None:
+            score = 0.5
+        else:
+            score = 1.0 if manager.winner == first.id else 0.0
+        self.record_result(first.name, second.name, score)
+        return True
+
+    def record_result(self, first: str, second: str, score: float) -> None:
+        """
+        Conta uma partida entre dois jogadores.
+
+        Args:
+            first (str): Nome de um jogador.
+            second (str): Nome do outro jogador.
+            score (float): Resultado de `first`: 1.0 com vitória,
+                0.5 com empate e 0.0 com derrota.
+        """
+        with self._lock:
+            a = self._get_or_create(first)
+            b = self._get_or_create(second)
+            expected = 1 / (1 + 10 ** ((b.rating - a.rating) / 400))
+            change = round(self.k_factor * (score - expected))
+            self._set_rating(a, a.rating + change)
+            self._set_rating(b, b.rating - change)
+            _count_result(a, score)
+            _count_result(b, 1.0 - score)
+            self._revision += 1
+            self.dirty = True
+
+    def save(self, path: str) -> bool:
+        """
+        Salva o leaderboard num arquivo JSON, trocando o
+        arquivo antigo de uma vez.
+
+        `dirty` só é limpo depois da troca e se nada mudou durante
+        a escrita; se ela falha, o próximo save tenta de novo.
+
+        Args:
+            path (str): Arquivo de destino.
+
+        Returns:
+            bool: True se algo mudou desde o último save.
+        """
+        with self._save_lock:
+            with self._lock:
+                if not self.dirty:
+                    return False
+                revision = self._revision
+                data = {
+                    "version": LEADERBOARD_VERSION,
+                    "players": [stats.to_dict() for stats in self.players.values()]
+                }
+            temp_path = path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+            with self._lock:
+                if self._revision == revision:
+                    self.dirty = False
+        return True
+
+    def schedule_saves(
+        self,
+        wheel: "TimerWheel",
+        path: str,
+        interval: float = LEADERBOARD_SAVE_INTERVAL
+        ) -> None:
+        """
+        Salva o leaderboard a cada `interval` segundos, se
+        ele mudou. Veja `save`.
+
+        Args:
+            wheel (TimerWheel): Roda que dispara os saves.
+            path (str): Arquivo de destino.
+            interval (float): Segundos entre os saves.
+        """
+        def tick() -> None:
+            try:
+                self.save(path)
+            finally:
+                self._save_timer = wheel.schedule(interval, tick)
+
+        if self._save_timer is not None:
+            wheel.cancel(self._save_timer)
+        self._save_timer = wheel.schedule(interval, tick)
+
+    @classmethod
+    def load(cls, path: str, **kwargs: Any) -> "Leaderboard":
+        """
+        Carrega um leaderboard salvo por `save`.
+
+        Args:
+            path (str): Arquivo salvo. Se não existe, o
+                leaderboard começa vazio.
+            **kwargs (Any): Argumentos de `Leaderboard`.
+
+        Returns:
+            Leaderboard: O leaderboard carregado.
+        """
+        leaderboard = cls(**kwargs)
+        if not os.path.exists(path):
+            return leaderboard
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        for record in data["players"]:
+            stats = PlayerStats(record["name"])
+            for attr in PlayerStats.__slots__[2:]:
+                setattr(stats, attr, record[attr])
+            leaderboard.players[stats.name] = stats
+            leaderboard._set_rating(stats, record["rating"], new=True)
+        return leaderboard
+
+#! ========= GETTERS =========
+
+    def get(self, name: str) -> Optional[PlayerStats]:
+        """
+        Pega as estatísticas de um jogador.
+
+        Args:
+            name (str): Nome do jogador.
+
+        Returns:
+            (PlayerStats | None): As estatísticas, ou None se
+                o jogador nunca terminou uma partida.
+        """
+        return self.players.get(name)
+
+    def rank(self, name: str) -> Optional[int]:
+        """
+        Pega a posição de um jogador. Jogadores com o mesmo
+        rating dividem a posição.
+
+        Args:
+            name (str): Nome do jogador.
+
+        Returns:
+            (int | None): A posição, começando em 1, ou None
+                se o jogador não está no leaderboard.
+        """
+        with self._lock:
+            stats = self.players.get(name)
+            if stats is None:
+                return None
+            return len(self.players) - self._counts.prefix(stats.rating) + 1
+
+    def top(self, k: int) -> List[Tuple[int, PlayerStats]]:
+        """
+        Pega os `k` primeiros jogadores.
+
+        Args:
+            k (int): Quantidade de jogadores.
+
+        Returns:
+            List[Tuple[int, PlayerStats]]: (posição, estatísticas)
+                do melhor para o pior. Empates são ordenados pelo nome.
+        """
+        result: List[Tuple[int, PlayerStats]] = []
+        with self._lock:
+            above = len(self.players)
+            while above > 0 and len(result) < k:
+                rating = self._counts.find(above)
+                names = self._by_rating[rating]
+                rank = len(self.players) - above + 1
+                for name in sorted(names)[:k - len(result)]:
+                    result.append((rank, self.players[name]))
+                above -= len(names)
+        return result
+
+#! ========= PROCESSING =========
+
+    def _get_or_create(self, name: str) -> PlayerStats:
+        """Pega ou cria um jogador. Deve ser chamado com o lock."""
+        stats = self.players.get(name)
+        if stats is None:
+            stats = self.players[name] = PlayerStats(name)
+            self._set_rating(stats, stats.rating, new=True)
+        return stats
+
+    def _set_rating(self, stats: PlayerStats, rating: int, new: bool = False) -> None:
+        """Muda o rating e os índices. Deve ser chamado com o lock."""
+        rating = min(max(rating, 0), self.max_rating)
+        if not new:
+            if rating == stats.rating:
+                return
+            self._counts.add(stats.rating, -1)
+            self._by_rating[stats.rating].discard(stats.name)
+            if not self._by_rating[stats.rating]:
+                del self._by_rating[stats.rating]
+        stats.rating = rating
+        self._counts.add(rating, 1)
+        self._by_rating.setdefault(rating, set()).add(stats.name)
+
+
+def _count_result(stats: PlayerStats, score: float) -> None:
+    if score == 1.0:
+        stats.wins += 1
+        stats.streak = max(stats.streak, 0) + 1
+        stats.best_streak = max(stats.best_streak, stats.streak)
+    elif score == 0.0:
+        stats.losses += 1
+        stats.streak = min(stats.streak, 0) - 1
+    else:
+        stats.draws += 1
+        stats.streak = 0
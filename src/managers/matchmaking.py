@@ -0,0 +1,204 @@
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Callable, Deque, Dict, Optional, Tuple
+from src.core.config import GameSymbols, GameVariant, MATCHMAKING_RATING_BUCKET
+from src.core.types import PlayerId, SocketConection
+from src.protocols.enums import GameActions, ServerWarning
+from src.managers.game_manager import GameManager
+from src.managers.room_pool import RoomPool
+from src.managers.room_registry import RoomRegistry
+from src.utils.metrics import LatencyStats
+
+QueueKey = Tuple[GameVariant, int, int]
+
+
+class MatchTicket: # pylint: disable=too-few-public-methods
+    """
+    Representa um jogador na fila de matchmaking.
+
+    Attributes:
+        name (str): Nome do jogador.
+        client (SocketConection | None): Socket do jogador.
+        rating (int): Rating usado na escolha da faixa.
+        enqueued_at (float): Momento da entrada na fila (`time.monotonic`).
+        room (GameManager | None): Sala da partida, quando pareado.
+        player_id (PlayerId | None): Id do jogador na sala.
+        cancelled (bool): Indica que o jogador saiu da fila.
+    """
+    __slots__ = (
+        "name", "client", "rating", "key", "enqueued_at",
+        "room", "player_id", "cancelled"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        client: Optional[SocketConection],
+        rating: int,
+        key: QueueKey
+        ) -> None:
+        self.name = name
+        self.client = client
+        self.rating = rating
+        self.key = key
+        self.enqueued_at = monotonic()
+        self.room: Optional[GameManager] = None
+        self.player_id: Optional[PlayerId] = None
+        self.cancelled = False
+
+
+class Matchmaker:
+    """
+    Pareia jogadores em espera e cria as salas das partidas.
+
+    Cada fila é uma `deque` por (variante, lado do tabuleiro, faixa
+    de rating), então entrar, sair e parear são O(1): um jogador é
+    pareado com o mais antigo da sua faixa ou, se ela estiver vazia,
+    das faixas vizinhas. Quem sai da fila é só marcado e descartado
+    quando chega na frente.
+
+    Attributes:
+        pool (RoomPool): De onde as salas são tiradas.
+        rating_bucket (int): Largura das faixas de rating. Com 0,
+            o rating é ignorado.
+        on_match (Callable | None): Chamado com a sala e os dois
+            tickets a cada pareamento.
+        registry (RoomRegistry | None): Onde as salas criadas
+            são registradas.
+        time_to_match (LatencyStats): Tempo de espera de cada
+            jogador pareado.
+        matches (int): Partidas criadas.
+    """
+    def __init__(
+        self,
+        pool: Optional[RoomPool] = None,
+        rating_bucket: int = MATCHMAKING_RATING_BUCKET,
+        on_match: Optional[Callable[[GameManager, MatchTicket, MatchTicket], None]] = None,
+        registry: Optional[RoomRegistry] = None
+        ) -> None:
+        self.pool = pool if pool is not None else RoomPool()
+        self.rating_bucket = rating_bucket
+        self.on_match = on_match
+        self.registry = registry
+        self.time_to_match = LatencyStats()
+        self.matches = 0
+        self._queues: Dict[QueueKey, Deque[MatchTicket]] = {}
+        self._waiting = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._waiting
+
+#! ========= COMMANDS =========
+
+    def join(
+        self,
+        name: str,
+        client: Optional[SocketConection] = None,
+        rating: int = 0,
+        variant: GameVariant = GameVariant.CLASSIC,
+        board_size: int = 3
+        ) -> MatchTicket:
+        """
+        Coloca um jogador na fila, pareando-o se houver alguém
+        esperando.
+
+        Args:
+            name (str): Nome do jogador.
+            client (SocketConection | None): Socket do jogador.
+            rating (int): Rating do jogador.
+            variant (GameVariant): Variante desejada.
+            board_size (int): Lado do tabuleiro clássico.
+
+        Returns:
+            MatchTicket: O ticket do jogador. Se houve pareamento,
+                `ticket.room` já é a sala da partida.
+        """
+        if variant == GameVariant.ULTIMATE:
+            board_size = 9
+        bucket = rating // self.rating_bucket if self.rating_bucket else 0
+        ticket = MatchTicket(name, client, rating, (variant, board_size, bucket))
+        with self._lock:
+            opponent = self._pop_opponent(ticket.key)
+            if opponent is None:
+                self._queues.setdefault(ticket.key, deque()).append(ticket)
+                self._waiting += 1
+                return ticket
+        room = self.pool.acquire(ticket.key[1], variant)
+        self._create_match(room, opponent, ticket)
+        return ticket
+
+    def cancel(self, ticket: MatchTicket) -> bool:
+        """
+        Tira um jogador da fila.
+
+        Args:
+            ticket (MatchTicket): Ticket do jogador.
+
+        Returns:
+            bool: True se o jogador ainda estava esperando.
+        """
+        with self._lock:
+            if ticket.cancelled or ticket.room is not None:
+                return False
+            ticket.cancelled = True
+            self._waiting -= 1
+            return True
+
+#! ========= PROCESSING =========
+
+    def _pop_opponent(self, key: QueueKey) -> Optional[MatchTicket]:
+        """
+        Tira da fila o adversário mais antigo da faixa ou das
+        vizinhas. Deve ser chamado com o lock.
+
+        Args:
+            key (QueueKey): Fila do jogador que chegou.
+
+        Returns:
+            (MatchTicket | None): O adversário, ou None se não há.
+        """
+        variant, board_size, bucket = key
+        for candidate in (bucket, bucket - 1, bucket + 1):
+            queue = self._queues.get((variant, board_size, candidate))
+            while queue:
+                opponent = queue.popleft()
+                if not opponent.cancelled:
+                    self._waiting -= 1
+                    return opponent
+        return None
+
+    def _create_match(
+        self,
+        room: GameManager,
+        first: MatchTicket,
+        second: MatchTicket
+        ) -> None:
+        """
+        Coloca os jogadores na sala e começa a partida.
+
+        O jogador que esperava fica com `GameSymbols.CIRCLE`.
+
+        Args:
+            room (GameManager): Sala vazia tirada do pool.
+            first (MatchTicket): Jogador que estava na fila.
+            second (MatchTicket): Jogador que acabou de chegar.
+        """
+        if self.registry is not None:
+            self.registry.register(room)
+        now = monotonic()
+        for ticket, symbol in ((first, GameSymbols.CIRCLE), (second, GameSymbols.CROSS)):
+            ticket.player_id = room.next_player_id
+            room.add_player(ticket.name, symbol, ticket.client) # type: ignore
+            ticket.room = room
+            self.time_to_match.record(now - ticket.enqueued_at)
+
+        result = room.apply_action({"type": GameActions.START, "payload": {}})
+        if result["type"] == ServerWarning.GAME_READY_TO_START.value:
+            room.start_game()
+            room.switch_current_player()
+        room.publish_state()
+        self.matches += 1
+        if self.on_match is not None:
+            self.on_match(room, first, second)
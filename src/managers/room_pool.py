@@ -0,0 +1,178 @@
+from threading import Lock
+from typing import Dict, List, Set, Tuple
+from src.core.config import GameVariant, ROOM_POOL_HIGH_WATER
+from src.protocols.enums import GameStatus
+from src.managers.game_manager import GameManager
+
+RoomKind = Tuple[GameVariant, int]
+
+
+class RoomPool:
+    """
+    Pool de salas (`GameManager` + jogo) reaproveitadas entre partidas.
+
+    Em vez de criar uma sala por partida, as salas devolvidas são
+    resetadas no lugar e guardadas até `high_water` por tipo de
+    jogo (variante e lado do tabuleiro). Isso achata a taxa de
+    alocação e as pausas do GC nos picos de matchmaking.
+
+    As salas entregues guardam o pool em `GameManager.pool` e voltam
+    sozinhas quando ficam ociosas (veja `GameManager.recycle`). Uma
+    sala já livre (ou sendo devolvida) não é aceita de novo, então
+    ela nunca fica duas vezes na lista de livres.
+
+    Attributes:
+        high_water (int): Máximo de salas livres por tipo de jogo.
+            As devolvidas além disso são descartadas.
+        created (int): Salas criadas pelo pool.
+        reused (int): Salas entregues a partir do pool.
+        dropped (int): Salas devolvidas e descartadas.
+    """
+    def __init__(self, high_water: int = ROOM_POOL_HIGH_WATER) -> None:
+        self.high_water = high_water
+        self.created = 0
+        self.reused = 0
+        self.dropped = 0
+        self._free: Dict[RoomKind, List[GameManager]] = {}
+        self._idle: Set[GameManager] = set() # Livres ou sendo devolvidas
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return sum(len(rooms) for rooms in self._free.values())
+
+#! ========= COMMANDS =========
+
+    def acquire(
+        self,
+        board_size: int = 3,
+        variant: GameVariant = GameVariant.CLASSIC
+        ) -> GameManager:
+        """
+        Pega uma sala vazia, reaproveitando uma do pool se houver.
+
+        Args:
+            board_size (int): Lado do tabuleiro clássico.
+            variant (GameVariant): Variante do jogo.
+
+        Returns:
+            GameManager: Uma sala em `GameStatus.WAITING`, sem jogadores.
+        """
+        with self._lock:
+            rooms = self._free.get(self._kind(board_size, variant))
+            if rooms:
+                self.reused += 1
+                manager = rooms.pop()
+                self._idle.discard(manager)
+            else:
+                self.created += 1
+                manager = GameManager(board_size, variant)
+            manager.pool = self
+        return manager
+
+    def release(self, manager: GameManager) -> bool:
+        """
+        Devolve uma sala ao pool.
+
+        A sala é desligada do journal, do registry e dos
+        snapshots, tem o relógio parado e é resetada no lugar,
+        mesmo quando é descartada.
+
+        Args:
+            manager (GameManager): Sala devolvida. Não deve mais
+                ser usada por quem a devolveu.
+
+        Returns:
+            bool: True se a sala foi guardada, False se foi
+                descartada por passar do `high_water`, já estava
+                livre ou é de outro pool.
+        """
+        with self._lock:
+            if manager in self._idle or manager.pool not in (None, self):
+                return False
+            self._idle.add(manager)
+            manager.pool = None
+        if manager.journal is not None:
+            manager.journal.detach(manager.room_id)
+        if manager.registry is not None:
+            manager.registry.unregister(manager)
+        if manager.snapshots is not None:
+            manager.snapshots.detach(manager)
+        # Mesmo uma sala descartada é resetada: o timer do relógio
+        # não pode disparar depois e mexer numa sala fora de uso.
+        with manager.lock:
+            manager.reset_all()
+            manager.room_id = 0
+            manager.last_hint = None
+            manager.clock = None
+            manager.state_tracker = None
+            manager.store = None
+            manager.leaderboard = None
+            manager.sessions = None
+        kind = self._kind(manager.game.size, manager.game.variant)
+        with self._lock:
+            rooms = self._free.setdefault(kind, [])
+            if len(rooms) >= self.high_water:
+                self.dropped += 1
+                self._idle.discard(manager)
+                return False
+            rooms.append(manager)
+            return True
+
+    def release_if_idle(self, manager: GameManager) -> bool:
+        """
+        Devolve uma sala se a partida acabou ou todos saíram.
+
+        Args:
+            manager (GameManager): Sala verificada.
+
+        Returns:
+            bool: True se a sala foi devolvida e guardada.
+        """
+        if manager.players and manager.status != GameStatus.FINISHED:
+            return False
+        return self.release(manager)
+
+    def prefill(
+        self,
+        count: int,
+        board_size: int = 3,
+        variant: GameVariant = GameVariant.CLASSIC
+        ) -> None:
+        """
+        Cria salas antecipadamente, até o `high_water`.
+
+        Args:
+            count (int): Quantidade de salas.
+            board_size (int): Lado do tabuleiro clássico.
+            variant (GameVariant): Variante do jogo.
+        """
+        with self._lock:
+            rooms = self._free.setdefault(self._kind(board_size, variant), [])
+            for _ in range(min(count, self.high_water - len(rooms))):
+                self.created += 1
+                manager = GameManager(board_size, variant)
+                self._idle.add(manager)
+                rooms.append(manager)
+
+#! ========= GETTERS =========
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Pega os contadores do pool.
+
+        Returns:
+            Dict[str, int]: created, reused, dropped e free.
+        """
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "dropped": self.dropped,
+            "free": len(self)
+        }
+
+    @staticmethod
+    def _kind(board_size: int, variant: GameVariant) -> RoomKind:
+        # O Ultimate tem sempre o mesmo tamanho
+        if variant == GameVariant.ULTIMATE:
+            return variant, 9
+        return variant, board_size
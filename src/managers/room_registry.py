@@ -0,0 +1,214 @@
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from src.protocols.enums import GameStatus
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+
+# Jogadores por sala. Veja `GameManager.add_player`.
+SEATS = 2
+
+IndexKey = Tuple[GameStatus, int]
+
+
+class RoomRegistry:
+    """
+    Salas ativas do servidor, com índices por status e vagas livres.
+
+    A sala avisa o registry quando o `status` ou os jogadores mudam
+    (veja `GameManager.status`), e ele só move a sala entre dois
+    conjuntos. Assim as consultas, como "salas em `WAITING` com uma
+    vaga" ou "quantas estão em `ONGOING`", não percorrem as salas.
+
+    Attributes:
+        rooms (Dict[int, GameManager]): Salas pelo `room_id`.
+        next_room_id (int): Id da próxima sala registrada.
+    """
+    def __init__(self) -> None:
+        self.rooms: Dict[int, "GameManager"] = {}
+        self.next_room_id = 1
+        self._keys: Dict[int, IndexKey] = {}
+        self._index: Dict[IndexKey, Set[int]] = {}
+        self._by_status: Dict[GameStatus, Set[int]] = {status: set() for status in GameStatus}
+        self._by_seats: Dict[int, Set[int]] = {seats: set() for seats in range(SEATS + 1)}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.rooms)
+
+    def __contains__(self, manager: "GameManager") -> bool:
+        return self.rooms.get(manager.room_id) is manager
+
+#! ========= COMMANDS =========
+
+    def register(self, manager: "GameManager") -> int:
+        """
+        Registra uma sala e passa a acompanhar as mudanças dela.
+
+        Uma sala sem `room_id` (0) recebe o próximo id livre.
+
+        Args:
+            manager (GameManager): Sala registrada.
+
+        Returns:
+            int: O `room_id` da sala.
+
+        Raises:
+            ValueError: Se outra sala já tem o mesmo `room_id`.
+        """
+        with self._lock:
+            if not manager.room_id:
+                while self.next_room_id in self.rooms:
+                    self.next_room_id += 1
+                manager.room_id = self.next_room_id
+                self.next_room_id += 1
+            room_id = manager.room_id
+            if self.rooms.get(room_id, manager) is not manager:
+                raise ValueError(f"Já existe uma sala com o id {room_id}.")
+            self.rooms[room_id] = manager
+            manager.registry = self
+            self._move(room_id, self._key(manager))
+            return room_id
+
+    def unregister(self, manager: "GameManager") -> bool:
+        """
+        Tira uma sala do registry.
+
+        Args:
+            manager (GameManager): Sala removida.
+
+        Returns:
+            bool: True se a sala estava registrada.
+        """
+        with self._lock:
+            room_id = manager.room_id
+            if self.rooms.get(room_id) is not manager:
+                return False
+            del self.rooms[room_id]
+            self._move(room_id, None)
+            manager.registry = None
+            return True
+
+    def update(self, manager: "GameManager") -> None:
+        """
+        Reindexa uma sala. Chamado pela própria sala quando o
+        status ou os jogadores mudam.
+
+        Args:
+            manager (GameManager): Sala alterada.
+        """
+        with self._lock:
+            key = self._key(manager)
+            room_id = manager.room_id
+            if self._keys.get(room_id) != key and self.rooms.get(room_id) is manager:
+                self._move(room_id, key)
+
+#! ========= GETTERS =========
+
+    def find(
+        self,
+        status: Optional[GameStatus] = None,
+        free_seats: Optional[int] = None,
+        limit: Optional[int] = None
+        ) -> List["GameManager"]:
+        """
+        Pega as salas com um status e/ou quantidade de vagas livres.
+
+        Args:
+            status (GameStatus | None): Status procurado. Com None,
+                qualquer status.
+            free_seats (int | None): Vagas livres procuradas. Com
+                None, qualquer quantidade.
+            limit (int | None): Máximo de salas retornadas.
+
+        Returns:
+            List[GameManager]: As salas, ordenadas pelo `room_id`.
+        """
+        with self._lock:
+            ids = self._ids(status, free_seats)
+            rooms = [self.rooms[room_id] for room_id in sorted(ids)[:limit]]
+        return rooms
+
+    def first(
+        self,
+        status: GameStatus,
+        free_seats: Optional[int] = None
+        ) -> Optional["GameManager"]:
+        """
+        Pega uma sala qualquer com um status e vagas livres, sem
+        ordenar. Útil para o matchmaking achar uma sala aberta.
+
+        Args:
+            status (GameStatus): Status procurado.
+            free_seats (int | None): Vagas livres procuradas.
+
+        Returns:
+            (GameManager | None): Uma sala, ou None se não há.
+        """
+        with self._lock:
+            for room_id in self._ids(status, free_seats):
+                return self.rooms[room_id]
+        return None
+
+    def count(
+        self,
+        status: Optional[GameStatus] = None,
+        free_seats: Optional[int] = None
+        ) -> int:
+        """
+        Conta as salas com um status e/ou vagas livres.
+
+        Args:
+            status (GameStatus | None): Status contado.
+            free_seats (int | None): Vagas livres contadas.
+
+        Returns:
+            int: Quantidade de salas.
+        """
+        with self._lock:
+            return len(self._ids(status, free_seats))
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Pega a quantidade de salas por status, para o admin.
+
+        Returns:
+            Dict[str, int]: `GameStatus.value` -> salas, mais
+                "total" e "open_seats" (vagas livres somadas).
+        """
+        with self._lock:
+            summary = {status.value: len(ids) for status, ids in self._by_status.items()}
+            summary["total"] = len(self.rooms)
+            summary["open_seats"] = sum(
+                seats * len(ids) for seats, ids in self._by_seats.items()
+            )
+        return summary
+
+#! ========= PROCESSING =========
+
+    def _ids(self, status: Optional[GameStatus], free_seats: Optional[int]) -> Set[int]:
+        """Conjunto de ids do índice certo. Deve ser chamado com o lock."""
+        if status is None and free_seats is None:
+            return set(self.rooms)
+        if status is None:
+            return self._by_seats.get(free_seats, set()) # type: ignore
+        if free_seats is None:
+            return self._by_status[status]
+        return self._index.get((status, free_seats), set())
+
+    def _move(self, room_id: int, key: Optional[IndexKey]) -> None:
+        """Move a sala para o índice de `key`. Deve ser chamado com o lock."""
+        old = self._keys.pop(room_id, None)
+        if old is not None:
+            self._index[old].discard(room_id)
+            self._by_status[old[0]].discard(room_id)
+            self._by_seats[old[1]].discard(room_id)
+        if key is not None:
+            self._keys[room_id] = key
+            self._index.setdefault(key, set()).add(room_id)
+            self._by_status[key[0]].add(room_id)
+            self._by_seats[key[1]].add(room_id)
+
+    @staticmethod
+    def _key(manager: "GameManager") -> IndexKey:
+        return manager.status, max(SEATS - len(manager.players), 0)
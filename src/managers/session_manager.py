@@ -0,0 +1,337 @@
+from collections import deque
+from itertools import islice
+from secrets import token_urlsafe
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from src.core.config import ACTION_LOG_SIZE, GameSymbols, SESSION_GRACE_PERIOD
+from src.core.types import PlayerId, SocketConection, SystemMessage, ValidationResult
+from src.protocols.errors import GameError
+from src.protocols.state_sync import push_frame, state_delta
+from src.managers.game_manager import GameManager
+from src.utils.timer_wheel import Timer, TimerWheel, get_timer_wheel
+from src.utils.validation_utils import was_successful
+
+
+class ActionLog:
+    """
+    Últimas mensagens de uma sala, numeradas em sequência.
+
+    Guarda no máximo `max_size` mensagens, então um client que
+    ficou fora por pouco tempo recebe só o que perdeu.
+
+    Attributes:
+        seq (int): Número da última mensagem registrada.
+    """
+    __slots__ = ("seq", "_entries")
+
+    def __init__(self, max_size: int = ACTION_LOG_SIZE) -> None:
+        self.seq = 0
+        self._entries: Deque[Tuple[int, SystemMessage]] = deque(maxlen=max_size)
+
+    def append(self, message: SystemMessage) -> int:
+        """
+        Registra uma mensagem.
+
+        Args:
+            message (SystemMessage): Mensagem registrada.
+
+        Returns:
+            int: O número da mensagem.
+        """
+        self.seq += 1
+        self._entries.append((self.seq, message))
+        return self.seq
+
+    def since(self, seq: int) -> Optional[List[SystemMessage]]:
+        """
+        Pega as mensagens posteriores a `seq`.
+
+        Args:
+            seq (int): Última mensagem que o client recebeu.
+
+        Returns:
+            (List[SystemMessage] | None): As mensagens em ordem, ou
+                None se o log não as tem mais (ou `seq` é inválido).
+        """
+        if seq > self.seq or seq < 0:
+            return None
+        if seq == self.seq:
+            return []
+        if not self._entries or self._entries[0][0] > seq + 1:
+            return None
+        start = seq + 1 - self._entries[0][0]
+        return [message for _, message in islice(self._entries, start, None)]
+
+
+class Session: # pylint: disable=too-few-public-methods
+    """
+    Vaga de um jogador numa sala, mantida entre conexões.
+
+    Attributes:
+        token (str): Token entregue ao client no `join`.
+        room (GameManager): Sala do jogador.
+        player_id (PlayerId): Id do jogador na sala.
+        owner (Any | None): Conexão atual do jogador, ou None
+            enquanto ele está desconectado.
+        expiry (Timer | None): Prazo para o jogador voltar.
+    """
+    __slots__ = ("token", "room", "player_id", "owner", "expiry")
+
+    def __init__(self, token: str, room: GameManager, player_id: PlayerId, owner: Any) -> None:
+        self.token = token
+        self.room = room
+        self.player_id = player_id
+        self.owner = owner
+        self.expiry: Optional[Timer] = None
+
+
+class SessionManager:
+    """
+    Emite tokens de sessão e segura a vaga de jogadores
+    desconectados durante `grace_period`.
+
+    Cada sala tem um `ActionLog`: ao reconectar, o client manda
+    o número da última mensagem que recebeu e recebe só as que
+    perdeu. Os prazos ficam na `TimerWheel` compartilhada.
+
+    Quem precisa da trava de uma sala (`GameManager.lock`) e da
+    `_lock` pega a da sala primeiro, como as ações da sala.
+
+    Attributes:
+        grace_period (float): Segundos que uma vaga fica reservada
+            depois da desconexão.
+        wheel (TimerWheel): Roda onde os prazos são agendados.
+        expired (int): Sessões encerradas por fim do prazo.
+    """
+    def __init__(
+        self,
+        grace_period: float = SESSION_GRACE_PERIOD,
+        wheel: Optional[TimerWheel] = None,
+        log_size: int = ACTION_LOG_SIZE
+        ) -> None:
+        self.grace_period = grace_period
+        self.wheel = wheel if wheel is not None else get_timer_wheel()
+        self.log_size = log_size
+        self.expired = 0
+        self._sessions: Dict[str, Session] = {}
+        self._logs: Dict[GameManager, ActionLog] = {}
+        self._members: Dict[GameManager, List[Session]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+#! ========= COMMANDS =========
+
+    def open(
+        self,
+        room: GameManager,
+        player_name: str,
+        symbol: GameSymbols,
+        client: SocketConection,
+        owner: Any
+        ) -> Tuple[ValidationResult, Optional[Session]]:
+        """
+        Coloca um jogador na sala e abre a sessão dele.
+
+        Args:
+            room (GameManager): Sala do jogador.
+            player_name (str): Nome do jogador.
+            symbol (GameSymbols): Símbolo do jogador.
+            client (SocketConection): Socket do jogador.
+            owner (Any): Conexão do jogador.
+
+        Returns:
+            Tuple[ValidationResult, Session | None]: O resultado
+                de `GameManager.add_player` e a sessão, se deu certo.
+        """
+        with room.lock, self._lock:
+            player_id = room.next_player_id
+            result = room.add_player(player_name, symbol, client)
+            if not was_successful(result):
+                return result, None
+            session = Session(token_urlsafe(16), room, player_id, owner)
+            room.sessions = self
+            self._sessions[session.token] = session
+            self._logs.setdefault(room, ActionLog(self.log_size))
+            self._members.setdefault(room, []).append(session)
+            return result, session
+
+    def record(self, room: GameManager, message: SystemMessage) -> int:
+        """
+        Registra uma mensagem no log da sala.
+
+        Args:
+            room (GameManager): Sala da mensagem.
+            message (SystemMessage): Mensagem enviada aos clients.
+
+        Returns:
+            int: O número da mensagem, ou 0 se a sala não tem sessões.
+        """
+        with self._lock:
+            log = self._logs.get(room)
+            return log.append(message) if log is not None else 0
+
+    def peers(self, room: GameManager, exclude: Any = None) -> List[Any]:
+        """
+        Pega as conexões ligadas às sessões de uma sala.
+
+        Args:
+            room (GameManager): Sala procurada.
+            exclude (Any): Conexão deixada de fora (quem agiu).
+
+        Returns:
+            List[Any]: As conexões atuais, sem as sessões suspensas.
+        """
+        with self._lock:
+            return [
+                session.owner for session in self._members.get(room, ())
+                if session.owner is not None and session.owner is not exclude
+            ]
+
+    def broadcast(self, room: GameManager, data: bytes, exclude: Any = None) -> None:
+        """
+        Envia um frame às conexões de uma sala (veja `peers`). Deve
+        ser chamado fora da trava da sala, para um socket lento não
+        travar as ações dela.
+
+        Args:
+            room (GameManager): Sala dos destinatários.
+            data (bytes): Frame enviado.
+            exclude (Any): Conexão deixada de fora.
+        """
+        for peer in self.peers(room, exclude):
+            try:
+                peer.send(data)
+            except OSError:
+                # A conexão caiu; o `run` dela libera a sessão.
+                pass
+
+    def push_state(self, room: GameManager, exclude: Any = None) -> None:
+        """
+        Envia às conexões da sala as mudanças feitas fora de uma
+        ação (entrada e saída de jogadores, fim pelo relógio), para
+        nenhuma versão ficar sem delta. O delta entra no log da sala,
+        então quem estava desconectado o recebe no `resume`. Deve ser
+        chamado fora da trava da sala (veja `GameManager.publish_state`).
+
+        Args:
+            room (GameManager): Sala alterada.
+            exclude (Any): Conexão deixada de fora (quem causou a mudança).
+        """
+        with room.lock:
+            delta = state_delta(room)
+            if delta is None:
+                return
+            seq = self.record(room, delta)
+        self.broadcast(room, push_frame(delta, seq), exclude)
+
+    def last_seq(self, room: GameManager) -> int:
+        """Número da última mensagem registrada na sala."""
+        log = self._logs.get(room)
+        return log.seq if log is not None else 0
+
+    def suspend(self, session: Session, owner: Any) -> None:
+        """
+        Marca o jogador como desconectado e começa o prazo
+        para ele voltar.
+
+        Args:
+            session (Session): Sessão do jogador.
+            owner (Any): Conexão que caiu. Se a sessão já foi
+                retomada por outra conexão, nada muda.
+        """
+        with self._lock:
+            if session.owner is not owner:
+                return
+            session.owner = None
+            if session.token in self._sessions:
+                session.expiry = self.wheel.schedule(
+                    self.grace_period, self._expire, session.token
+                )
+
+    def resume(
+        self,
+        token: str,
+        seq: int,
+        owner: Any
+        ) -> Tuple[Optional[Session], Optional[List[SystemMessage]]]:
+        """
+        Religa um jogador à sua sessão.
+
+        Args:
+            token (str): Token da sessão.
+            seq (int): Última mensagem que o client recebeu.
+            owner (Any): Nova conexão do jogador.
+
+        Returns:
+            Tuple[Session | None, List[SystemMessage] | None]: A
+                sessão (None se o token é inválido ou expirou) e
+                as mensagens perdidas (None se o log não as tem
+                mais e o client precisa do estado completo).
+        """
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None, None
+            if session.expiry is not None:
+                self.wheel.cancel(session.expiry)
+                session.expiry = None
+            previous, session.owner = session.owner, owner
+            missed = self._logs[session.room].since(seq)
+        if previous is not None and previous is not owner:
+            previous.close()
+        return session, missed
+
+    def close(self, session: Session) -> ValidationResult:
+        """
+        Encerra uma sessão e tira o jogador da sala.
+
+        Args:
+            session (Session): Sessão encerrada.
+
+        Returns:
+            ValidationResult: O resultado de `GameManager.remove_player`,
+                ou `GameError.INVALID_SESSION` se ela já tinha acabado.
+        """
+        room = session.room
+        with room.lock, self._lock:
+            if session.token not in self._sessions:
+                return GameError.INVALID_SESSION
+            result = self._remove(session)
+        room.publish_state()
+        room.recycle()
+        return result
+
+#! ========= PROCESSING =========
+
+    def _remove(self, session: Session) -> ValidationResult:
+        """
+        Apaga a sessão e tira o jogador da sala. Deve ser chamado
+        com a trava da sala e a `_lock`.
+        """
+        del self._sessions[session.token]
+        if session.expiry is not None:
+            self.wheel.cancel(session.expiry)
+        room = session.room
+        self._members[room].remove(session)
+        if not self._members[room]:
+            del self._members[room]
+            del self._logs[room]
+            room.sessions = None
+        return room.remove_player(session.player_id)
+
+    def _expire(self, token: str) -> None:
+        # Roda na thread da roda; o jogador pode ter voltado até pegar as travas
+        with self._lock:
+            session = self._sessions.get(token)
+        if session is None:
+            return
+        room = session.room
+        with room.lock, self._lock:
+            if self._sessions.get(token) is not session or session.owner is not None:
+                return
+            self._remove(session)
+            self.expired += 1
+        room.publish_state()
+        room.recycle()
@@ -0,0 +1,113 @@
+from typing import Dict, Optional, TYPE_CHECKING
+from src.core.types import PlayerId
+from src.utils.timer_wheel import Timer, TimerWheel
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+
+
+class TurnClock:
+    """
+    Relógio de jogo de uma sala.
+
+    Cada jogada tem um prazo de `move_time` segundos e, com `bank`,
+    cada jogador tem também um tempo total para a partida. Só existe
+    um temporizador pendente por sala, agendado na `TimerWheel`
+    compartilhada; quando ele vence, o jogador da vez perde a partida
+    (veja `GameManager.forfeit`).
+
+    Attributes:
+        manager (GameManager): Sala do relógio.
+        wheel (TimerWheel): Roda onde os prazos são agendados.
+        move_time (float): Segundos por jogada.
+        bank (float | None): Segundos totais por jogador, ou None
+            sem limite total.
+        remaining (Dict[PlayerId, float]): Tempo total restante
+            de cada jogador. Só usado com `bank`.
+        player_id (PlayerId | None): Jogador com o relógio correndo.
+    """
+    __slots__ = (
+        "manager", "wheel", "move_time", "bank", "remaining",
+        "player_id", "_turn_started", "_timer"
+    )
+
+    def __init__(
+        self,
+        manager: "GameManager",
+        wheel: TimerWheel,
+        move_time: float,
+        bank: Optional[float] = None
+        ) -> None:
+        self.manager = manager
+        self.wheel = wheel
+        self.move_time = move_time
+        self.bank = bank
+        self.remaining: Dict[PlayerId, float] = {}
+        self.player_id: Optional[PlayerId] = None
+        self._turn_started = 0.0
+        self._timer: Optional[Timer] = None
+
+#! ========= COMMANDS =========
+
+    def start_turn(self, player_id: PlayerId) -> None:
+        """
+        Para o relógio do jogador anterior e começa o de `player_id`.
+
+        Args:
+            player_id (PlayerId): Jogador da vez.
+        """
+        self.stop()
+        limit = self.move_time
+        if self.bank is not None:
+            limit = min(limit, self.remaining.setdefault(player_id, self.bank))
+        self.player_id = player_id
+        self._turn_started = self.wheel.clock()
+        self._timer = self.wheel.schedule(limit, self._on_timeout, player_id)
+
+    def stop(self) -> None:
+        """Para o relógio, descontando o tempo gasto do jogador da vez."""
+        if self._timer is not None:
+            self.wheel.cancel(self._timer)
+            self._timer = None
+        if self.player_id is not None and self.bank is not None:
+            spent = self.wheel.clock() - self._turn_started
+            left = self.remaining.get(self.player_id, self.bank)
+            self.remaining[self.player_id] = max(0.0, left - spent)
+        self.player_id = None
+
+    def reset(self) -> None:
+        """Para o relógio e devolve o tempo total dos jogadores."""
+        self.stop()
+        self.remaining.clear()
+
+#! ========= GETTERS =========
+
+    def time_left(self, player_id: PlayerId) -> float:
+        """
+        Pega o tempo que um jogador ainda tem na jogada atual.
+
+        Args:
+            player_id (PlayerId): Id do jogador.
+
+        Returns:
+            float: Segundos restantes. Se não for a vez do jogador,
+                o tempo que ele terá na próxima jogada.
+        """
+        limit = self.move_time
+        if self.bank is not None:
+            limit = min(limit, self.remaining.get(player_id, self.bank))
+        if player_id != self.player_id:
+            return limit
+        return max(0.0, limit - (self.wheel.clock() - self._turn_started))
+
+#! ========= PROCESSING =========
+
+    def _on_timeout(self, player_id: PlayerId) -> None:
+        # Roda na thread da roda; a vez pode ter mudado até pegar o lock
+        with self.manager.lock:
+            if player_id != self.player_id:
+                return
+            self._timer = None
+            self.manager.forfeit(player_id)
+        self.manager.publish_state()
+        self.manager.recycle()
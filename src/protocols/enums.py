@@ -8,11 +8,28 @@ class GameActions(Enum):
     - EXIT: Indica a saída de um player
     - START: Indica o ínicio de uma partida.
     - RESTART: Indica um reset da partida em andamento.
+    - HINT: Pede a melhor jogada para o tabuleiro atual.
     """
     MAKE_MOVEMENT = 'make_movement'
     EXIT = 'exit'
     START = 'start'
     RESTART = 'restart'
+    HINT = 'hint'
+
+class ConnectionActions(Enum):
+    """
+    Enum que contém as ações da conexão. Elas são tratadas
+    pelo `ConnectionHandler` e não chegam ao jogo.
+
+    - HEARTBEAT: Indica que o client continua conectado.
+    - JOIN: Entra numa sala e abre uma sessão.
+    - RESUME: Retoma uma sessão depois de uma reconexão.
+    - SYNC: Pede o estado da sala a partir de uma versão.
+    """
+    HEARTBEAT = 'heartbeat'
+    JOIN = 'join'
+    RESUME = 'resume'
+    SYNC = 'sync'
 
 class ServerWarning(Enum):
     """
@@ -21,10 +38,22 @@ class ServerWarning(Enum):
     - OK: Indica que nada de errado ocorreu
     - DISCONNECT_CLIENT: Indica que um client deve ser desconectado.
     - GAME_READY_TO_START: Indica que o jogo já pode começar.
+    - HEARTBEAT_ACK: Resposta a um `ConnectionActions.HEARTBEAT`.
+    - SESSION_OPENED: O jogador entrou na sala. O payload
+        traz o token da sessão.
+    - SESSION_RESUMED: A sessão foi retomada. O payload traz
+        as mensagens perdidas.
+    - STATE_DELTA: Mudanças no estado da sala desde a versão `base`.
+    - STATE_SNAPSHOT: Estado completo da sala.
     """
     OK = 'ok'
     DISCONNECT_CLIENT = 'disconnect_client'
     GAME_READY_TO_START = 'game_ready_to_start'
+    HEARTBEAT_ACK = 'heartbeat_ack'
+    SESSION_OPENED = 'session_opened'
+    SESSION_RESUMED = 'session_resumed'
+    STATE_DELTA = 'state_delta'
+    STATE_SNAPSHOT = 'state_snapshot'
 
 class GameWarning(Enum):
     """
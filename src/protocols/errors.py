@@ -17,8 +17,14 @@ class GameError(Enum):
     - INVALID_SLOT: Um slot inválido no tabuleiro do jogo.
     - FULL_PARTY: O jogo já está cheio de jogadores.
     - OCCUPIED_SLOT: Um slot selecionado já foi usado.
+    - ILLEGAL_MOVEMENT: Um slot livre que as regras da variante
+        não permitem jogar agora.
     - SAME_PLAYER: Um player em questão, é o do turno atual.
     - GAME_ACTION_ERROR: Um erro gerado por algum ação no jogo.
+    - RATE_LIMITED: O client mandou mensagens rápido demais.
+    - INVALID_SESSION: Um token de sessão inválido ou expirado.
+    - HINT_UNAVAILABLE: A posição não tem dica conhecida, como um
+        tabuleiro 4x4 ou 5x5 fora do banco de posições.
     - ERROR: Indica um erro genérico ou não identificado.
     """
     INVALID_PAYLOAD = 'invalid_payload'
@@ -34,6 +40,10 @@ class GameError(Enum):
     FULL_PARTY = 'full_party'
     INSUFFICIENT_PLAYERS = 'insufficient_playes'
     OCCUPIED_SLOT = 'occupied_slot'
+    ILLEGAL_MOVEMENT = 'illegal_movement'
     SAME_PLAYER = 'same_player'
     GAME_ACTION_ERROR = 'game_action_error'
+    RATE_LIMITED = 'rate_limited'
+    INVALID_SESSION = 'invalid_session'
+    HINT_UNAVAILABLE = 'hint_unavailable'
     ERROR = 'error'
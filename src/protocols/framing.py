@@ -0,0 +1,108 @@
+import struct
+from typing import List, Optional
+from src.core.config import MAX_FRAME_SIZE
+from src.core.types import SocketConection
+
+# Cada mensagem vai num frame: tamanho (u32, big-endian) | mensagem.
+# Sem isso um `recv` pode trazer meia mensagem ou várias juntas.
+FRAME_HEADER = struct.Struct("!I")
+
+
+class FrameError(ValueError):
+    """Frame maior que `MAX_FRAME_SIZE`."""
+
+
+def frame(data: bytes) -> bytes:
+    """
+    Coloca uma mensagem serializada num frame.
+
+    Args:
+        data (bytes): Mensagem serializada.
+
+    Returns:
+        bytes: O frame, pronto para o `sendall`.
+    """
+    return FRAME_HEADER.pack(len(data)) + data
+
+
+class FrameDecoder:
+    """
+    Junta os bytes recebidos e separa os frames completos.
+
+    Attributes:
+        max_size (int): Tamanho máximo de uma mensagem.
+    """
+    __slots__ = ("max_size", "_buffer")
+
+    def __init__(self, max_size: int = MAX_FRAME_SIZE) -> None:
+        self.max_size = max_size
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Recebe mais bytes da conexão.
+
+        Args:
+            data (bytes): Bytes recebidos.
+
+        Returns:
+            List[bytes]: As mensagens completas, em ordem. O
+                que sobrar fica guardado para o próximo `feed`.
+
+        Raises:
+            FrameError: Se um frame passa de `max_size`.
+        """
+        buffer = self._buffer
+        buffer += data
+        messages = []
+        offset = 0
+        header_size = FRAME_HEADER.size
+        while len(buffer) - offset >= header_size:
+            (size,) = FRAME_HEADER.unpack_from(buffer, offset)
+            if size > self.max_size:
+                raise FrameError(f"Frame de {size} bytes passa do limite de {self.max_size}.")
+            end = offset + header_size + size
+            if end > len(buffer):
+                break
+            messages.append(bytes(buffer[offset + header_size:end]))
+            offset = end
+        if offset:
+            del buffer[:offset]
+        return messages
+
+
+def recv_frame(sock: SocketConection, max_size: int = MAX_FRAME_SIZE) -> Optional[bytes]:
+    """
+    Lê exatamente um frame de um socket, bloqueando.
+
+    Para conexões com várias mensagens seguidas, prefira um
+    `FrameDecoder`, que não faz um `recv` por pedaço.
+
+    Args:
+        sock (SocketConection): Socket lido.
+        max_size (int): Tamanho máximo da mensagem.
+
+    Returns:
+        (bytes | None): A mensagem, ou None se a conexão
+            fechou antes de um frame completo.
+
+    Raises:
+        FrameError: Se o frame passa de `max_size`.
+    """
+    header = _recv_exactly(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > max_size:
+        raise FrameError(f"Frame de {size} bytes passa do limite de {max_size}.")
+    return _recv_exactly(sock, size)
+
+
+def _recv_exactly(sock: SocketConection, size: int) -> Optional[bytes]:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
@@ -1,18 +1,34 @@
+from collections.abc import Mapping
+from enum import Enum
 from json import dumps, loads
-from src.core.types import SystemMessage
+from typing import Any
+from src.core.types import ActionResponse, SystemMessage
 
-def serialize(message: SystemMessage) -> bytes:
+
+def _encode(value: Any) -> Any:
+    """
+    Converte os Enums do payload para o seu valor e as
+    mensagens somente leitura (`MappingProxyType`) para dict.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} não é serializável.")
+
+def serialize(message: ActionResponse) -> bytes:
     """
     Serializa uma mensagem do sistema e converte
     para bytes.
 
     Args:
-        message (SystemMessage): Mensagem do sistema.
+        message (ActionResponse): Mensagem do sistema, como
+            uma `SystemMessage` ou uma resposta somente leitura.
 
     Returns:
         bytes: A mensagem serializada em bytes.
     """
-    data = dumps(message)
+    data = dumps(message, default=_encode)
     return data.encode()
 
 def deserialize(message: bytes) -> SystemMessage:
@@ -0,0 +1,230 @@
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple, TYPE_CHECKING
+from src.core.config import STATE_HISTORY_SIZE
+from src.core.types import PlayerId, SystemMessage
+from src.protocols.enums import ServerWarning
+from src.protocols.framing import frame
+from src.protocols.message_protocol import create_message
+from src.protocols.serialize import serialize
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+
+StateChanges = Dict[str, Any]
+PlayerRecord = Tuple[PlayerId, str, str]
+
+
+class StateTracker:
+    """
+    Último estado publicado de uma sala, usado para calcular deltas.
+
+    O tabuleiro é comparado pelo código empacotado (`pack()`), então
+    achar as casas alteradas custa O(casas alteradas).
+
+    Attributes:
+        cells (int): Quantidade de casas do tabuleiro.
+        code (int): Código das casas no último estado publicado.
+        current_player (PlayerId | None): Jogador da vez publicado.
+        status (GameStatus): Status publicado.
+        winner (PlayerId | None): Vencedor publicado.
+        players (Tuple[PlayerRecord, ...]): Jogadores publicados.
+        history (Deque[Tuple[int, StateChanges]]): Últimos deltas,
+            pela versão, para clients que ficaram um pouco para trás.
+    """
+    __slots__ = ("cells", "code", "current_player", "status", "winner", "players", "history")
+
+    def __init__(self, manager: "GameManager") -> None:
+        self.cells = manager.game.size ** 2
+        self.code = _board_code(manager, self.cells)
+        self.current_player = manager.get_current_player()
+        self.status = manager.status
+        self.winner = manager.winner
+        self.players = _player_records(manager)
+        self.history: Deque[Tuple[int, StateChanges]] = deque(maxlen=STATE_HISTORY_SIZE)
+
+    def diff(self, manager: "GameManager") -> StateChanges:
+        """
+        Compara a sala com o último estado publicado e o atualiza.
+
+        Args:
+            manager (GameManager): Sala comparada.
+
+        Returns:
+            StateChanges: Só os campos alterados. `slots` é uma lista
+                de [casa, valor], com valor 0, 1 ou None.
+        """
+        changes: StateChanges = {}
+        cells = self.cells
+        code = _board_code(manager, cells)
+        changed = code ^ self.code
+        if changed:
+            slots: Dict[int, Optional[int]] = {}
+            while changed:
+                low = changed & -changed
+                changed ^= low
+                slot = (low.bit_length() - 1) % cells
+                slots[slot] = _cell(code, slot, cells)
+            changes["slots"] = [[slot, value] for slot, value in slots.items()]
+            self.code = code
+
+        current_player = manager.get_current_player()
+        if current_player != self.current_player:
+            changes["current_player"] = self.current_player = current_player
+        if manager.status != self.status:
+            self.status = manager.status
+            changes["status"] = manager.status.value
+        if manager.winner != self.winner:
+            changes["winner"] = self.winner = manager.winner
+        players = _player_records(manager)
+        if players != self.players:
+            self.players = players
+            changes["players"] = [list(player) for player in players]
+        return changes
+
+
+def track(manager: "GameManager") -> StateTracker:
+    """
+    Pega o `StateTracker` de uma sala, criando-o se preciso.
+
+    Args:
+        manager (GameManager): Sala acompanhada.
+
+    Returns:
+        StateTracker: O tracker da sala.
+    """
+    if manager.state_tracker is None:
+        manager.state_tracker = StateTracker(manager)
+    return manager.state_tracker
+
+
+def state_delta(manager: "GameManager") -> Optional[SystemMessage]:
+    """
+    Publica as mudanças da sala desde a última versão.
+
+    Se algo mudou, `manager.version` é incrementado e a nova versão
+    vai para o `manager.snapshots`, se houver.
+
+    Args:
+        manager (GameManager): Sala publicada.
+
+    Returns:
+        (SystemMessage | None): `ServerWarning.STATE_DELTA` com a nova
+            `version` e as mudanças em `state`, ou None se nada mudou.
+    """
+    tracker = track(manager)
+    changes = tracker.diff(manager)
+    if not changes:
+        return None
+    manager.version += 1
+    tracker.history.append((manager.version, changes))
+    if manager.snapshots is not None:
+        manager.snapshots.publish(manager)
+    return create_message(ServerWarning.STATE_DELTA, {
+        "version": manager.version,
+        "base": manager.version - 1,
+        "state": changes
+    })
+
+
+def push_frame(delta: SystemMessage, seq: int) -> bytes:
+    """
+    Monta o frame de um delta enviado sem pedido às conexões da sala.
+
+    Args:
+        delta (SystemMessage): Resultado de `state_delta`; `base`
+            e `version` seguem os dele.
+        seq (int): Número da mensagem no log da sala (veja
+            `SessionManager.record`). É o que separa o push da
+            resposta do `sync` no client.
+
+    Returns:
+        bytes: O `STATE_DELTA` serializado e em frame.
+    """
+    return frame(serialize(create_message(ServerWarning.STATE_DELTA, {**delta["payload"], "seq": seq})))
+
+
+def state_snapshot(manager: "GameManager") -> SystemMessage:
+    """
+    Monta o estado completo da sala, para o `join` ou quando o
+    client perdeu versões demais.
+
+    Args:
+        manager (GameManager): Sala publicada.
+
+    Returns:
+        SystemMessage: `ServerWarning.STATE_SNAPSHOT` com a `version`
+            atual e o estado completo em `state`.
+    """
+    state_delta(manager)
+    return create_message(ServerWarning.STATE_SNAPSHOT, {
+        "version": manager.version,
+        "state": {
+            "variant": manager.game.variant.value,
+            "size": manager.game.size,
+            "board": list(manager.game.board),
+            "current_player": manager.get_current_player(),
+            "status": manager.status.value,
+            "winner": manager.winner,
+            "players": [list(player) for player in _player_records(manager)]
+        }
+    })
+
+
+def state_since(manager: "GameManager", version: int) -> SystemMessage:
+    """
+    Monta o que um client na versão `version` precisa para ficar
+    em dia: os deltas juntados, se ainda estão no histórico, ou
+    um snapshot.
+
+    Args:
+        manager (GameManager): Sala publicada.
+        version (int): Versão que o client tem.
+
+    Returns:
+        SystemMessage: Um `STATE_DELTA` com `base` igual a `version`
+            ou um `STATE_SNAPSHOT`.
+    """
+    state_delta(manager)
+    history = track(manager).history
+    if version == manager.version:
+        changes: StateChanges = {}
+    elif 0 <= version < manager.version and history and history[0][0] <= version + 1:
+        changes = _merge(changes for v, changes in history if v > version)
+    else:
+        return state_snapshot(manager)
+    return create_message(ServerWarning.STATE_DELTA, {
+        "version": manager.version,
+        "base": version,
+        "state": changes
+    })
+
+
+def _merge(deltas: Iterable[StateChanges]) -> StateChanges:
+    merged: StateChanges = {}
+    slots: Dict[int, Optional[int]] = {}
+    for changes in deltas:
+        for key, value in changes.items():
+            if key == "slots":
+                slots.update((slot, cell) for slot, cell in value)
+            else:
+                merged[key] = value
+    if slots:
+        merged["slots"] = [[slot, value] for slot, value in slots.items()]
+    return merged
+
+
+def _board_code(manager: "GameManager", cells: int) -> int:
+    # Só as casas; os bits acima são o jogador da vez
+    return manager.game.pack() & ((1 << 2 * cells) - 1)
+
+
+def _cell(code: int, slot: int, cells: int) -> Optional[int]:
+    if code >> slot & 1:
+        return 0
+    if code >> (slot + cells) & 1:
+        return 1
+    return None
+
+
+def _player_records(manager: "GameManager") -> Tuple[PlayerRecord, ...]:
+    return tuple((p.id, p.name, p.symbol.value) for p in manager.players)
@@ -0,0 +1,152 @@
+from enum import Enum
+from types import NoneType
+from typing import (
+    Any, Callable, Dict, Literal, Mapping,
+    Optional, Tuple, Union, get_args, get_origin, get_type_hints
+)
+from src.core.types import PayLoad
+from src.protocols.enums import ConnectionActions, GameActions
+from src.protocols.errors import GameError
+
+PayloadValidator = Callable[[Mapping[str, Any]], Optional[GameError]]
+
+# Campos obrigatórios do payload de cada tipo de mensagem.
+# Os tipos dos campos vêm das anotações de `PayLoad`.
+REQUIRED_FIELDS: Dict[Enum, Tuple[str, ...]] = {
+    GameActions.MAKE_MOVEMENT: ("slot",),
+    GameActions.EXIT: (),
+    GameActions.START: (),
+    GameActions.RESTART: (),
+    GameActions.HINT: (),
+    ConnectionActions.HEARTBEAT: (),
+    ConnectionActions.JOIN: ("name", "symbol"),
+    ConnectionActions.RESUME: ("token", "seq"),
+    ConnectionActions.SYNC: ("version",),
+}
+
+_MISSING = object()
+
+
+def runtime_types(hint: Any) -> Tuple[type, ...]:
+    """
+    Converte uma anotação de tipo nos tipos usados no `isinstance`.
+
+    Args:
+        hint (Any): Anotação, como `int`, `Optional[str]`
+            ou `List[SystemMessage]`.
+
+    Returns:
+        Tuple[type, ...]: Tipos aceitos em tempo de execução.
+    """
+    origin = get_origin(hint)
+    if hint is Any:
+        return (object,)
+    if hint is None or hint is NoneType:
+        return (NoneType,)
+    if origin is Union:
+        types: Tuple[type, ...] = ()
+        for arg in get_args(hint):
+            types += runtime_types(arg)
+        return types
+    if origin is Literal:
+        return tuple({type(value) for value in get_args(hint)})
+    if origin is not None:
+        return (origin,)
+    return (hint,)
+
+
+def compile_validator(
+    fields: Tuple[str, ...],
+    hints: Dict[str, Any]
+    ) -> PayloadValidator:
+    """
+    Gera o validador de um payload.
+
+    As checagens são calculadas uma vez; validar um payload é
+    só um `get` e um `isinstance` por campo, sem exceções.
+
+    Args:
+        fields (Tuple[str, ...]): Campos obrigatórios.
+        hints (Dict[str, Any]): Anotações dos campos.
+
+    Returns:
+        PayloadValidator: Recebe o payload e retorna
+            `GameError.INVALID_PAYLOAD` ou None se ele é válido.
+    """
+    checks = []
+    for field in fields:
+        types = runtime_types(hints[field])
+        # bool é subclasse de int, mas True não é um slot
+        rejects_bool = int in types and bool not in types
+        checks.append((field, types, rejects_bool))
+    compiled = tuple(checks)
+
+    def validate(payload: Mapping[str, Any]) -> Optional[GameError]:
+        for field, types, rejects_bool in compiled:
+            value = payload.get(field, _MISSING)
+            if not isinstance(value, types) or (rejects_bool and isinstance(value, bool)):
+                return GameError.INVALID_PAYLOAD
+        return None
+
+    return validate
+
+
+def _build_validators() -> Dict[Any, PayloadValidator]:
+    hints = get_type_hints(PayLoad)
+    validators: Dict[Any, PayloadValidator] = {}
+    for message_type, fields in REQUIRED_FIELDS.items():
+        validator = compile_validator(fields, hints)
+        validators[message_type] = validator
+        validators[message_type.value] = validator
+    return validators
+
+
+# Tipo da mensagem (Enum ou valor) -> validador do payload
+VALIDATORS = _build_validators()
+
+
+def validate_message(message: Any) -> Optional[GameError]:
+    """
+    Valida o formato de uma mensagem recebida (`SystemMessage`).
+
+    Args:
+        message (Any): Mensagem desserializada.
+
+    Returns:
+        (GameError | None): O erro, ou None se a mensagem é válida.
+            - GameError.INVALID_COMMAND: Não é um objeto com `type`.
+            - GameError.INVALID_ACTION: Tipo desconhecido.
+            - GameError.INVALID_PAYLOAD: Payload ausente ou com
+                campos faltando ou de tipo errado.
+    """
+    if not isinstance(message, Mapping):
+        return GameError.INVALID_COMMAND
+    message_type = message.get("type", _MISSING)
+    if message_type is _MISSING:
+        return GameError.INVALID_COMMAND
+    validator = VALIDATORS.get(message_type) if message_type.__hash__ is not None else None
+    if validator is None:
+        return GameError.INVALID_ACTION
+    payload = message.get("payload", _MISSING)
+    if not isinstance(payload, Mapping):
+        return GameError.INVALID_PAYLOAD
+    return validator(payload)
+
+
+def validate_payload(
+    message_type: Enum,
+    payload: Any
+    ) -> Optional[GameError]:
+    """
+    Valida só o payload, para quem já sabe o tipo da mensagem.
+
+    Args:
+        message_type (Enum): Tipo da mensagem.
+        payload (Any): Payload recebido.
+
+    Returns:
+        (GameError | None): `GameError.INVALID_PAYLOAD` ou None.
+    """
+    if not isinstance(payload, Mapping):
+        return GameError.INVALID_PAYLOAD
+    return VALIDATORS[message_type](payload)
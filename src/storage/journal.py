@@ -0,0 +1,732 @@
+import os
+import struct
+import zlib
+from enum import Enum
+from threading import RLock
+from time import monotonic
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple, Type, TypeVar, TYPE_CHECKING
+from src.core.config import (
+    GameSymbols,
+    GameVariant,
+    GAME_REPR_SYMBOLS,
+    JOURNAL_SHARDS,
+    JOURNAL_GROUP_COMMIT_SIZE,
+    JOURNAL_GROUP_COMMIT_INTERVAL,
+    JOURNAL_SNAPSHOT_INTERVAL
+)
+from src.core.bitboard import board_size
+from src.core.player import Player
+from src.core.types import PayLoad, PlayerId
+from src.protocols.enums import GameActions, GameStatus
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+    from src.utils.timer_wheel import Timer, TimerWheel
+
+E = TypeVar("E", bound=Enum)
+
+# Formato de um registro do journal (little-endian):
+#   crc32 (u32) | seq (u64) | room_id (u32) | kind (u8) | tamanho (u8) | corpo
+# O crc cobre tudo após ele mesmo, assim um registro cortado por um
+# crash no meio da escrita é detectado e descartado na recuperação.
+RECORD_HEADER = struct.Struct("<IQIBB")
+RECORD_CRC = struct.Struct("<I")
+RECORD_TAIL = struct.Struct("<QIBB")
+ACTION_BODY = struct.Struct("<BH") # ação | casa (NO_SLOT sem casa)
+JOIN_BODY = struct.Struct("<IB")
+PLAYER_BODY = struct.Struct("<I")
+CREATE_BODY = struct.Struct("<BB")
+
+# Formato do snapshot:
+#   magic | versão (u16) | seq do início (u64) | maior seq (u64) | quantidade de salas (u32)
+# Seguido de cada sala no formato `ROOM_STATE` + tabuleiro + jogadores.
+# As salas são empacotadas uma de cada vez, então cada uma guarda o
+# seq do shard no momento em que foi lida: os registros dela até esse
+# seq já estão no estado. O seq do início vale para as salas que não
+# estão no snapshot, e o maior seq é o último já usado no shard.
+SNAPSHOT_MAGIC = b"TTTS"
+SNAPSHOT_VERSION = 3
+SNAPSHOT_HEADER = struct.Struct("<4sHQQI")
+ROOM_STATE = struct.Struct("<IQBBbbbiIBH")
+SNAPSHOT_PLAYER = struct.Struct("<IBB")
+
+KIND_ACTION = 0
+KIND_JOIN = 1
+KIND_LEAVE = 2
+KIND_TURN = 3
+KIND_BEGIN = 4
+KIND_RESET = 5
+KIND_CREATE = 6
+KIND_FORFEIT = 7
+
+MAX_NAME_BYTES = 255 - JOIN_BODY.size
+NO_SLOT = 0xFFFF
+
+
+def _code_table(enum: Type[E], codes: Mapping[E, int]) -> Tuple[Mapping[E, int], Mapping[int, E]]:
+    """
+    Congela uma tabela de códigos gravados em disco.
+
+    Args:
+        enum (Type[Enum]): Enum codificado.
+        codes (Mapping[Enum, int]): Código de cada membro.
+
+    Returns:
+        Tuple[Mapping, Mapping]: A tabela e a inversa, somente leitura.
+
+    Raises:
+        ValueError: Se falta um membro ou um código se repete.
+    """
+    missing = set(enum) - set(codes)
+    if missing or len(set(codes.values())) != len(codes):
+        raise ValueError(f"Tabela de códigos de {enum.__name__} inválida: {missing or 'código repetido'}.")
+    return MappingProxyType(dict(codes)), MappingProxyType({code: member for member, code in codes.items()})
+
+
+def _encode_name(name: str) -> bytes:
+    """
+    Codifica um nome em UTF-8 com no máximo `MAX_NAME_BYTES` bytes,
+    sem partir um caractere no corte.
+    """
+    return name.encode()[:MAX_NAME_BYTES].decode("utf-8", "ignore").encode()
+
+
+# Os códigos ficam nos arquivos, então são fixos: reordenar os Enums
+# não muda nada, e um membro novo precisa de um código novo aqui.
+ACTION_CODES, ACTIONS_BY_CODE = _code_table(GameActions, {
+    GameActions.MAKE_MOVEMENT: 0,
+    GameActions.EXIT: 1,
+    GameActions.START: 2,
+    GameActions.RESTART: 3,
+    GameActions.HINT: 4,
+})
+READ_ONLY_ACTIONS = frozenset({GameActions.HINT})
+STATUS_CODES, STATUS_BY_CODE = _code_table(GameStatus, {
+    GameStatus.READY_TO_START: 0,
+    GameStatus.WAITING: 1,
+    GameStatus.ONGOING: 2,
+    GameStatus.FINISHED: 3,
+})
+VARIANT_CODES, VARIANTS_BY_CODE = _code_table(GameVariant, {
+    GameVariant.CLASSIC: 0,
+    GameVariant.ULTIMATE: 1,
+})
+SYMBOLS_BY_CODE = {value: symbol for symbol, value in GAME_REPR_SYMBOLS.items()}
+
+JournalRecord = Tuple[int, int, int, bytes]
+
+
+class MatchJournal:
+    """
+    Journal binário append-only das salas, dividido em shards.
+
+    Cada ação aceita por `GameManager.apply_action` (e as mudanças
+    de estado feitas fora dele, como entrada de jogadores e troca
+    de turno) vira um registro compacto no shard `room_id % shards`.
+    Os registros são acumulados e gravados com um único fsync por
+    grupo (group commit). Um shard que fica calado é sincronizado
+    pela roda de temporizadores (veja `schedule_syncs`). A cada
+    `snapshot_interval` registros de um shard, o estado de todas as
+    suas salas é salvo num snapshot e o journal do shard é truncado,
+    mantendo o tempo de recuperação e a amplificação de escrita
+    limitados. O snapshot não roda na thread da sala que passou do
+    limite: ele fica pendente até a roda (ou o `close`) chamar
+    `take_due_snapshots`.
+
+    Attributes:
+        directory (str): Diretório dos arquivos do journal.
+        shards (int): Quantidade de shards.
+        group_commit_size (int): Registros pendentes que
+            forçam um fsync.
+        group_commit_interval (float): Tempo máximo, em
+            segundos, que um registro pode esperar o fsync.
+        snapshot_interval (int): Registros de um shard entre
+            dois snapshots.
+        rooms (Dict[int, GameManager]): Salas registradas no journal.
+    """
+    def __init__(
+        self,
+        directory: str,
+        shards: int = JOURNAL_SHARDS,
+        group_commit_size: int = JOURNAL_GROUP_COMMIT_SIZE,
+        group_commit_interval: float = JOURNAL_GROUP_COMMIT_INTERVAL,
+        snapshot_interval: int = JOURNAL_SNAPSHOT_INTERVAL
+        ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.shards = shards
+        self.group_commit_size = group_commit_size
+        self.group_commit_interval = group_commit_interval
+        self.snapshot_interval = snapshot_interval
+        self.rooms: Dict[int, "GameManager"] = {}
+        self._files = [open(self.journal_path(i), "ab") for i in range(shards)]
+        self._pending: List[bytearray] = [bytearray() for _ in range(shards)]
+        self._pending_count = [0] * shards
+        self._last_sync = [monotonic()] * shards
+        self._since_snapshot = [0] * shards
+        self._seq = [self._read_last_seq(i) for i in range(shards)]
+        self._snapshot_due: Set[int] = set()
+        # `_append` roda nas threads das salas e `sync` também na roda.
+        # Quem precisa das duas travas pega a da sala (`GameManager.lock`)
+        # antes desta.
+        self._lock = RLock()
+        self._sync_timer: Optional["Timer"] = None
+        self._wheel: Optional["TimerWheel"] = None
+
+#! ========= COMMANDS =========
+
+    def attach(
+        self,
+        manager: "GameManager",
+        room_id: int,
+        record: bool = True
+        ) -> None:
+        """
+        Registra uma sala no journal.
+
+        Args:
+            manager (GameManager): Sala que será registrada.
+            room_id (int): Id da sala.
+            record (bool): Indica se a criação da sala deve ser
+                registrada. Por padrão é True.
+        """
+        with self._lock:
+            manager.room_id = room_id
+            manager.journal = self
+            self.rooms[room_id] = manager
+            if record:
+                body = CREATE_BODY.pack(manager.game.size, VARIANT_CODES[manager.game.variant])
+                self._append(room_id, KIND_CREATE, body)
+
+    def detach(self, room_id: int) -> None:
+        """
+        Remove uma sala do journal. Ela deixa de aparecer
+        nos próximos snapshots.
+
+        Args:
+            room_id (int): Id da sala.
+        """
+        with self._lock:
+            manager = self.rooms.pop(room_id, None)
+            if manager is not None:
+                manager.journal = None
+
+    def record_action(
+        self,
+        room_id: int,
+        action: GameActions,
+        payload: PayLoad
+        ) -> None:
+        """
+        Registra uma ação aceita pelo `GameManager`.
+
+        Args:
+            room_id (int): Id da sala.
+            action (GameActions): Ação aplicada.
+            payload (PayLoad): Informação útil da ação.
+        """
+        if action in READ_ONLY_ACTIONS:
+            return
+        slot = payload.get("slot", NO_SLOT)
+        body = ACTION_BODY.pack(ACTION_CODES[action], slot)
+        self._append(room_id, KIND_ACTION, body)
+
+    def record_join(
+        self,
+        room_id: int,
+        player_id: PlayerId,
+        name: str,
+        symbol: GameSymbols
+        ) -> None:
+        """
+        Registra a entrada de um jogador.
+
+        Args:
+            room_id (int): Id da sala.
+            player_id (PlayerId): Id do jogador.
+            name (str): Nome do jogador.
+            symbol (GameSymbols): Símbolo do jogador.
+        """
+        encoded_name = _encode_name(name)
+        body = JOIN_BODY.pack(player_id, GAME_REPR_SYMBOLS[symbol]) + encoded_name
+        self._append(room_id, KIND_JOIN, body)
+
+    def record_leave(self, room_id: int, player_id: PlayerId) -> None:
+        """
+        Registra a saída de um jogador.
+
+        Args:
+            room_id (int): Id da sala.
+            player_id (PlayerId): Id do jogador.
+        """
+        self._append(room_id, KIND_LEAVE, PLAYER_BODY.pack(player_id))
+
+    def record_turn(self, room_id: int, player_id: PlayerId) -> None:
+        """
+        Registra a troca do jogador atual.
+
+        Args:
+            room_id (int): Id da sala.
+            player_id (PlayerId): Id do novo jogador atual.
+        """
+        self._append(room_id, KIND_TURN, PLAYER_BODY.pack(player_id))
+
+    def record_forfeit(self, room_id: int, player_id: PlayerId) -> None:
+        """
+        Registra a derrota de um jogador por tempo ou desistência.
+
+        Args:
+            room_id (int): Id da sala.
+            player_id (PlayerId): Jogador que perdeu.
+        """
+        self._append(room_id, KIND_FORFEIT, PLAYER_BODY.pack(player_id))
+
+    def record_begin(self, room_id: int) -> None:
+        """
+        Registra o começo de uma partida (`GameManager.start_game`).
+
+        Args:
+            room_id (int): Id da sala.
+        """
+        self._append(room_id, KIND_BEGIN, b"")
+
+    def record_reset(self, room_id: int) -> None:
+        """
+        Registra um reset completo da sala (`GameManager.reset_all`).
+
+        Args:
+            room_id (int): Id da sala.
+        """
+        self._append(room_id, KIND_RESET, b"")
+
+    def sync(self, shard: Optional[int] = None) -> None:
+        """
+        Grava e faz fsync dos registros pendentes.
+
+        Args:
+            shard (int | None): Shard que será sincronizado.
+                Se None, sincroniza todos.
+        """
+        shards = range(self.shards) if shard is None else (shard,)
+        with self._lock:
+            for i in shards:
+                pending = self._pending[i]
+                if pending:
+                    file = self._files[i]
+                    file.write(pending)
+                    file.flush()
+                    os.fsync(file.fileno())
+                    pending.clear()
+                self._pending_count[i] = 0
+                self._last_sync[i] = monotonic()
+
+    def schedule_syncs(self, wheel: "TimerWheel", interval: Optional[float] = None) -> None:
+        """
+        Sincroniza os shards com registros pendentes a cada
+        `interval` segundos e tira os snapshots pendentes. Sem isso,
+        os últimos registros de um shard que parou de receber ações
+        só seriam gravados no `close`.
+
+        Args:
+            wheel (TimerWheel): Roda que dispara as sincronizações.
+            interval (float | None): Segundos entre elas. Por
+                padrão, `group_commit_interval`.
+        """
+        if interval is None:
+            interval = self.group_commit_interval
+
+        def tick() -> None:
+            with self._lock:
+                for shard in range(self.shards):
+                    if self._pending[shard]:
+                        self.sync(shard)
+            self.take_due_snapshots()
+            self._sync_timer = wheel.schedule(interval, tick)
+
+        self._cancel_syncs()
+        self._wheel = wheel
+        self._sync_timer = wheel.schedule(interval, tick)
+
+    def snapshot(self, shard: int) -> None:
+        """
+        Salva o estado de todas as salas de um shard e
+        trunca o journal dele.
+
+        Cada sala é lida com a trava dela (`GameManager.lock`), uma
+        de cada vez e fora da trava do journal, então nenhuma ação
+        fica pela metade no snapshot e as outras salas continuam
+        jogando. Não deve ser chamado por quem segura a trava de uma
+        sala (veja `take_due_snapshots`).
+
+        O snapshot é escrito num arquivo temporário e trocado
+        atomicamente, então um crash durante o processo deixa
+        o snapshot anterior intacto. Os registros de cada sala com
+        seq até o dela são ignorados na recuperação, o que cobre
+        um crash entre a troca e a truncagem.
+
+        Args:
+            shard (int): Shard do snapshot.
+        """
+        with self._lock:
+            self._snapshot_due.discard(shard)
+            start_seq = self._seq[shard]
+            rooms = [
+                (room_id, manager) for room_id, manager in self.rooms.items()
+                if room_id % self.shards == shard
+            ]
+        packed: List[bytes] = []
+        cutoffs: Dict[int, int] = {}
+        for room_id, manager in rooms:
+            with manager.lock:
+                with self._lock:
+                    if self.rooms.get(room_id) is not manager:
+                        continue
+                    cutoffs[room_id] = self._seq[shard]
+                packed.append(_pack_room(room_id, manager, cutoffs[room_id]))
+
+        last_seq = max(cutoffs.values(), default=start_seq)
+        data = bytearray(SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, start_seq, last_seq, len(packed)
+        ))
+        for room in packed:
+            data += room
+        path = self.snapshot_path(shard)
+        _write_atomic(path, data)
+
+        with self._lock:
+            self.sync(shard)
+            # Os registros feitos enquanto as salas eram lidas ficam
+            tail = bytearray()
+            kept = 0
+            for seq, room_id, kind, body in self.iter_records(shard):
+                if seq > cutoffs.get(room_id, start_seq):
+                    tail += _encode_record(seq, room_id, kind, body)
+                    kept += 1
+            self._files[shard].close()
+            _write_atomic(self.journal_path(shard), tail)
+            self._files[shard] = open(self.journal_path(shard), "ab")
+            self._since_snapshot[shard] = kept
+
+    def take_due_snapshots(self) -> None:
+        """
+        Tira os snapshots dos shards que passaram de
+        `snapshot_interval` registros. Chamado pela roda (veja
+        `schedule_syncs`) e pelo `close`, fora das travas das salas.
+        """
+        with self._lock:
+            due = sorted(self._snapshot_due)
+        for shard in due:
+            self.snapshot(shard)
+
+    def recover(self) -> Dict[int, "GameManager"]:
+        """
+        Reconstrói as salas a partir dos arquivos em disco.
+
+        Carrega o último snapshot de cada shard e depois
+        reaplica a cauda do journal. As salas recuperadas são
+        registradas no journal.
+
+        Returns:
+            Dict[int, GameManager]: Salas recuperadas pelo id.
+        """
+        from src.managers.game_manager import GameManager # pylint: disable=import-outside-toplevel
+
+        rooms: Dict[int, GameManager] = {}
+        for shard in range(self.shards):
+            cutoffs: Dict[int, int] = {}
+            last_seq = self._load_snapshot(shard, rooms, cutoffs)
+            for seq, room_id, kind, body in self.iter_records(shard):
+                if seq <= cutoffs.get(room_id, last_seq):
+                    continue
+                if kind == KIND_CREATE:
+                    size, variant = CREATE_BODY.unpack(body)
+                    rooms[room_id] = GameManager(size, VARIANTS_BY_CODE[variant])
+                    continue
+                manager = rooms.get(room_id)
+                if manager is None:
+                    manager = rooms[room_id] = GameManager()
+                _replay(manager, kind, body)
+        for room_id, manager in rooms.items():
+            self.attach(manager, room_id, record=False)
+        return rooms
+
+    def close(self) -> None:
+        """Tira os snapshots pendentes, sincroniza e fecha os arquivos."""
+        self._cancel_syncs()
+        self.take_due_snapshots()
+        with self._lock:
+            self.sync()
+            for file in self._files:
+                file.close()
+
+#! ========= GETTERS =========
+
+    def journal_path(self, shard: int) -> str:
+        """Caminho do journal de um shard."""
+        return os.path.join(self.directory, f"journal-{shard}.bin")
+
+    def snapshot_path(self, shard: int) -> str:
+        """Caminho do snapshot de um shard."""
+        return os.path.join(self.directory, f"snapshot-{shard}.bin")
+
+    def iter_records(self, shard: int) -> Iterator[JournalRecord]:
+        """
+        Percorre os registros válidos do journal de um shard.
+
+        A leitura para no primeiro registro incompleto ou
+        corrompido, que só pode ser a cauda de uma escrita
+        interrompida.
+
+        Args:
+            shard (int): Shard lido.
+
+        Yields:
+            JournalRecord: (seq, room_id, kind, corpo) de cada registro.
+        """
+        yield from iter_journal_file(self.journal_path(shard))
+
+    def _read_last_seq(self, shard: int) -> int:
+        """
+        Pega o maior seq já usado num shard.
+
+        Args:
+            shard (int): Shard procurado.
+
+        Returns:
+            int: O último seq, ou 0 para um shard vazio.
+        """
+        last_seq = 0
+        path = self.snapshot_path(shard)
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                header = file.read(SNAPSHOT_HEADER.size)
+            if len(header) == SNAPSHOT_HEADER.size:
+                last_seq = SNAPSHOT_HEADER.unpack(header)[3]
+        for seq, *_ in self.iter_records(shard):
+            last_seq = max(last_seq, seq)
+        return last_seq
+
+#! ========= PROCESSING =========
+
+    def _append(self, room_id: int, kind: int, body: bytes) -> None:
+        """
+        Acumula um registro no buffer do shard da sala e
+        aplica as regras de group commit. Um shard que passou de
+        `snapshot_interval` registros fica pendente de snapshot.
+
+        Args:
+            room_id (int): Id da sala.
+            kind (int): Tipo do registro.
+            body (bytes): Corpo do registro.
+        """
+        shard = room_id % self.shards
+        with self._lock:
+            self._seq[shard] += 1
+            self._pending[shard] += _encode_record(self._seq[shard], room_id, kind, body)
+            self._pending_count[shard] += 1
+            self._since_snapshot[shard] += 1
+
+            if self._since_snapshot[shard] >= self.snapshot_interval:
+                self._snapshot_due.add(shard)
+            if (
+                self._pending_count[shard] >= self.group_commit_size
+                or monotonic() - self._last_sync[shard] >= self.group_commit_interval
+            ):
+                self.sync(shard)
+
+    def _cancel_syncs(self) -> None:
+        if self._sync_timer is not None and self._wheel is not None:
+            self._wheel.cancel(self._sync_timer)
+        self._sync_timer = None
+
+    def _load_snapshot(
+        self,
+        shard: int,
+        rooms: Dict[int, "GameManager"],
+        cutoffs: Dict[int, int]
+        ) -> int:
+        """
+        Carrega as salas do snapshot de um shard.
+
+        Args:
+            shard (int): Shard do snapshot.
+            rooms (Dict[int, GameManager]): Onde as salas
+                carregadas serão colocadas.
+            cutoffs (Dict[int, int]): Onde o seq de cada sala
+                carregada será colocado.
+
+        Returns:
+            int: O seq do início do snapshot, ou 0 se não houver snapshot.
+        """
+        path = self.snapshot_path(shard)
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, start_seq, _, room_count = SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot inválido: {path}")
+        offset = SNAPSHOT_HEADER.size
+        for _ in range(room_count):
+            room_id, manager, cutoffs[room_id], offset = _unpack_room(data, offset)
+            rooms[room_id] = manager
+        return start_seq
+
+
+def iter_journal_file(path: str) -> Iterator[JournalRecord]:
+    """
+    Percorre os registros válidos de um arquivo de journal.
+
+    O arquivo é lido registro a registro, então a memória usada
+    não depende do tamanho dele. A leitura para no primeiro
+    registro incompleto ou corrompido.
+
+    Args:
+        path (str): Arquivo lido. Se não existe, nada é lido.
+
+    Yields:
+        JournalRecord: (seq, room_id, kind, corpo) de cada registro.
+    """
+    if not os.path.exists(path):
+        return
+    header_size = RECORD_HEADER.size
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(header_size)
+            if len(header) < header_size:
+                return
+            crc, seq, room_id, kind, length = RECORD_HEADER.unpack(header)
+            body = file.read(length)
+            if len(body) < length or zlib.crc32(header[4:] + body) != crc:
+                return
+            yield seq, room_id, kind, body
+
+
+def _encode_record(seq: int, room_id: int, kind: int, body: bytes) -> bytes:
+    record = RECORD_TAIL.pack(seq, room_id, kind, len(body)) + body
+    return RECORD_CRC.pack(zlib.crc32(record)) + record
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Escreve um arquivo num temporário e troca atomicamente."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def _optional(value: Optional[int]) -> int:
+    return -1 if value is None else value
+
+
+def _from_optional(value: int) -> Optional[int]:
+    return None if value == -1 else value
+
+
+def _pack_room(room_id: int, manager: "GameManager", seq: int) -> bytes:
+    """
+    Empacota o estado de uma sala para o snapshot.
+
+    Args:
+        room_id (int): Id da sala.
+        manager (GameManager): Sala empacotada.
+        seq (int): Seq do shard quando a sala foi lida.
+
+    Returns:
+        bytes: Estado da sala.
+    """
+    game = manager.game
+    board = bytes(0 if cell is None else cell + 1 for cell in game.board)
+    data = bytearray(ROOM_STATE.pack(
+        room_id,
+        seq,
+        STATUS_CODES[manager.status],
+        VARIANT_CODES[game.variant],
+        getattr(game, "next_board", -1),
+        _optional(game.current_player),
+        _optional(game.winner),
+        _optional(manager.winner),
+        manager.next_player_id,
+        len(manager.players),
+        len(board)
+    ))
+    data += board
+    for player in manager.players:
+        name = _encode_name(player.name)
+        data += SNAPSHOT_PLAYER.pack(player.id, GAME_REPR_SYMBOLS[player.symbol], len(name))
+        data += name
+    return bytes(data)
+
+
+def _unpack_room(
+    data: bytes,
+    offset: int
+    ) -> Tuple[int, "GameManager", int, int]:
+    """
+    Restaura uma sala de um snapshot.
+
+    Args:
+        data (bytes): Conteúdo do snapshot.
+        offset (int): Posição do estado da sala.
+
+    Returns:
+        Tuple[int, GameManager, int, int]: O id da sala, a sala
+            restaurada, o seq dela e a posição do próximo estado.
+    """
+    from src.managers.game_manager import GameManager # pylint: disable=import-outside-toplevel
+
+    (
+        room_id, seq, status, variant, next_board, current_player,
+        game_winner, winner, next_player_id, player_count, cells
+    ) = ROOM_STATE.unpack_from(data, offset)
+    offset += ROOM_STATE.size
+    manager = GameManager(board_size(cells), VARIANTS_BY_CODE[variant])
+    game = manager.game
+    game.board = [None if cell == 0 else cell - 1 for cell in data[offset:offset + cells]]
+    if hasattr(game, "next_board"):
+        game.next_board = next_board # type: ignore
+    offset += cells
+    game.current_player = _from_optional(current_player)
+    game.winner = _from_optional(game_winner)
+    manager.status = STATUS_BY_CODE[status]
+    manager.winner = _from_optional(winner)
+    manager.next_player_id = next_player_id
+    for _ in range(player_count):
+        player_id, symbol, name_size = SNAPSHOT_PLAYER.unpack_from(data, offset)
+        offset += SNAPSHOT_PLAYER.size
+        name = data[offset:offset + name_size].decode()
+        offset += name_size
+        manager.players.append(Player(player_id, name, SYMBOLS_BY_CODE[symbol], None))
+    return room_id, manager, seq, offset
+
+
+def _replay(manager: "GameManager", kind: int, body: bytes) -> None:
+    """
+    Reaplica um registro do journal numa sala.
+
+    Args:
+        manager (GameManager): Sala alvo.
+        kind (int): Tipo do registro.
+        body (bytes): Corpo do registro.
+    """
+    if kind == KIND_ACTION:
+        action_code, slot = ACTION_BODY.unpack_from(body)
+        payload: PayLoad = {} if slot == NO_SLOT else {"slot": slot}
+        manager.apply_action({"type": ACTIONS_BY_CODE[action_code], "payload": payload})
+    elif kind == KIND_JOIN:
+        player_id, symbol = JOIN_BODY.unpack_from(body)
+        manager.next_player_id = player_id
+        manager.add_player(body[JOIN_BODY.size:].decode(), SYMBOLS_BY_CODE[symbol], None) # type: ignore
+    elif kind == KIND_LEAVE:
+        manager.remove_player(PLAYER_BODY.unpack(body)[0])
+    elif kind == KIND_TURN:
+        manager.set_current_player(PLAYER_BODY.unpack(body)[0])
+    elif kind == KIND_BEGIN:
+        manager.start_game()
+    elif kind == KIND_RESET:
+        manager.reset_all()
+    elif kind == KIND_FORFEIT:
+        manager.forfeit(PLAYER_BODY.unpack(body)[0])
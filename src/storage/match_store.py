@@ -0,0 +1,245 @@
+import sqlite3
+from json import dumps, loads
+from queue import Empty, Full, Queue
+from threading import Thread
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from src.core.config import MATCH_STORE_BATCH_SIZE, MATCH_STORE_QUEUE_SIZE
+from src.core.types import PlayerId
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    room_id INTEGER NOT NULL,
+    variant TEXT NOT NULL,
+    board_size INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    winner INTEGER,
+    moves TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS match_players (
+    match_id INTEGER NOT NULL REFERENCES matches(id),
+    player_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    PRIMARY KEY (match_id, player_id)
+);
+"""
+
+INSERT_MATCH = """
+INSERT INTO matches (room_id, variant, board_size, started_at, finished_at, duration, winner, moves)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_PLAYER = "INSERT INTO match_players (match_id, player_id, name, symbol) VALUES (?, ?, ?, ?)"
+
+
+class MatchRecord: # pylint: disable=too-few-public-methods
+    """
+    Dados de uma partida terminada, copiados da sala.
+
+    Attributes:
+        room_id (int): Id da sala.
+        variant (str): `GameVariant.value`.
+        board_size (int): Lado do tabuleiro.
+        players (Tuple[Tuple[PlayerId, str, str], ...]): Id, nome
+            e `GameSymbols.value` de cada jogador.
+        moves (Tuple[int, ...]): Casas jogadas, em ordem.
+        winner (PlayerId | None): Vencedor, ou None com empate
+            ou abandono sem vencedor.
+        started_at (float): Início da partida (`time.time`).
+        finished_at (float): Fim da partida (`time.time`).
+    """
+    __slots__ = (
+        "room_id", "variant", "board_size", "players",
+        "moves", "winner", "started_at", "finished_at"
+    )
+
+    def __init__(self, manager: "GameManager") -> None:
+        self.room_id = manager.room_id
+        self.variant = manager.game.variant.value
+        self.board_size = manager.game.size
+        self.players = tuple((p.id, p.name, p.symbol.value) for p in manager.players)
+        self.moves = tuple(manager.moves)
+        self.winner: Optional[PlayerId] = manager.winner
+        self.started_at: float = manager.started_at # type: ignore
+        self.finished_at: float = manager.finished_at # type: ignore
+
+    @property
+    def duration(self) -> float:
+        """Duração da partida, em segundos."""
+        return self.finished_at - self.started_at
+
+
+class MatchStore:
+    """
+    Guarda as partidas terminadas num banco SQLite.
+
+    A sala só copia os dados da partida e os coloca numa fila
+    limitada (`submit`); uma thread de fundo tira da fila tudo o
+    que já chegou, até `batch_size`, e grava numa única transação.
+    Assim o custo do commit (fsync) é dividido entre as partidas
+    do lote em vez de ser pago por partida na thread do jogo.
+    Com a fila cheia, a partida é descartada e contada em `dropped`.
+
+    Attributes:
+        path (str): Arquivo do banco.
+        batch_size (int): Máximo de partidas por transação.
+        written (int): Partidas gravadas.
+        batches (int): Transações feitas.
+        dropped (int): Partidas descartadas com a fila cheia.
+        failed (int): Partidas perdidas por erro do banco.
+    """
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = MATCH_STORE_BATCH_SIZE,
+        max_queue: int = MATCH_STORE_QUEUE_SIZE
+        ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue: "Queue[Optional[MatchRecord]]" = Queue(max_queue)
+        # O schema é criado aqui para que as consultas funcionem
+        # mesmo antes da primeira escrita
+        with sqlite3.connect(path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        conn.close()
+        self._thread = Thread(target=self._run, name="match-store", daemon=True)
+        self._thread.start()
+
+#! ========= COMMANDS =========
+
+    def attach(self, manager: "GameManager") -> None:
+        """
+        Liga uma sala ao store. As partidas dela passam a ser
+        gravadas quando terminam.
+
+        Args:
+            manager (GameManager): Sala ligada.
+        """
+        manager.store = self
+
+    def submit(self, manager: "GameManager") -> bool:
+        """
+        Coloca a partida terminada de uma sala na fila de escrita,
+        sem bloquear.
+
+        Args:
+            manager (GameManager): Sala com a partida terminada.
+
+        Returns:
+            bool: True se a partida entrou na fila.
+        """
+        if manager.started_at is None or manager.finished_at is None:
+            return False
+        try:
+            self._queue.put_nowait(MatchRecord(manager))
+        except Full:
+            self.dropped += 1
+            get_logger().warning("match_dropped", room_id=manager.room_id)
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Espera a gravação de tudo o que já está na fila."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Grava o que falta e para a thread."""
+        self._queue.put(None) # Sinal de parada
+        self._thread.join()
+
+#! ========= GETTERS =========
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Pega as últimas partidas gravadas.
+
+        Args:
+            limit (int): Máximo de partidas.
+
+        Returns:
+            List[Dict[str, Any]]: Partidas da mais nova para a mais
+                velha, com os campos da tabela `matches`, `moves`
+                como lista e `players` como [id, nome, símbolo].
+        """
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT * FROM matches ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+            matches = []
+            for row in rows:
+                match = dict(row)
+                match["moves"] = loads(match["moves"])
+                match["players"] = [
+                    list(player) for player in conn.execute(
+                        "SELECT player_id, name, symbol FROM match_players"
+                        " WHERE match_id = ? ORDER BY player_id",
+                        (match["id"],)
+                    )
+                ]
+                matches.append(match)
+            return matches
+        finally:
+            conn.close()
+
+#! ========= PROCESSING =========
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(self.path)
+        try:
+            while True:
+                batch = self._next_batch()
+                records = [record for record in batch if record is not None]
+                if records:
+                    self._write(conn, records)
+                for _ in batch:
+                    self._queue.task_done()
+                if len(records) < len(batch):
+                    return
+        finally:
+            conn.close()
+
+    def _next_batch(self) -> List[Optional[MatchRecord]]:
+        """Espera uma partida e junta as que já estão na fila."""
+        batch = [self._queue.get()]
+        while batch[-1] is not None and len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _write(self, conn: sqlite3.Connection, records: List[MatchRecord]) -> None:
+        try:
+            with conn:
+                for record in records:
+                    match_id = conn.execute(INSERT_MATCH, _match_row(record)).lastrowid
+                    conn.executemany(INSERT_PLAYER, [
+                        (match_id, *player) for player in record.players
+                    ])
+        except sqlite3.Error as e:
+            self.failed += len(records)
+            get_logger().error("match_store_error", error=str(e), matches=len(records))
+            return
+        self.written += len(records)
+        self.batches += 1
+
+
+def _match_row(record: MatchRecord) -> Tuple[Any, ...]:
+    return (
+        record.room_id, record.variant, record.board_size,
+        record.started_at, record.finished_at, record.duration,
+        record.winner, dumps(record.moves)
+    )
@@ -0,0 +1,359 @@
+import os
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from threading import Lock
+from time import sleep
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
+from src.core.config import SNAPSHOT_MAX_CELLS, SNAPSHOT_READ_RETRIES, SNAPSHOT_SLOTS
+from src.core.types import GameBoard, PlayerId
+from src.protocols.enums import GameStatus
+from src.protocols.state_sync import track
+from src.storage.journal import STATUS_BY_CODE, STATUS_CODES, VARIANT_CODES
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+
+# Região: cabeçalho | slot 0 | slot 1 | ...
+# Cabeçalho: magic | quantidade de slots | casas máximas por tabuleiro
+HEADER = struct.Struct("<4sHH")
+MAGIC = b"TTTS"
+# Slot: seq (u64) | corpo. O seq é ímpar enquanto o corpo é escrito.
+SEQ = struct.Struct("<Q")
+SLOT_ALIGN = 64 # Um slot por linha de cache, no mínimo
+NONE = -1 # Jogador da vez / vencedor ausente
+FREE = 0 # `room_id` de um slot livre
+
+# Regiões criadas por este processo (veja `SnapshotReader.__init__`)
+_OWNED: Set[str] = set()
+
+
+def _tracked_name(name: str) -> str:
+    # No POSIX, o resource_tracker guarda o nome com a barra inicial
+    return "/" + name if os.name == "posix" else name
+
+
+class SnapshotBusyError(RuntimeError):
+    """O slot ficou em escrita por mais de `retries` leituras."""
+
+
+def _board_bytes(max_cells: int) -> int:
+    return (2 * max_cells + 7) // 8
+
+
+def _body(max_cells: int) -> struct.Struct:
+    # room_id | version | variante | lado | status | jogador da vez | vencedor | casas
+    return struct.Struct(f"<IIBBBii{_board_bytes(max_cells)}s")
+
+
+def _slot_size(max_cells: int) -> int:
+    size = SEQ.size + _body(max_cells).size
+    return -(-size // SLOT_ALIGN) * SLOT_ALIGN
+
+
+class RoomSnapshot:
+    """
+    Estado de uma sala lido da memória compartilhada.
+
+    Attributes:
+        room_id (int): Id da sala.
+        version (int): Versão do estado (veja `GameManager.version`).
+        variant (int): Código da variante (veja `VARIANT_CODES`).
+        size (int): Lado do tabuleiro.
+        status (GameStatus): Status da sala.
+        current_player (PlayerId | None): Jogador da vez.
+        winner (PlayerId | None): Vencedor.
+        code (int): Casas empacotadas: máscara do jogador 0 e, acima
+            dela, a do jogador 1 (veja `src/core/bitboard.py`).
+    """
+    __slots__ = ("room_id", "version", "variant", "size", "status", "current_player", "winner", "code")
+
+    def __init__(self, fields: Tuple[Any, ...]) -> None:
+        room_id, version, variant, size, status, current_player, winner, code = fields
+        self.room_id: int = room_id
+        self.version: int = version
+        self.variant: int = variant
+        self.size: int = size
+        self.status: GameStatus = STATUS_BY_CODE[status]
+        self.current_player: Optional[PlayerId] = None if current_player == NONE else current_player
+        self.winner: Optional[PlayerId] = None if winner == NONE else winner
+        self.code: int = int.from_bytes(code, "little")
+
+    @property
+    def board(self) -> GameBoard:
+        """O tabuleiro, com None, 0 ou 1 em cada casa."""
+        cells = self.size * self.size
+        code = self.code
+        board: GameBoard = []
+        for slot in range(cells):
+            if code >> slot & 1:
+                board.append(0)
+            elif code >> (slot + cells) & 1:
+                board.append(1)
+            else:
+                board.append(None)
+        return board
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Estado no formato do `state` do `STATE_SNAPSHOT`, sem os jogadores."""
+        return {
+            "version": self.version,
+            "size": self.size,
+            "board": self.board,
+            "current_player": self.current_player,
+            "status": self.status.value,
+            "winner": self.winner
+        }
+
+
+class SnapshotPublisher:
+    """
+    Publica o estado das salas de um processo numa região de
+    `multiprocessing.shared_memory`, para processos de espectadores
+    lerem com um `SnapshotReader`.
+
+    Cada sala ocupa um slot fixo protegido por um seqlock: o `seq`
+    fica ímpar durante a escrita e volta a ser par no fim. Os leitores
+    não travam nada; só repetem a leitura se o `seq` mudou no meio.
+    Só este processo escreve na região, e o `_lock` serializa as
+    threads dele, então a sala nunca tem dois escritores.
+
+    A sala é publicada a cada nova versão (veja `state_delta` e
+    `GameManager.publish_state`).
+
+    Attributes:
+        slots (int): Quantidade de salas que cabem na região.
+        max_cells (int): Casas do maior tabuleiro aceito.
+        published (int): Escritas feitas.
+        dropped (int): Publicações recusadas por falta de slot.
+        closed (bool): Indica que a região foi fechada; as
+            publicações seguintes são ignoradas.
+    """
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        slots: int = SNAPSHOT_SLOTS,
+        max_cells: int = SNAPSHOT_MAX_CELLS
+        ) -> None:
+        self.slots = slots
+        self.max_cells = max_cells
+        self.published = 0
+        self.dropped = 0
+        self.closed = False
+        self._body = _body(max_cells)
+        self._slot_size = _slot_size(max_cells)
+        self._memory = shared_memory.SharedMemory(
+            name=name, create=True, size=HEADER.size + slots * self._slot_size
+        )
+        _OWNED.add(self._memory.name)
+        self._buffer = self._memory.buf
+        HEADER.pack_into(self._buffer, 0, MAGIC, slots, max_cells)
+        self._rooms: Dict[int, int] = {}
+        self._free: List[int] = list(range(slots - 1, -1, -1))
+        self._lock = Lock()
+
+    @property
+    def name(self) -> str:
+        """Nome da região, passado aos processos de espectadores."""
+        return self._memory.name
+
+    def attach(self, manager: "GameManager") -> None:
+        """
+        Liga uma sala ao publisher e publica o estado atual. A sala
+        passa a ser acompanhada (veja `track`), então as mudanças
+        feitas fora das ações também chegam aos leitores.
+
+        Args:
+            manager (GameManager): Sala ligada. Precisa de um
+                `room_id` (veja `RoomRegistry.register`).
+
+        Raises:
+            ValueError: Se a sala não tem `room_id` ou o tabuleiro
+                passa de `max_cells`.
+        """
+        if manager.room_id == FREE:
+            raise ValueError("A sala precisa de um room_id.")
+        if len(manager.game.board) > self.max_cells:
+            raise ValueError(f"Tabuleiro maior que {self.max_cells} casas.")
+        manager.snapshots = self
+        track(manager)
+        self.publish(manager)
+
+    def detach(self, manager: "GameManager") -> None:
+        """
+        Desliga uma sala e libera o slot dela.
+
+        Args:
+            manager (GameManager): Sala desligada.
+        """
+        manager.snapshots = None
+        with self._lock:
+            slot = self._rooms.pop(manager.room_id, None)
+            if slot is None or self.closed:
+                return
+            self._write(slot, (FREE, 0, 0, 0, 0, NONE, NONE, b""))
+            self._free.append(slot)
+
+    def publish(self, manager: "GameManager") -> bool:
+        """
+        Escreve o estado atual de uma sala no slot dela.
+
+        Args:
+            manager (GameManager): Sala publicada.
+
+        Returns:
+            bool: True se foi escrita, False se não havia slot livre.
+        """
+        game = manager.game
+        cells = len(game.board)
+        code = game.pack() & ((1 << 2 * cells) - 1)
+        current_player = manager.get_current_player()
+        fields = (
+            manager.room_id,
+            manager.version,
+            VARIANT_CODES[game.variant],
+            game.size,
+            STATUS_CODES[manager.status],
+            NONE if current_player is None else current_player,
+            NONE if manager.winner is None else manager.winner,
+            code.to_bytes(_board_bytes(self.max_cells), "little")
+        )
+        with self._lock:
+            if self.closed:
+                return False
+            slot = self._rooms.get(manager.room_id)
+            if slot is None:
+                if not self._free:
+                    self.dropped += 1
+                    get_logger().warning("snapshot_dropped", room_id=manager.room_id)
+                    return False
+                slot = self._rooms[manager.room_id] = self._free.pop()
+            self._write(slot, fields)
+            self.published += 1
+        return True
+
+    def close(self) -> None:
+        """Fecha e apaga a região. Os leitores abertos continuam com a cópia mapeada."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._memory.close()
+            self._memory.unlink()
+            _OWNED.discard(self._memory.name)
+
+    def _write(self, slot: int, fields: Tuple[Any, ...]) -> None:
+        buffer = self._buffer
+        offset = HEADER.size + slot * self._slot_size
+        (seq,) = SEQ.unpack_from(buffer, offset)
+        SEQ.pack_into(buffer, offset, seq + 1)
+        self._body.pack_into(buffer, offset + SEQ.size, *fields)
+        SEQ.pack_into(buffer, offset, seq + 2)
+
+
+class SnapshotReader:
+    """
+    Lê os estados publicados por um `SnapshotPublisher`, de
+    qualquer processo, sem travas nem mensagens.
+
+    Attributes:
+        slots (int): Quantidade de slots da região.
+        max_cells (int): Casas do maior tabuleiro aceito.
+        retries (int): Tentativas de leitura de um slot em escrita
+            antes de desistir.
+        closed (bool): Indica que a região foi desmapeada.
+    """
+    def __init__(self, name: str, retries: int = SNAPSHOT_READ_RETRIES) -> None:
+        self._memory = shared_memory.SharedMemory(name=name)
+        # Quem abre a região não é o dono: sem isto o resource_tracker
+        # a apaga quando este processo termina.
+        if name not in _OWNED:
+            resource_tracker.unregister(_tracked_name(self._memory.name), "shared_memory")
+        self._buffer = self._memory.buf
+        self.closed = False
+        magic, self.slots, self.max_cells = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{name} não é uma região de snapshots.")
+        self.retries = retries
+        self._body = _body(self.max_cells)
+        self._slot_size = _slot_size(self.max_cells)
+        self._rooms: Dict[int, int] = {}
+
+    def read(self, slot: int) -> Optional[RoomSnapshot]:
+        """
+        Lê um slot.
+
+        Args:
+            slot (int): Índice do slot.
+
+        Returns:
+            (RoomSnapshot | None): O estado, ou None se o slot está livre.
+
+        Raises:
+            SnapshotBusyError: Se o slot continuou em escrita por
+                `retries` tentativas (um publisher que caiu no meio).
+        """
+        fields = self._read(slot)
+        return None if fields[0] == FREE else RoomSnapshot(fields)
+
+    def find(self, room_id: int) -> Optional[RoomSnapshot]:
+        """
+        Lê o estado de uma sala.
+
+        Args:
+            room_id (int): Id da sala.
+
+        Returns:
+            (RoomSnapshot | None): O estado, ou None se a sala
+                não está publicada.
+        """
+        slot = self._rooms.get(room_id)
+        if slot is not None:
+            fields = self._read(slot)
+            if fields[0] == room_id:
+                return RoomSnapshot(fields)
+            del self._rooms[room_id]
+        for slot in range(self.slots):
+            fields = self._read(slot)
+            if fields[0] != FREE:
+                self._rooms[fields[0]] = slot
+            if fields[0] == room_id:
+                return RoomSnapshot(fields)
+        return None
+
+    def rooms(self) -> Iterator[RoomSnapshot]:
+        """
+        Lê todas as salas publicadas.
+
+        Yields:
+            RoomSnapshot: O estado de cada sala, na ordem dos slots.
+        """
+        for slot in range(self.slots):
+            fields = self._read(slot)
+            if fields[0] != FREE:
+                self._rooms[fields[0]] = slot
+                yield RoomSnapshot(fields)
+
+    def close(self) -> None:
+        """Desmapeia a região. Ela continua existindo para os outros."""
+        if self.closed:
+            return
+        self.closed = True
+        self._memory.close()
+
+    def _read(self, slot: int) -> Tuple[Any, ...]:
+        buffer = self._buffer
+        offset = HEADER.size + slot * self._slot_size
+        body = offset + SEQ.size
+        for _ in range(self.retries):
+            (before,) = SEQ.unpack_from(buffer, offset)
+            if not before & 1:
+                fields = self._body.unpack_from(buffer, body)
+                (after,) = SEQ.unpack_from(buffer, offset)
+                if before == after:
+                    return fields
+            # Cede a vez ao escritor, que pode estar na mesma CPU
+            # ou, no mesmo processo, esperando o GIL.
+            sleep(0)
+        raise SnapshotBusyError(f"Slot {slot} em escrita por {self.retries} leituras.")
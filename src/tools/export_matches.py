@@ -0,0 +1,171 @@
+import argparse
+import os
+import sqlite3
+from json import loads
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
+import numpy as np
+from numpy.lib.format import open_memmap
+from src.core.config import EXPORT_CHUNK_SIZE, GameSymbols, GameVariant
+from src.storage.journal import VARIANT_CODES
+
+# Colunas exportadas: nome -> dtype. Cada coluna vira `<nome>.npy`,
+# com uma linha por partida. `moves` tem uma segunda dimensão, com
+# as casas jogadas e -1 depois da última jogada.
+COLUMNS = {
+    "match_id": np.int64,
+    "variant": np.int8,
+    "board_size": np.int8,
+    "move_count": np.int16,
+    "moves": np.int8,
+    "winner": np.int8,
+    "started_at": np.float64,
+    "duration": np.float64,
+}
+
+PAD = -1
+MAX_SLOT = np.iinfo(np.int8).max
+WINNER_CODES = {GameSymbols.CIRCLE.value: 0, GameSymbols.CROSS.value: 1}
+
+MatchRow = Tuple[int, str, int, float, float, str, str]
+
+SELECT_MATCHES = """
+SELECT m.id, m.variant, m.board_size, m.started_at, m.duration, m.moves,
+       COALESCE((SELECT p.symbol FROM match_players p
+                 WHERE p.match_id = m.id AND p.player_id = m.winner), '')
+FROM matches m ORDER BY m.id
+"""
+
+
+def export_matches(
+    database: str,
+    directory: str,
+    chunk_size: int = EXPORT_CHUNK_SIZE
+    ) -> int:
+    """
+    Exporta as partidas de um `MatchStore` em colunas NumPy (`.npy`).
+
+    As partidas são lidas do banco em blocos de `chunk_size` e
+    escritas direto em arquivos mapeados (`open_memmap`), então a
+    memória usada não depende do tamanho do histórico. Os arquivos
+    podem ser abertos com `load_export` sem ler tudo para a memória.
+
+    Colunas:
+        - match_id: Id da partida no banco.
+        - variant: Código da variante (veja `VARIANT_CODES`).
+        - board_size: Lado do tabuleiro.
+        - move_count: Quantidade de jogadas.
+        - moves: Casas jogadas, com largura fixa e -1 no fim.
+        - winner: 0 se venceu `GameSymbols.CIRCLE`, 1 se venceu
+            `GameSymbols.CROSS` e -1 sem vencedor.
+        - started_at: Início da partida (`time.time`).
+        - duration: Duração, em segundos.
+
+    Args:
+        database (str): Banco do `MatchStore`.
+        directory (str): Diretório dos arquivos `.npy`.
+        chunk_size (int): Partidas lidas por bloco.
+
+    Returns:
+        int: Quantidade de partidas exportadas.
+
+    Raises:
+        ValueError: Se uma casa não cabe em int8 (tabuleiros
+            maiores que 11x11).
+    """
+    conn = sqlite3.connect(database, isolation_level=None)
+    try:
+        # Uma transação de leitura: partidas gravadas durante a
+        # exportação não mudam a contagem feita abaixo
+        conn.execute("BEGIN")
+        count, width = conn.execute(
+            "SELECT COUNT(*), COALESCE(MAX(json_array_length(moves)), 0) FROM matches"
+        ).fetchone()
+        os.makedirs(directory, exist_ok=True)
+        columns = _open_columns(directory, count, max(width, 1))
+        start = 0
+        for chunk in _read_chunks(conn, chunk_size):
+            _write_chunk(columns, start, chunk)
+            start += len(chunk)
+        for column in columns.values():
+            column.flush()
+        return start
+    finally:
+        conn.close()
+
+
+def load_export(
+    directory: str,
+    mmap_mode: Optional[Literal["r", "r+", "c"]] = "r"
+    ) -> Dict[str, np.ndarray]:
+    """
+    Abre as colunas escritas por `export_matches`.
+
+    Args:
+        directory (str): Diretório dos arquivos `.npy`.
+        mmap_mode ("r" | "r+" | "c" | None): Modo do `np.load`. Com
+            "r", as colunas são mapeadas e só lidas do disco quando
+            usadas; com None, são lidas inteiras para a memória.
+
+    Returns:
+        Dict[str, np.ndarray]: Coluna pelo nome.
+    """
+    return {
+        name: np.load(os.path.join(directory, name + ".npy"), mmap_mode=mmap_mode)
+        for name in COLUMNS
+    }
+
+
+def _open_columns(directory: str, count: int, width: int) -> Dict[str, np.memmap]:
+    columns: Dict[str, np.memmap] = {}
+    for name, dtype in COLUMNS.items():
+        shape = (count, width) if name == "moves" else (count,)
+        columns[name] = open_memmap(
+            os.path.join(directory, name + ".npy"), mode="w+", dtype=dtype, shape=shape
+        )
+    columns["moves"][:] = PAD
+    return columns
+
+
+def _read_chunks(conn: sqlite3.Connection, chunk_size: int) -> Iterator[List[MatchRow]]:
+    cursor = conn.execute(SELECT_MATCHES)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield rows
+
+
+def _write_chunk(columns: Dict[str, np.memmap], start: int, rows: List[MatchRow]) -> None:
+    end = start + len(rows)
+    match_id, variant, size, started_at, duration, moves, winner = zip(*rows)
+    columns["match_id"][start:end] = match_id
+    columns["variant"][start:end] = [VARIANT_CODES[GameVariant(v)] for v in variant]
+    columns["board_size"][start:end] = size
+    columns["started_at"][start:end] = started_at
+    columns["duration"][start:end] = duration
+    columns["winner"][start:end] = [WINNER_CODES.get(symbol, -1) for symbol in winner]
+
+    move_count = columns["move_count"]
+    block = columns["moves"]
+    for i, text in enumerate(moves, start):
+        slots = loads(text)
+        if slots and max(slots) > MAX_SLOT:
+            raise ValueError(f"A casa {max(slots)} não cabe em int8.")
+        move_count[i] = len(slots)
+        block[i, :len(slots)] = slots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Exporta o histórico de partidas em colunas NumPy (.npy)."
+    )
+    parser.add_argument("database", help="Banco SQLite do MatchStore.")
+    parser.add_argument("directory", help="Diretório dos arquivos .npy.")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+    count = export_matches(args.database, args.directory, args.chunk_size)
+    print(f"{count} partidas exportadas para {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+import argparse
+import glob
+import json
+import os
+import sqlite3
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.ai.solver import solve
+from src.core.config import ANALYZER_WORKERS, GameSymbols, GameVariant
+from src.core.exceptions import DrawError
+from src.core.variants import create_game
+from src.protocols.enums import GameActions
+from src.storage.journal import (
+    ACTION_BODY, ACTIONS_BY_CODE, CREATE_BODY, JOIN_BODY, PLAYER_BODY,
+    KIND_ACTION, KIND_BEGIN, KIND_CREATE, KIND_FORFEIT, KIND_JOIN,
+    KIND_LEAVE, KIND_RESET, KIND_TURN, SYMBOLS_BY_CODE, VARIANTS_BY_CODE,
+    iter_journal_file
+)
+
+# Problemas encontrados no replay de uma partida
+ILLEGAL_MOVE = "illegal_move"
+MOVE_AFTER_END = "move_after_end"
+WINNER_MISMATCH = "winner_mismatch"
+UNKNOWN_ROOM = "unknown_room"
+
+OPENING_DEPTH = 2 # Jogadas que formam uma abertura
+MAX_EXAMPLES = 20 # Partidas com problema listadas no relatório
+
+
+class GameHistory: # pylint: disable=too-few-public-methods
+    """
+    Uma partida lida de um journal ou do histórico.
+
+    Attributes:
+        source (str): Arquivo de origem.
+        game_id (str): Identificação da partida no arquivo.
+        variant (GameVariant): Variante do jogo.
+        size (int): Lado do tabuleiro.
+        moves (List[int]): Casas jogadas, em ordem.
+        starter (GameSymbols): Quem fez a primeira jogada.
+        winner (GameSymbols | None): Vencedor registrado.
+        finished (bool): Indica que a partida foi registrada como
+            terminada. Partidas abandonadas não são comparadas
+            com o vencedor calculado.
+        flags (List[str]): Problemas encontrados já na leitura.
+    """
+    __slots__ = (
+        "source", "game_id", "variant", "size", "moves",
+        "starter", "winner", "finished", "flags"
+    )
+
+    def __init__(
+        self,
+        source: str,
+        game_id: str,
+        variant: GameVariant = GameVariant.CLASSIC,
+        size: int = 3
+        ) -> None:
+        self.source = source
+        self.game_id = game_id
+        self.variant = variant
+        self.size = size
+        self.moves: List[int] = []
+        self.starter = GameSymbols.CIRCLE
+        self.winner: Optional[GameSymbols] = None
+        self.finished = False
+        self.flags: List[str] = []
+
+
+class ReplayStats:
+    """
+    Estatísticas somadas de várias partidas. Podem ser juntadas
+    com `merge`, o que permite analisar arquivos em paralelo.
+
+    Attributes:
+        games (int): Partidas analisadas.
+        moves (int): Jogadas aplicadas.
+        flagged (int): Partidas com algum problema.
+        flags (Counter): Problemas por tipo.
+        openings (Counter): Primeiras jogadas (até `OPENING_DEPTH`).
+        judged_moves (int): Jogadas comparadas com a tabela
+            de resultados resolvidos (só o 3x3 clássico).
+        mistakes (int): Jogadas que pioraram o resultado teórico
+            de quem jogou.
+        lengths (int): Soma da quantidade de jogadas das partidas.
+        examples (List[Tuple[str, str, str]]): Algumas partidas com
+            problema, como (arquivo, partida, problema).
+    """
+    def __init__(self) -> None:
+        self.games = 0
+        self.moves = 0
+        self.flagged = 0
+        self.flags: Counter = Counter()
+        self.openings: Counter = Counter()
+        self.judged_moves = 0
+        self.mistakes = 0
+        self.lengths = 0
+        self.examples: List[Tuple[str, str, str]] = []
+
+    def merge(self, other: "ReplayStats") -> "ReplayStats":
+        """
+        Soma as estatísticas de outra análise nesta.
+
+        Args:
+            other (ReplayStats): Estatísticas somadas.
+
+        Returns:
+            ReplayStats: Esta instância.
+        """
+        self.games += other.games
+        self.moves += other.moves
+        self.flagged += other.flagged
+        self.flags.update(other.flags)
+        self.openings.update(other.openings)
+        self.judged_moves += other.judged_moves
+        self.mistakes += other.mistakes
+        self.lengths += other.lengths
+        self.examples.extend(other.examples[:MAX_EXAMPLES - len(self.examples)])
+        return self
+
+    def to_dict(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Converte as estatísticas num dicionário para o relatório.
+
+        Args:
+            top (int): Quantidade de aberturas listadas.
+
+        Returns:
+            Dict[str, Any]: Totais, `mistake_rate`, `average_length`
+                e as aberturas mais frequentes.
+        """
+        return {
+            "games": self.games,
+            "moves": self.moves,
+            "flagged": self.flagged,
+            "flags": dict(self.flags),
+            "average_length": self.lengths / self.games if self.games else 0.0,
+            "judged_moves": self.judged_moves,
+            "mistakes": self.mistakes,
+            "mistake_rate": self.mistakes / self.judged_moves if self.judged_moves else 0.0,
+            "openings": [
+                [list(opening), count] for opening, count in self.openings.most_common(top)
+            ],
+            "examples": [list(example) for example in self.examples],
+        }
+
+#! ========= SOURCES =========
+
+
+def iter_histories(path: str) -> Iterator[GameHistory]:
+    """
+    Lê as partidas de um arquivo, uma por vez.
+
+    Aceita um journal (`journal-*.bin`), um banco do `MatchStore`
+    (`.db`) ou um diretório do `export_matches`.
+
+    Args:
+        path (str): Arquivo ou diretório lido.
+
+    Yields:
+        GameHistory: Cada partida do arquivo.
+    """
+    if os.path.isdir(path):
+        yield from iter_export_histories(path)
+    elif path.endswith(".db"):
+        yield from iter_store_histories(path)
+    else:
+        yield from iter_journal_histories(path)
+
+
+def iter_journal_histories(path: str) -> Iterator[GameHistory]:
+    """
+    Monta as partidas a partir dos registros de um journal.
+
+    Só as partidas em andamento e os jogadores presentes ficam na
+    memória, então o tamanho do arquivo não importa.
+
+    Args:
+        path (str): Arquivo do journal.
+
+    Yields:
+        GameHistory: Cada partida, quando ela termina ou
+            no fim do arquivo.
+    """
+    rooms: Dict[int, Tuple[GameVariant, int]] = {}
+    symbols: Dict[Tuple[int, int], GameSymbols] = {}
+    games: Dict[int, GameHistory] = {}
+    count = 0
+    for _, room_id, kind, body in iter_journal_file(path):
+        if kind == KIND_CREATE:
+            size, variant = CREATE_BODY.unpack(body)
+            rooms[room_id] = VARIANTS_BY_CODE[variant], size
+        elif kind == KIND_JOIN:
+            player_id, symbol = JOIN_BODY.unpack_from(body)
+            symbols[room_id, player_id] = SYMBOLS_BY_CODE[symbol]
+        elif kind == KIND_LEAVE:
+            symbols.pop((room_id, PLAYER_BODY.unpack(body)[0]), None)
+        elif kind in (KIND_BEGIN, KIND_RESET):
+            game = games.pop(room_id, None)
+            if game is not None:
+                yield game
+            if kind == KIND_BEGIN:
+                count += 1
+                variant, size = rooms.get(room_id, (GameVariant.CLASSIC, 3))
+                game = games[room_id] = GameHistory(path, f"{room_id}:{count}", variant, size)
+                if room_id not in rooms:
+                    game.flags.append(UNKNOWN_ROOM)
+        elif room_id not in games:
+            continue
+        elif kind == KIND_TURN:
+            game = games[room_id]
+            if not game.moves:
+                player_id = PLAYER_BODY.unpack(body)[0]
+                game.starter = symbols.get((room_id, player_id), GameSymbols.CIRCLE)
+        elif kind == KIND_ACTION:
+            action_code, slot = ACTION_BODY.unpack(body)
+            action = ACTIONS_BY_CODE[action_code]
+            if action == GameActions.MAKE_MOVEMENT:
+                games[room_id].moves.append(slot)
+            elif action in (GameActions.EXIT, GameActions.RESTART):
+                yield games.pop(room_id)
+        elif kind == KIND_FORFEIT:
+            game = games.pop(room_id)
+            loser = symbols.get((room_id, PLAYER_BODY.unpack(body)[0]))
+            game.winner = _other(loser) if loser is not None else None
+            game.finished = True
+            yield game
+    yield from games.values()
+
+
+def iter_store_histories(path: str) -> Iterator[GameHistory]:
+    """
+    Lê as partidas de um banco do `MatchStore`, em blocos.
+
+    O banco não guarda quem começou; ele é deduzido do vencedor
+    e da paridade das jogadas (ou `GameSymbols.CIRCLE`).
+
+    Args:
+        path (str): Banco SQLite.
+
+    Yields:
+        GameHistory: Cada partida do banco.
+    """
+    conn = sqlite3.connect(path)
+    try:
+        cursor = conn.execute(
+            "SELECT m.id, m.variant, m.board_size, m.moves,"
+            " (SELECT p.symbol FROM match_players p"
+            "  WHERE p.match_id = m.id AND p.player_id = m.winner)"
+            " FROM matches m ORDER BY m.id"
+        )
+        for match_id, variant, size, moves, winner in cursor:
+            game = GameHistory(path, str(match_id), GameVariant(variant), size)
+            game.moves = json.loads(moves)
+            game.winner = GameSymbols(winner) if winner is not None else None
+            game.finished = game.winner is not None
+            game.starter = _infer_starter(game)
+            yield game
+    finally:
+        conn.close()
+
+
+def iter_export_histories(directory: str) -> Iterator[GameHistory]:
+    """
+    Lê as partidas de um diretório do `export_matches`. As colunas
+    são mapeadas, então só as linhas usadas são lidas do disco.
+
+    Args:
+        directory (str): Diretório dos arquivos `.npy`.
+
+    Yields:
+        GameHistory: Cada partida exportada.
+    """
+    from src.tools.export_matches import load_export # pylint: disable=import-outside-toplevel
+    columns = load_export(directory)
+    winners = (GameSymbols.CIRCLE, GameSymbols.CROSS)
+    for i in range(len(columns["match_id"])):
+        game = GameHistory(
+            directory,
+            str(int(columns["match_id"][i])),
+            VARIANTS_BY_CODE[int(columns["variant"][i])],
+            int(columns["board_size"][i])
+        )
+        game.moves = columns["moves"][i, :int(columns["move_count"][i])].tolist()
+        winner = int(columns["winner"][i])
+        game.winner = winners[winner] if winner >= 0 else None
+        game.finished = game.winner is not None
+        game.starter = _infer_starter(game)
+        yield game
+
+#! ========= PIPELINE =========
+
+
+def replay(game: GameHistory) -> Tuple[GameHistory, Optional[int], int]:
+    """
+    Reaplica uma partida com as regras do `TicTacToe` e compara
+    cada jogada do 3x3 clássico com o resultado resolvido.
+
+    Problemas encontrados vão para `game.flags`.
+
+    Args:
+        game (GameHistory): Partida reaplicada.
+
+    Returns:
+        Tuple[GameHistory, int | None, int]: A partida, a quantidade
+            de jogadas comparadas com o solver (None fora do 3x3
+            clássico) e a de erros.
+    """
+    engine = create_game(game.variant, game.size)
+    player = game.starter
+    engine.set_current_player(player)
+    judged = game.variant == GameVariant.CLASSIC and game.size == 3
+    mistakes = 0
+    winner: Optional[GameSymbols] = None
+    over = False
+    for slot in game.moves:
+        if over:
+            game.flags.append(MOVE_AFTER_END)
+            break
+        if (
+            not engine.is_valid_slot(slot)
+            or engine.is_occupied(slot)
+            or not engine.is_playable(slot)
+        ):
+            game.flags.append(ILLEGAL_MOVE)
+            break
+        before = solve(engine.pack())[0] if judged else 0
+        engine.make_movement(slot)
+        try:
+            winner = engine.check_winner(with_symbols=True) # type: ignore
+        except DrawError:
+            over = True
+        over = over or winner is not None
+        player = _other(player)
+        engine.set_current_player(player)
+        if judged:
+            if over:
+                after = 1 if winner is not None else 0
+            else:
+                # `solve` responde do ponto de vista do adversário
+                after = -solve(engine.pack())[0]
+            mistakes += after < before
+    if game.finished and not game.flags and winner is not None and winner != game.winner:
+        game.flags.append(WINNER_MISMATCH)
+    return game, (len(game.moves) if judged else None), mistakes
+
+
+def analyze(histories: Iterable[GameHistory]) -> ReplayStats:
+    """
+    Reaplica e soma uma sequência de partidas.
+
+    Args:
+        histories (Iterable[GameHistory]): Partidas, normalmente
+            um gerador de `iter_histories`.
+
+    Returns:
+        ReplayStats: As estatísticas das partidas.
+    """
+    stats = ReplayStats()
+    for game, judged, mistakes in map(replay, histories):
+        stats.games += 1
+        stats.moves += len(game.moves)
+        stats.lengths += len(game.moves)
+        if game.moves:
+            stats.openings[tuple(game.moves[:OPENING_DEPTH])] += 1
+        if judged is not None and not game.flags:
+            stats.judged_moves += judged
+            stats.mistakes += mistakes
+        if game.flags:
+            stats.flagged += 1
+            stats.flags.update(game.flags)
+            if len(stats.examples) < MAX_EXAMPLES:
+                stats.examples.append((game.source, game.game_id, game.flags[0]))
+    return stats
+
+
+def analyze_file(path: str) -> ReplayStats:
+    """
+    Analisa as partidas de um arquivo. Veja `iter_histories`.
+
+    Args:
+        path (str): Arquivo ou diretório lido.
+
+    Returns:
+        ReplayStats: As estatísticas do arquivo.
+    """
+    return analyze(iter_histories(path))
+
+
+def analyze_files(paths: List[str], workers: int = ANALYZER_WORKERS) -> ReplayStats:
+    """
+    Analisa vários arquivos, em paralelo com um pool de processos.
+
+    Cada processo devolve só as estatísticas somadas do seu
+    arquivo, então pouca coisa passa pelo IPC.
+
+    Args:
+        paths (List[str]): Arquivos ou diretórios lidos.
+        workers (int): Processos do pool. Com 0 usa
+            `os.cpu_count()`; com 1 analisa no próprio processo.
+
+    Returns:
+        ReplayStats: As estatísticas de todos os arquivos.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = ReplayStats()
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
+            total.merge(analyze_file(path))
+        return total
+    with ProcessPoolExecutor(min(workers, len(paths))) as pool:
+        for stats in pool.map(analyze_file, paths):
+            total.merge(stats)
+    return total
+
+
+def _other(symbol: GameSymbols) -> GameSymbols:
+    return GameSymbols.CROSS if symbol == GameSymbols.CIRCLE else GameSymbols.CIRCLE
+
+
+def _infer_starter(game: GameHistory) -> GameSymbols:
+    # Numa vitória, quem venceu fez a última jogada
+    if game.winner is None or not game.moves:
+        return GameSymbols.CIRCLE
+    return game.winner if len(game.moves) % 2 else _other(game.winner)
+
+
+def _expand(paths: List[str]) -> List[str]:
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path) and not os.path.exists(os.path.join(path, "moves.npy")):
+            expanded.extend(sorted(glob.glob(os.path.join(path, "journal-*.bin"))))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Reaplica partidas de journals ou do histórico e mostra estatísticas."
+    )
+    parser.add_argument(
+        "paths", nargs="+",
+        help="Journals, bancos do MatchStore (.db), diretórios de journal ou exportações."
+    )
+    parser.add_argument("--workers", type=int, default=ANALYZER_WORKERS)
+    parser.add_argument("--top", type=int, default=10, help="Aberturas listadas.")
+    args = parser.parse_args()
+    stats = analyze_files(_expand(args.paths), args.workers)
+    print(json.dumps(stats.to_dict(args.top), indent=2))
+
+
+if __name__ == "__main__":
+    main()
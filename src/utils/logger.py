@@ -0,0 +1,188 @@
+import sys
+from json import dumps
+from queue import Full, Queue
+from random import random
+from threading import Lock, Thread
+from time import monotonic, time
+from typing import Any, Dict, Mapping, Optional, TextIO, Tuple
+from src.core.config import LOG_LEVEL, LOG_QUEUE_SIZE, LOG_RATE_CAPS, LOG_SAMPLE_RATES
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+LogRecord = Tuple[float, str, str, Dict[str, Any]]
+
+
+class StructuredLogger:
+    """
+    Logger estruturado que escreve numa thread própria.
+
+    `log` só monta uma tupla e a coloca numa fila limitada, sem
+    formatar nem fazer I/O; a thread de fundo formata cada registro
+    como uma linha JSON e escreve no `stream`. Com a fila cheia, o
+    registro é descartado em vez de bloquear quem chamou.
+
+    Eventos barulhentos podem ser amostrados (`sample_rates`, a
+    fração mantida) e limitados (`rate_caps`, registros por segundo).
+
+    Attributes:
+        stream (TextIO): Destino das linhas.
+        level (int): Nível mínimo registrado. Veja `LEVELS`.
+        sample_rates (Mapping[str, float]): Fração mantida por evento.
+        rate_caps (Mapping[str, int]): Máximo por segundo por evento.
+        written (int): Registros escritos.
+        dropped (int): Registros descartados com a fila cheia.
+        sampled_out (int): Registros descartados pela amostragem.
+        capped (int): Registros descartados pelo limite por segundo.
+    """
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        level: str = LOG_LEVEL,
+        max_queue: int = LOG_QUEUE_SIZE,
+        sample_rates: Mapping[str, float] = LOG_SAMPLE_RATES,
+        rate_caps: Mapping[str, int] = LOG_RATE_CAPS
+        ) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self.level = LEVELS[level]
+        self.sample_rates = sample_rates
+        self.rate_caps = rate_caps
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.capped = 0
+        self._queue: "Queue[Optional[LogRecord]]" = Queue(max_queue)
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        self._lock = Lock()
+        self._thread = Thread(target=self._run, name="structured-logger", daemon=True)
+        self._thread.start()
+
+#! ========= COMMANDS =========
+
+    def log(self, level: str, event: str, **fields: Any) -> bool:
+        """
+        Registra um evento sem bloquear.
+
+        Args:
+            level (str): "debug", "info", "warning" ou "error".
+            event (str): Nome do evento, como "client_connected".
+            **fields (Any): Campos do registro.
+
+        Returns:
+            bool: True se o registro entrou na fila.
+        """
+        if LEVELS[level] < self.level:
+            return False
+        rate = self.sample_rates.get(event)
+        if rate is not None and random() >= rate:
+            self.sampled_out += 1
+            return False
+        cap = self.rate_caps.get(event)
+        if cap is not None and not self._within_cap(event, cap):
+            self.capped += 1
+            return False
+        try:
+            self._queue.put_nowait((time(), level, event, fields))
+        except Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def debug(self, event: str, **fields: Any) -> bool:
+        """Registra um evento de nível "debug". Veja `log`."""
+        return self.log("debug", event, **fields)
+
+    def info(self, event: str, **fields: Any) -> bool:
+        """Registra um evento de nível "info". Veja `log`."""
+        return self.log("info", event, **fields)
+
+    def warning(self, event: str, **fields: Any) -> bool:
+        """Registra um evento de nível "warning". Veja `log`."""
+        return self.log("warning", event, **fields)
+
+    def error(self, event: str, **fields: Any) -> bool:
+        """Registra um evento de nível "error". Veja `log`."""
+        return self.log("error", event, **fields)
+
+    def flush(self) -> None:
+        """Espera a thread escrever tudo o que já está na fila."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Escreve o que falta e para a thread."""
+        if self._thread.is_alive():
+            self._queue.put(None) # Sinal de parada
+            self._thread.join()
+
+#! ========= PROCESSING =========
+
+    def _within_cap(self, event: str, cap: int) -> bool:
+        """
+        Conta o registro na janela de um segundo do evento.
+
+        Args:
+            event (str): Nome do evento.
+            cap (int): Máximo de registros por segundo.
+
+        Returns:
+            bool: True se o registro cabe na janela atual.
+        """
+        now = monotonic()
+        with self._lock:
+            start, count = self._windows.get(event, (now, 0))
+            if now - start >= 1.0:
+                start, count = now, 0
+            if count >= cap:
+                return False
+            self._windows[event] = (start, count + 1)
+            return True
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                self._flush_stream()
+                self._queue.task_done()
+                return
+            self._write(record)
+            # Só faz flush quando a fila esvazia, juntando as escritas
+            if self._queue.empty():
+                self._flush_stream()
+            self._queue.task_done()
+
+    def _write(self, record: LogRecord) -> None:
+        timestamp, level, event, fields = record
+        line = dumps(
+            {"time": round(timestamp, 6), "level": level, "event": event, **fields},
+            default=str
+        )
+        try:
+            self.stream.write(line + "\n")
+            self.written += 1
+        except (OSError, ValueError):
+            self.dropped += 1
+
+    def _flush_stream(self) -> None:
+        try:
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+_logger: Optional[StructuredLogger] = None
+_logger_lock = Lock()
+
+
+def get_logger() -> StructuredLogger:
+    """
+    Pega o logger compartilhado pelo processo.
+
+    Returns:
+        StructuredLogger: A instância única do processo.
+    """
+    global _logger # pylint: disable=global-statement
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = StructuredLogger()
+    return _logger
@@ -0,0 +1,114 @@
+import sys
+from collections import deque
+from typing import Any, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.game_manager import GameManager
+
+
+def object_size(obj: Any) -> int:
+    """
+    Pega o tamanho de um objeto, incluindo o `__dict__` dele
+    quando existir.
+
+    Args:
+        obj (Any): Objeto medido.
+
+    Returns:
+        int: Tamanho em bytes.
+    """
+    size = sys.getsizeof(obj)
+    instance_dict = getattr(obj, "__dict__", None)
+    if isinstance(instance_dict, dict):
+        size += sys.getsizeof(instance_dict)
+    return size
+
+
+def room_memory_report(manager: "GameManager") -> Dict[str, int]:
+    """
+    Mede os bytes que uma sala ocupa.
+
+    Conta só o que pertence à sala: o `GameManager`, o jogo, o
+    tabuleiro, os jogadores (com os nomes), a lista de jogadas, que
+    cresce a cada movimento, a trava, o relógio (com o temporizador
+    agendado) e o `state_tracker` com o histórico de deltas. As casas
+    da lista são ints pequenos, compartilhados pelo interpretador.
+    Objetos compartilhados, como enums, sockets, journal, a roda do
+    relógio e bots, ficam de fora.
+
+    Args:
+        manager (GameManager): Sala medida.
+
+    Returns:
+        Dict[str, int]: Bytes por parte da sala e o total em "total".
+    """
+    game = manager.game
+    report = {
+        "manager": object_size(manager),
+        "game": object_size(game),
+        "board": _board_size(game),
+        "players": sys.getsizeof(manager.players),
+        "player_records": sum(object_size(player) for player in manager.players),
+        "player_names": sum(sys.getsizeof(player.name) for player in manager.players),
+        "moves": sys.getsizeof(manager.moves),
+        "bots": 0 if manager.bots is None else sys.getsizeof(manager.bots),
+        "lock": sys.getsizeof(manager.lock),
+        "clock": _clock_size(manager.clock),
+        "state_tracker": _tracker_size(manager.state_tracker)
+    }
+    report["total"] = sum(report.values())
+    return report
+
+
+def _clock_size(clock: Any) -> int:
+    """
+    Mede o relógio de uma sala: o `TurnClock`, o tempo restante de
+    cada jogador e o `Timer` agendado na roda, se houver.
+    """
+    if clock is None:
+        return 0
+    size = object_size(clock) + _deep_size(clock.remaining)
+    timer = clock._timer # pylint: disable=protected-access
+    if timer is not None:
+        size += object_size(timer) + sys.getsizeof(timer.args)
+    return size
+
+
+def _tracker_size(tracker: Any) -> int:
+    """
+    Mede o `StateTracker` de uma sala com o histórico de deltas,
+    que guarda até `STATE_HISTORY_SIZE` versões. Os nomes nos
+    registros de jogadores já contam em "player_names".
+    """
+    if tracker is None:
+        return 0
+    players = sys.getsizeof(tracker.players) + sum(sys.getsizeof(record) for record in tracker.players)
+    return object_size(tracker) + players + _deep_size(tracker.history)
+
+
+def _deep_size(obj: Any) -> int:
+    """
+    Mede um valor e, se ele é um container, o que ele guarda.
+    None, bools e ints pequenos são compartilhados e não contam.
+    """
+    if obj is None or isinstance(obj, bool) or (isinstance(obj, int) and -5 <= obj <= 256):
+        return 0
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(key) + _deep_size(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, deque)):
+        size += sum(_deep_size(item) for item in obj)
+    return size
+
+
+def _board_size(game: Any) -> int:
+    """
+    Mede o tabuleiro de um jogo. Motores em bitboard (como o
+    Ultimate) guardam máscaras em vez da lista de casas.
+    """
+    if hasattr(game, "cells"):
+        return sum(
+            sys.getsizeof(masks) + sum(sys.getsizeof(bits) for bits in masks)
+            for masks in (game.cells, game.meta)
+        )
+    return sys.getsizeof(game.board)
@@ -0,0 +1,59 @@
+from threading import Lock
+from typing import Dict
+
+
+class LatencyStats:
+    """
+    Estatísticas acumuladas de uma duração (em segundos).
+
+    Guarda só contadores, então registrar uma amostra é O(1) e não
+    cresce com o número de amostras.
+
+    Attributes:
+        count (int): Amostras registradas.
+        total (float): Soma das amostras.
+        minimum (float): Menor amostra.
+        maximum (float): Maior amostra.
+    """
+    __slots__ = ("count", "total", "minimum", "maximum", "_lock")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self._lock = Lock()
+
+    def record(self, seconds: float) -> None:
+        """
+        Registra uma amostra.
+
+        Args:
+            seconds (float): Duração medida.
+        """
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if seconds < self.minimum:
+                self.minimum = seconds
+            if seconds > self.maximum:
+                self.maximum = seconds
+
+    @property
+    def mean(self) -> float:
+        """Média das amostras, ou 0 sem amostras."""
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Pega os valores atuais.
+
+        Returns:
+            Dict[str, float]: count, mean, min e max.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum
+        }
@@ -0,0 +1,240 @@
+from math import ceil
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, List, Optional, Tuple
+from src.core.config import TIMER_WHEEL_LEVELS, TIMER_WHEEL_SLOTS, TIMER_WHEEL_TICK
+from src.utils.logger import get_logger
+from src.utils.metrics import LatencyStats
+
+
+class Timer: # pylint: disable=too-few-public-methods
+    """
+    Um temporizador agendado numa `TimerWheel`.
+
+    Attributes:
+        deadline (float): Momento do disparo, no relógio da roda.
+        callback (Callable): Função chamada no disparo.
+        args (tuple): Argumentos da função.
+        cancelled (bool): Indica que o temporizador foi cancelado.
+    """
+    __slots__ = ("deadline", "expires", "callback", "args", "cancelled")
+
+    def __init__(
+        self,
+        deadline: float,
+        expires: int,
+        callback: Callable[..., Any],
+        args: Tuple[Any, ...]
+        ) -> None:
+        self.deadline = deadline
+        self.expires = expires
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+class TimerWheel:
+    """
+    Roda de temporizadores hierárquica, movida por ticks.
+
+    Cada nível tem `slots` posições; uma posição do nível `n` cobre
+    `slots ** n` ticks. Um temporizador entra no nível mais baixo que
+    alcança o seu prazo e desce de nível (cascata) quando a roda de
+    baixo dá a volta. Agendar e cancelar são O(1), e avançar um tick
+    só toca os temporizadores que vencem nele, então milhares de salas
+    dividem uma única estrutura, sem uma thread ou `threading.Timer`
+    por sala.
+
+    A roda não tem thread própria: quem controla o loop chama
+    `advance` periodicamente.
+
+    Attributes:
+        tick (float): Duração de um tick, em segundos.
+        slots (int): Posições por nível. Deve ser potência de 2.
+        levels (int): Quantidade de níveis.
+        clock (Callable[[], float]): Relógio da roda.
+        lateness (LatencyStats): Atraso dos disparos em relação
+            ao prazo de cada temporizador.
+        fired (int): Temporizadores disparados.
+        failed (int): Disparos cuja função levantou uma exceção.
+    """
+    def __init__(
+        self,
+        tick: float = TIMER_WHEEL_TICK,
+        slots: int = TIMER_WHEEL_SLOTS,
+        levels: int = TIMER_WHEEL_LEVELS,
+        clock: Callable[[], float] = monotonic
+        ) -> None:
+        if slots & (slots - 1):
+            raise ValueError("A quantidade de slots deve ser potência de 2.")
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.clock = clock
+        self.lateness = LatencyStats()
+        self.fired = 0
+        self.failed = 0
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._span = slots ** levels
+        self._wheels: List[List[List[Timer]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._origin = clock()
+        self._current = 0
+        self._pending = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._pending
+
+#! ========= COMMANDS =========
+
+    def schedule(
+        self,
+        delay: float,
+        callback: Callable[..., Any],
+        *args: Any
+        ) -> Timer:
+        """
+        Agenda uma função para daqui a `delay` segundos.
+
+        O disparo acontece no primeiro `advance` depois do prazo,
+        arredondado para cima até o próximo tick.
+
+        Args:
+            delay (float): Segundos até o disparo.
+            callback (Callable): Função chamada no disparo.
+            *args (Any): Argumentos da função.
+
+        Returns:
+            Timer: O temporizador, usado em `cancel`.
+        """
+        deadline = self.clock() + delay
+        with self._lock:
+            expires = max(
+                self._current + 1,
+                ceil((deadline - self._origin) / self.tick)
+            )
+            timer = Timer(deadline, expires, callback, args)
+            self._insert(timer)
+            self._pending += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """
+        Cancela um temporizador.
+
+        O temporizador só é marcado; ele é descartado quando
+        a roda passa por ele.
+
+        Args:
+            timer (Timer): Temporizador cancelado.
+
+        Returns:
+            bool: True se o temporizador ainda estava pendente.
+        """
+        with self._lock:
+            if timer.cancelled:
+                return False
+            timer.cancelled = True
+            self._pending -= 1
+            return True
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """
+        Avança a roda até `now`, disparando os temporizadores vencidos.
+
+        As funções são chamadas fora do lock, então podem agendar ou
+        cancelar outros temporizadores. Uma função que levanta uma
+        exceção é registrada no log e as outras continuam.
+
+        Args:
+            now (float | None): Momento atual. Por padrão, `clock()`.
+
+        Returns:
+            int: Quantidade de temporizadores disparados.
+        """
+        if now is None:
+            now = self.clock()
+        target = int((now - self._origin) / self.tick)
+        due: List[Timer] = []
+        with self._lock:
+            while self._current < target:
+                self._current += 1
+                self._cascade()
+                bucket = self._wheels[0][self._current & self._mask]
+                for timer in bucket:
+                    if not timer.cancelled:
+                        timer.cancelled = True
+                        self._pending -= 1
+                        due.append(timer)
+                bucket.clear()
+
+        for timer in due:
+            self.lateness.record(max(0.0, now - timer.deadline))
+            try:
+                timer.callback(*timer.args)
+            except Exception as e: # pylint: disable=broad-exception-caught
+                self.failed += 1
+                name = getattr(timer.callback, "__qualname__", repr(timer.callback))
+                get_logger().error("timer_failed", callback=name, error=repr(e))
+        self.fired += len(due)
+        return len(due)
+
+#! ========= PROCESSING =========
+
+    def _insert(self, timer: Timer) -> None:
+        """
+        Coloca um temporizador no nível que alcança o seu prazo.
+        Deve ser chamado com o lock.
+
+        Args:
+            timer (Timer): Temporizador inserido.
+        """
+        expires = timer.expires
+        distance = expires - self._current
+        if distance >= self._span:
+            # Longe demais: fica na última posição alcançável e
+            # é reinserido quando ela descer.
+            expires = self._current + self._span - 1
+            distance = self._span - 1
+        level = 0
+        while distance >= 1 << (self._bits * (level + 1)):
+            level += 1
+        index = (expires >> (self._bits * level)) & self._mask
+        self._wheels[level][index].append(timer)
+
+    def _cascade(self) -> None:
+        """
+        Desce os temporizadores dos níveis cuja posição começa no
+        tick atual. Deve ser chamado com o lock.
+        """
+        for level in range(self.levels - 1, 0, -1):
+            shift = self._bits * level
+            if self._current & ((1 << shift) - 1):
+                continue
+            bucket = self._wheels[level][(self._current >> shift) & self._mask]
+            timers = [timer for timer in bucket if not timer.cancelled]
+            bucket.clear()
+            for timer in timers:
+                self._insert(timer)
+
+
+_timer_wheel: Optional[TimerWheel] = None
+_timer_wheel_lock = Lock()
+
+
+def get_timer_wheel() -> TimerWheel:
+    """
+    Pega a roda de temporizadores compartilhada pelo processo.
+
+    Returns:
+        TimerWheel: A instância única do processo.
+    """
+    global _timer_wheel # pylint: disable=global-statement
+    if _timer_wheel is None:
+        with _timer_wheel_lock:
+            if _timer_wheel is None:
+                _timer_wheel = TimerWheel()
+    return _timer_wheel
@@ -1,22 +1,29 @@
+from types import MappingProxyType
 from typing import Any, Literal
 from src.protocols.enums import GameWarning
-from src.core.types import SystemMessage
+from src.core.types import ActionResponse
+
+# Entradas que indicam sucesso. Um frozenset deixa a checagem
+# padrão de `was_successful` sem alocação.
+SUCCESS_ENTRIES = frozenset((GameWarning.OK, 0, True))
+_ZERO = 0
+_NO_PAYLOAD = MappingProxyType({})
 
 def was_message_successful(
-    message: SystemMessage
+    message: ActionResponse
     ) -> bool:
     """
     Verifica se uma Mensagem do Sistema
     indica sucesso.
 
     Args:
-        message (SystemMessage): Mensagem que será validada.
+        message (ActionResponse): Mensagem que será validada.
 
     Returns:
         bool: True para sucesso na mensagem, False para
             erro.
     """
-    success = message.get("payload", {}).get("success", False)
+    success = message.get("payload", _NO_PAYLOAD).get("success", False)
     return was_successful(success, True, operator="is")
 
 def was_successful(
@@ -31,8 +38,8 @@ def was_successful(
     Args:
         entry (Any): Entrada que será validada.
         expected_entry (Any): Entrada esperada.
-            Por padrão é None, se None, usa a seguintes lista
-            para comparar:
+            Por padrão é None, se None, compara com
+            `SUCCESS_ENTRIES`: GameWarning.OK, 0 e True.
         operator (str): Indica qual operador usar na validação.
             Pode ser apenas "==" ou "is". Por padrão é "==".
 
@@ -44,12 +51,13 @@ def was_successful(
         return entry in expected_entry
 
     if expected_entry is None:
-        expected_entry = [GameWarning.OK, 0, True]
-    else:
-        expected_entry = [expected_entry]
-
-    if entry not in expected_entry:
         if operator == "is":
-            return any(entry is i for i in expected_entry)
-        return any(entry == i for i in expected_entry)
-    return False
+            return entry is GameWarning.OK or entry is True or entry is _ZERO
+        try:
+            return entry in SUCCESS_ENTRIES
+        except TypeError: # Entradas não hasheáveis não são iguais a nenhuma
+            return False
+
+    if operator == "is":
+        return entry is expected_entry
+    return entry == expected_entry
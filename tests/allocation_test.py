@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+import gc
+import tracemalloc
+from typing import List, Tuple
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.game_manager import GameManager
+from src.core.types import SystemMessage
+from src.core.config import GameSymbols
+from src.protocols.enums import GameActions, GameWarning
+from src.protocols.errors import GameError
+from src.utils.validation_utils import was_successful
+
+CALLS = 5000
+
+class TestAllocation(unittest.TestCase):
+    """
+    Benchmark de alocação do `apply_action`.
+
+    As respostas ficam guardadas durante o loop, então uma resposta
+    nova por chamada aparece na memória atual; alocações temporárias
+    aparecem no pico.
+    """
+
+    def setUp(self) -> None:
+        self.gm = GameManager()
+        self.gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        self.gm.add_player("Diogo", GameSymbols.CROSS, None)
+        self.gm.start_game()
+        self.gm.switch_current_player()
+        self.gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": 4}})
+
+    def _measure(self, message: SystemMessage) -> Tuple[List[SystemMessage], int, int]:
+        warmup = self.gm.apply_action(message) # Aquece os caches
+        results: List[SystemMessage] = [warmup] * CALLS
+        gc.collect()
+        tracemalloc.start()
+        try:
+            base, _ = tracemalloc.get_traced_memory()
+            for i in range(CALLS):
+                results[i] = self.gm.apply_action(message)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return results, current - base, peak - base
+
+    def test_rejected_move_does_not_allocate(self) -> None:
+        message = {"type": "make_movement", "payload": {"slot": 4}}
+        results, retained, peak = self._measure(message)
+        self.assertEqual(results[0]["type"], GameError.OCCUPIED_SLOT.value)
+        self.assertIs(results[0], results[-1])
+        self.assertLess(retained / CALLS, 1)
+        self.assertLess(peak, 2048)
+
+    def test_start_in_ongoing_game_does_not_allocate(self) -> None:
+        message = {"type": GameActions.START, "payload": {}}
+        results, retained, peak = self._measure(message)
+        self.assertEqual(results[0]["type"], GameError.GAME_HAS_STARTED.value)
+        self.assertLess(retained / CALLS, 1)
+        self.assertLess(peak, 2048)
+
+    def test_responses_are_read_only(self) -> None:
+        response = self.gm.apply_action({"type": "make_movement", "payload": {"slot": 4}})
+        with self.assertRaises(TypeError):
+            response["payload"]["success"] = True # type: ignore
+
+    def test_was_successful(self) -> None:
+        self.assertTrue(was_successful(GameWarning.OK))
+        self.assertTrue(was_successful(0))
+        self.assertTrue(was_successful(True))
+        self.assertFalse(was_successful(GameError.INVALID_SLOT))
+        self.assertFalse(was_successful({"unhashable": True}))
+        self.assertTrue(was_successful(0, operator="is"))
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestAllocation)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
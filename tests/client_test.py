@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+import socket
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.common.client import Client
+from src.common.transport import InProcessTransport
+from src.protocols.framing import FrameDecoder, FrameError, frame, recv_frame
+from src.protocols.enums import ConnectionActions
+from src.protocols.message_protocol import create_message
+from src.protocols.serialize import serialize, deserialize
+
+class TestFraming(unittest.TestCase):
+
+    def test_split_and_coalesced(self) -> None:
+        data = frame(b"primeira") + frame(b"") + frame(b"segunda")
+        decoder = FrameDecoder()
+        messages = []
+        for i in range(0, len(data), 3):
+            messages += decoder.feed(data[i:i + 3])
+        self.assertListEqual(messages, [b"primeira", b"", b"segunda"])
+        self.assertListEqual(FrameDecoder().feed(data), messages)
+
+    def test_oversized_frame(self) -> None:
+        with self.assertRaises(FrameError):
+            FrameDecoder(max_size=4).feed(frame(b"grande"))
+
+    def test_recv_frame(self) -> None:
+        left, right = socket.socketpair()
+        with left, right:
+            left.sendall(frame(b"oi") + frame(b"tchau"))
+            self.assertEqual(recv_frame(right), b"oi")
+            self.assertEqual(recv_frame(right), b"tchau")
+            left.close()
+            self.assertIsNone(recv_frame(right))
+
+class TestClient(unittest.TestCase):
+
+    def test_refused_without_server(self) -> None:
+        client = Client(transport=InProcessTransport())
+        self.assertEqual(client.connection_result["code"], 1002)
+        client.close()
+
+    def test_send_and_receive(self) -> None:
+        transport = InProcessTransport()
+        listener = transport.listen()
+        client = Client(transport=transport)
+        server_side, _ = listener.accept()
+        with server_side:
+            self.assertEqual(client.connection_result["code"], 0)
+            client.send(ConnectionActions.HEARTBEAT, {})
+            self.assertEqual(deserialize(recv_frame(server_side))["type"], "heartbeat")
+            server_side.sendall(frame(serialize(create_message("pong", {}))))
+            self.assertEqual(client.receive(1.0)["type"], "pong")
+            server_side.shutdown(socket.SHUT_RDWR)
+            self.assertIsNone(client.receive(1.0))
+        client.close()
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestFraming, TestClient):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
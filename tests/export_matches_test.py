@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+import tempfile
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.storage.match_store import MatchStore
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols
+from src.protocols.enums import GameActions, GameStatus
+
+@unittest.skipIf(np is None, "numpy não está instalado")
+class TestExportMatches(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.tmp.name, "matches.db")
+        store = MatchStore(self.database)
+        gm = GameManager()
+        store.attach(gm)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        for slots in ((0, 3, 1, 4, 2), (4, 0, 8), (0, 3, 1, 4, 8, 5)):
+            gm.start_game()
+            gm.switch_current_player()
+            for slot in slots:
+                gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+            if gm.is_current_state(GameStatus.ONGOING):
+                gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        store.close()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_columns(self) -> None:
+        from src.tools.export_matches import export_matches, load_export
+        directory = os.path.join(self.tmp.name, "export")
+        self.assertEqual(export_matches(self.database, directory, chunk_size=2), 3)
+        columns = load_export(directory)
+        self.assertEqual(columns["moves"].dtype, np.int8)
+        self.assertTupleEqual(columns["moves"].shape, (3, 6))
+        self.assertListEqual(columns["moves"][1].tolist(), [4, 0, 8, -1, -1, -1])
+        self.assertListEqual(columns["move_count"].tolist(), [5, 3, 6])
+        self.assertListEqual(columns["winner"].tolist(), [0, -1, 1])
+        self.assertTrue((columns["duration"] >= 0).all())
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestExportMatches)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
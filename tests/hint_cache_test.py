@@ -0,0 +1,95 @@
+import unittest
+import os
+import sys
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.ai.hint_cache import HintCache, get_hint_cache
+from src.core.bitboard import pack_board
+from src.core.config import GameSymbols
+from src.managers.game_manager import GameManager
+from src.protocols.enums import GameActions, GameStatus
+from src.protocols.errors import GameError
+from src.utils.validation_utils import was_message_successful
+
+class TestHintCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.cache = HintCache(max_size=2)
+
+    def test_symmetric_positions_hit(self) -> None:
+        # Circle no canto superior esquerdo e no canto inferior direito
+        first = self.cache.get_hint(pack_board([0, None, None, None, None, None, None, None, None], 1))
+        second = self.cache.get_hint(pack_board([None, None, None, None, None, None, None, None, 0], 1))
+        self.assertEqual(first, 4)
+        self.assertEqual(second, 4)
+        self.assertDictEqual(
+            self.cache.stats(),
+            {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+        )
+
+    def test_eviction(self) -> None:
+        self.cache.get_hint(pack_board([None] * 9, 0))
+        self.cache.get_hint(pack_board([0] + [None] * 8, 1))
+        self.cache.get_hint(pack_board([None, None, None, None, 0, None, None, None, None], 1))
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_finished_position(self) -> None:
+        self.assertIsNone(self.cache.get_hint(pack_board([0, 0, 0, 1, 1, None, None, None, None], 1)))
+
+class TestHintAction(unittest.TestCase):
+
+    def setUp(self) -> None:
+        get_hint_cache().clear()
+        self.gm = GameManager()
+        self.gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        self.gm.add_player("Diogo", GameSymbols.CROSS, None)
+
+    def test_hint_without_current_player(self) -> None:
+        message = self.gm.apply_action({"type": GameActions.HINT, "payload": {}})
+        self.assertEqual(message["type"], GameError.GAME_NOT_STARTED.value)
+
+    def test_hint_blocks_opponent(self) -> None:
+        self.gm.game.board = [0, 0, None, None, 1, None, None, None, None]
+        self.gm.set_current_player(self.gm.get_player_id(GameSymbols.CROSS))
+        message = self.gm.apply_action({"type": GameActions.HINT, "payload": {}})
+        self.assertTrue(was_message_successful(message))
+        self.assertEqual(message["payload"]["slot"], 2)
+
+    def test_hint_after_game_finished(self) -> None:
+        self.gm.start_game()
+        self.gm.switch_current_player()
+        for slot in (0, 3, 1, 4, 2):
+            self.gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+        self.assertTrue(self.gm.is_current_state(GameStatus.FINISHED))
+        message = self.gm.apply_action({"type": GameActions.HINT, "payload": {}})
+        self.assertFalse(was_message_successful(message))
+        self.assertEqual(message["type"], GameError.GAME_ALREADY_FINISHED.value)
+        self.assertIsNone(self.gm.last_hint)
+
+    def test_hint_unavailable_on_larger_board(self) -> None:
+        gm = GameManager(size=4)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.start_game()
+        gm.switch_current_player()
+        cache = get_hint_cache()
+        database, cache.database = cache.database, None
+        try:
+            message = gm.apply_action({"type": GameActions.HINT, "payload": {}})
+        finally:
+            cache.database = database
+        self.assertEqual(message["type"], GameError.HINT_UNAVAILABLE.value)
+        self.assertTrue(gm.is_current_state(GameStatus.ONGOING))
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestHintCache))
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestHintAction))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
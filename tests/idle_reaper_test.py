@@ -0,0 +1,122 @@
+import unittest
+import os
+import sys
+import socket
+from threading import Thread
+from time import sleep
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.common.idle_reaper import IdleReaper
+from src.common.connection_handler import ConnectionHandler
+from src.common.client import Client
+from src.common.server import Server
+from src.common.transport import InProcessTransport
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols
+from src.protocols.enums import ConnectionActions, ServerWarning
+from src.protocols.message_protocol import create_message
+from src.protocols.serialize import serialize, deserialize
+from src.protocols.framing import frame, recv_frame
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestIdleReaper(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.reaper = IdleReaper(timeout=30.0, clock=self.clock)
+        self.server_side, self.client_side = socket.socketpair()
+        self.handler = ConnectionHandler(self.server_side, ("local", 0), reaper=self.reaper)
+        self.handler.game_manager.add_player("Sato", GameSymbols.CIRCLE, self.server_side)
+        self.handler.player_id = 0
+        self.thread = Thread(target=self.handler.run, daemon=True)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.client_side.close()
+        self.thread.join(1)
+
+    def _heartbeat(self) -> None:
+        self.client_side.sendall(frame(serialize(create_message(ConnectionActions.HEARTBEAT, {}))))
+        response = deserialize(recv_frame(self.client_side))
+        self.assertEqual(response["type"], ServerWarning.HEARTBEAT_ACK.value)
+
+    def test_heartbeat_keeps_connection(self) -> None:
+        self.clock.now = 20.0
+        self._heartbeat()
+        self.clock.now = 40.0
+        self.assertEqual(self.reaper.reap(), 0)
+        self.assertEqual(len(self.reaper), 1)
+
+    def test_idle_connection_is_released(self) -> None:
+        self._heartbeat()
+        self.clock.now = 31.0
+        self.assertEqual(self.reaper.reap(), 1)
+        self.thread.join(1)
+        self.assertFalse(self.thread.is_alive())
+        self.assertListEqual(self.handler.game_manager.players, [])
+        self.assertEqual(len(self.reaper), 0)
+        self.assertEqual(self.client_side.recv(1024), b"")
+
+    def test_reap_stops_at_first_live_connection(self) -> None:
+        class Stub:
+            closed = 0
+            def close(self) -> None:
+                Stub.closed += 1
+        reaper = IdleReaper(timeout=30.0, clock=self.clock)
+        stubs = [Stub() for _ in range(3)]
+        for i, stub in enumerate(stubs):
+            self.clock.now = 100.0 + i
+            reaper.touch(stub) # type: ignore
+        reaper.touch(stubs[0]) # type: ignore
+        self.assertEqual(reaper.reap(now=131.5), 1)
+        self.assertEqual(Stub.closed, 1)
+        self.assertEqual(len(reaper), 2)
+
+class TestClientHeartbeat(unittest.TestCase):
+    """Server e Client de verdade: só quem manda heartbeat sobrevive ao `reap`."""
+
+    def test_heartbeating_client_survives(self) -> None:
+        transport = InProcessTransport()
+        # Heartbeats acelerados passam do limite de mensagens normal
+        server = Server(
+            transport=transport, idle_timeout=0.5, game_manager=GameManager(),
+            rate_limits={}, rate_limit_default=None
+        )
+        thread = Thread(target=server.start_server, daemon=True)
+        thread.start()
+        alive = Client(transport=transport, heartbeat_interval=0.1)
+        silent = Client(transport=transport, heartbeat_interval=None)
+        try:
+            joined = alive.request(ConnectionActions.JOIN, {"name": "Sato", "symbol": "o"}, 5.0)
+            self.assertEqual(joined["type"], ServerWarning.SESSION_OPENED.value)
+            silent.request(ConnectionActions.JOIN, {"name": "Diogo", "symbol": "x"}, 5.0)
+            sleep(1.0)
+            server.reaper.reap()
+            self.assertIsNone(silent.receive(5.0))
+            ack = alive.request(ConnectionActions.HEARTBEAT, {}, 5.0)
+            self.assertEqual(ack["type"], ServerWarning.HEARTBEAT_ACK.value)
+            self.assertEqual(len(server.reaper), 1)
+        finally:
+            alive.close()
+            silent.close()
+            server.stop()
+            thread.join(5.0)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestIdleReaper, TestClientHeartbeat):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,171 @@
+import unittest
+import os
+import sys
+import tempfile
+from threading import Thread
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.game_manager import GameManager
+from src.storage.journal import (
+    ACTION_CODES, ACTIONS_BY_CODE, MAX_NAME_BYTES, STATUS_CODES, VARIANT_CODES, MatchJournal
+)
+from src.utils.timer_wheel import TimerWheel
+from src.core.config import GameSymbols, GameVariant
+from src.protocols.enums import GameActions, GameStatus
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestMatchJournal(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+
+    def _play(self, journal: MatchJournal, room_id: int, slots: list, size: int = 3) -> GameManager:
+        gm = GameManager(size)
+        journal.attach(gm, room_id)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.apply_action({"type": GameActions.START, "payload": {}})
+        gm.start_game()
+        gm.switch_current_player()
+        for slot in slots:
+            gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+        return gm
+
+    def test_recover_from_journal(self) -> None:
+        journal = MatchJournal(self.directory, shards=2)
+        gm = self._play(journal, 7, [0, 4, 8])
+        journal.close()
+
+        rooms = MatchJournal(self.directory, shards=2).recover()
+        recovered = rooms[7]
+        self.assertListEqual(recovered.game.board, gm.game.board)
+        self.assertEqual(recovered.status, GameStatus.ONGOING)
+        self.assertListEqual(
+            [player["name"] for player in recovered.players],
+            ["Sato", "Diogo"]
+        )
+
+    def test_recover_from_snapshot_and_tail(self) -> None:
+        journal = MatchJournal(self.directory, shards=1, snapshot_interval=5)
+        gm = self._play(journal, 3, [0, 1, 2, 3, 4])
+        journal.close()
+        self.assertTrue(os.path.exists(journal.snapshot_path(0)))
+
+        recovered = MatchJournal(self.directory, shards=1, snapshot_interval=5).recover()[3]
+        self.assertListEqual(recovered.game.board, gm.game.board)
+        self.assertEqual(recovered.game.current_player, gm.game.current_player)
+        self.assertEqual(recovered.next_player_id, gm.next_player_id)
+
+    def test_torn_tail_is_ignored(self) -> None:
+        journal = MatchJournal(self.directory, shards=1)
+        gm = self._play(journal, 0, [4])
+        journal.close()
+        with open(journal.journal_path(0), "ab") as file:
+            file.write(b"\x01\x02\x03")
+
+        recovered = MatchJournal(self.directory, shards=1).recover()[0]
+        self.assertListEqual(recovered.game.board, gm.game.board)
+
+    def test_idle_shard_is_synced(self) -> None:
+        clock = FakeClock()
+        wheel = TimerWheel(clock=clock)
+        journal = MatchJournal(self.directory, shards=2, group_commit_size=1000, group_commit_interval=0.5)
+        journal.schedule_syncs(wheel)
+        self._play(journal, 1, [4])
+        path = journal.journal_path(1)
+        self.assertEqual(os.path.getsize(path), 0)
+        clock.now += 0.6
+        wheel.advance()
+        synced = os.path.getsize(path)
+        self.assertGreater(synced, 0)
+        journal.close()
+        self.assertEqual(os.path.getsize(path), synced)
+        self.assertEqual(len(wheel), 0)
+
+    def test_large_board_slots(self) -> None:
+        journal = MatchJournal(self.directory, shards=1)
+        gm = self._play(journal, 5, [130, 143, 0], size=12)
+        journal.close()
+        recovered = MatchJournal(self.directory, shards=1).recover()[5]
+        self.assertListEqual(recovered.game.board, gm.game.board)
+        self.assertListEqual([recovered.game.board[i] for i in (130, 143, 0)], [0, 1, 0])
+
+    def test_codes_are_frozen(self) -> None:
+        # Mudar estes valores invalida os journals e snapshots em disco
+        self.assertEqual(ACTION_CODES[GameActions.MAKE_MOVEMENT], 0)
+        self.assertEqual(ACTION_CODES[GameActions.HINT], 4)
+        self.assertEqual(STATUS_CODES[GameStatus.FINISHED], 3)
+        self.assertEqual(VARIANT_CODES[GameVariant.ULTIMATE], 1)
+        self.assertIs(ACTIONS_BY_CODE[3], GameActions.RESTART)
+        with self.assertRaises(TypeError):
+            ACTION_CODES[GameActions.EXIT] = 9 # type: ignore
+
+    def test_snapshot_waits_for_room_lock(self) -> None:
+        journal = MatchJournal(self.directory, shards=1, snapshot_interval=3)
+        gm = self._play(journal, 4, [0])
+        # O snapshot fica pendente: a thread da sala não o tira
+        self.assertFalse(os.path.exists(journal.snapshot_path(0)))
+        with gm.lock:
+            snapshot = Thread(target=journal.take_due_snapshots)
+            snapshot.start()
+            snapshot.join(timeout=0.1)
+            self.assertTrue(snapshot.is_alive())
+            gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": 4}})
+        snapshot.join(timeout=1)
+        self.assertTrue(os.path.exists(journal.snapshot_path(0)))
+        gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": 8}})
+        journal.close()
+
+        recovered = MatchJournal(self.directory, shards=1).recover()[4]
+        self.assertListEqual(recovered.game.board, gm.game.board)
+        self.assertEqual(recovered.game.current_player, gm.game.current_player)
+        self.assertListEqual([p.id for p in recovered.players], [p.id for p in gm.players])
+
+    def test_reset_room_recovers_empty(self) -> None:
+        journal = MatchJournal(self.directory, shards=1, snapshot_interval=2)
+        gm = self._play(journal, 6, [0, 4])
+        gm.reset_all()
+        journal.close()
+        recovered = MatchJournal(self.directory, shards=1).recover()[6]
+        self.assertListEqual(recovered.players, [])
+        self.assertEqual(recovered.status, GameStatus.WAITING)
+
+    def test_multibyte_name_is_cut_on_character(self) -> None:
+        name = "a" + "é" * 200
+        for snapshot_interval in (1000, 1):
+            with self.subTest(snapshot_interval=snapshot_interval):
+                directory = os.path.join(self.directory, str(snapshot_interval))
+                journal = MatchJournal(directory, shards=1, snapshot_interval=snapshot_interval)
+                gm = GameManager()
+                journal.attach(gm, 2)
+                gm.add_player(name, GameSymbols.CIRCLE, None)
+                journal.close()
+
+                recovered = MatchJournal(directory, shards=1).recover()[2]
+                recovered_name = recovered.players[0]["name"]
+                self.assertTrue(name.startswith(recovered_name))
+                self.assertLessEqual(len(recovered_name.encode()), MAX_NAME_BYTES)
+                self.assertGreater(len(recovered_name), 100)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestMatchJournal)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
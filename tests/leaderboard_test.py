@@ -0,0 +1,135 @@
+import unittest
+import os
+import sys
+import random
+import tempfile
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.leaderboard import FenwickTree, Leaderboard
+from src.managers.game_manager import GameManager
+from src.utils.timer_wheel import TimerWheel
+from src.core.config import GameSymbols
+from src.protocols.enums import GameActions
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestFenwickTree(unittest.TestCase):
+
+    def test_against_list(self) -> None:
+        rng = random.Random(7)
+        tree, counts = FenwickTree(50), [0] * 50
+        for _ in range(200):
+            i = rng.randrange(50)
+            tree.add(i, 1)
+            counts[i] += 1
+        for i in range(50):
+            self.assertEqual(tree.prefix(i), sum(counts[:i + 1]))
+        for k in range(1, sum(counts) + 1):
+            position = tree.find(k)
+            self.assertGreaterEqual(sum(counts[:position + 1]), k)
+            self.assertLess(sum(counts[:position]), k)
+
+class TestLeaderboard(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.board = Leaderboard()
+
+    def test_results_and_streaks(self) -> None:
+        for _ in range(3):
+            self.board.record_result("Sato", "Diogo", 1.0)
+        self.board.record_result("Sato", "Diogo", 0.5)
+        self.board.record_result("Diogo", "Sato", 1.0)
+        sato = self.board.get("Sato")
+        self.assertEqual((sato.wins, sato.losses, sato.draws), (3, 1, 1))
+        self.assertEqual(sato.streak, -1)
+        self.assertEqual(sato.best_streak, 3)
+        self.assertGreater(sato.rating, self.board.get("Diogo").rating)
+        self.assertEqual(sato.rating + self.board.get("Diogo").rating, 2400)
+
+    def test_rank_and_top(self) -> None:
+        self.board.record_result("a", "b", 1.0)
+        self.board.record_result("c", "d", 1.0)
+        self.board.record_result("a", "c", 1.0)
+        ranking = [(rank, stats.name) for rank, stats in self.board.top(10)]
+        self.assertEqual(ranking[0], (1, "a"))
+        self.assertEqual(self.board.rank("a"), 1)
+        self.assertEqual(self.board.rank(ranking[-1][1]), ranking[-1][0])
+        self.assertEqual(len(self.board.top(2)), 2)
+        self.assertIsNone(self.board.rank("z"))
+
+    def test_ties_share_rank(self) -> None:
+        self.board.record_result("a", "b", 0.5)
+        self.assertListEqual([rank for rank, _ in self.board.top(2)], [1, 1])
+
+    def test_manager_hook(self) -> None:
+        gm = GameManager()
+        self.board.attach(gm)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.start_game()
+        gm.switch_current_player()
+        for slot in (0, 3, 1, 4, 2):
+            gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+        gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        self.assertEqual(self.board.get("Sato").wins, 1)
+        self.assertEqual(self.board.get("Diogo").losses, 1)
+
+    def test_abandoned_match_is_not_rated(self) -> None:
+        gm = GameManager()
+        self.board.attach(gm)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.start_game()
+        gm.switch_current_player()
+        gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        self.assertIsNone(self.board.get("Sato"))
+        gm.start_game()
+        gm.switch_current_player()
+        gm.forfeit(gm.get_player_id(GameSymbols.CROSS))
+        gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        self.assertEqual(self.board.get("Sato").wins, 1)
+        self.assertEqual(self.board.get("Diogo").losses, 1)
+        self.assertEqual(self.board.get("Diogo").draws, 0)
+
+    def test_periodic_save_and_load(self) -> None:
+        clock = FakeClock()
+        wheel = TimerWheel(clock=clock)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "leaderboard.json")
+            self.board.schedule_saves(wheel, path, interval=5.0)
+            self.board.record_result("Sato", "Diogo", 1.0)
+            clock.now = 6.0
+            wheel.advance()
+            self.assertFalse(self.board.dirty)
+            loaded = Leaderboard.load(path)
+            self.assertEqual(loaded.get("Sato").rating, self.board.get("Sato").rating)
+            self.assertEqual(loaded.rank("Diogo"), 2)
+            self.assertEqual(len(wheel), 1)
+
+    def test_failed_save_stays_dirty(self) -> None:
+        self.board.record_result("Sato", "Diogo", 1.0)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "missing", "leaderboard.json")
+            with self.assertRaises(OSError):
+                self.board.save(path)
+            self.assertTrue(self.board.dirty)
+            self.assertTrue(self.board.save(os.path.join(tmp, "leaderboard.json")))
+            self.assertFalse(self.board.dirty)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestFenwickTree, TestLeaderboard):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
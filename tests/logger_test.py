@@ -0,0 +1,66 @@
+import unittest
+import os
+import sys
+import io
+import json
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.utils.logger import StructuredLogger
+
+class TestStructuredLogger(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.stream = io.StringIO()
+
+    def _lines(self, logger: StructuredLogger):
+        logger.close()
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_writes_json_lines(self) -> None:
+        logger = StructuredLogger(self.stream, rate_caps={})
+        logger.info("client_connected", addr=("127.0.0.1", 5000))
+        logger.debug("ignored")
+        lines = self._lines(logger)
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["event"], "client_connected")
+        self.assertEqual(lines[0]["level"], "info")
+        self.assertListEqual(lines[0]["addr"], ["127.0.0.1", 5000])
+
+    def test_rate_cap(self) -> None:
+        logger = StructuredLogger(self.stream, rate_caps={"noisy": 3})
+        results = [logger.info("noisy", i=i) for i in range(10)]
+        self.assertEqual(sum(results), 3)
+        self.assertEqual(logger.capped, 7)
+        self.assertEqual(len(self._lines(logger)), 3)
+
+    def test_sampling(self) -> None:
+        logger = StructuredLogger(self.stream, sample_rates={"never": 0.0, "always": 1.0}, rate_caps={})
+        logger.info("never")
+        logger.info("always")
+        self.assertEqual(logger.sampled_out, 1)
+        self.assertEqual([line["event"] for line in self._lines(logger)], ["always"])
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        class SlowStream(io.StringIO):
+            def write(self, s: str) -> int:
+                import time
+                time.sleep(0.01)
+                return super().write(s)
+        logger = StructuredLogger(SlowStream(), max_queue=2, rate_caps={})
+        for i in range(50):
+            logger.info("event", i=i)
+        self.assertGreater(logger.dropped, 0)
+        logger.close()
+        self.assertEqual(logger.written + logger.dropped, 50)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestStructuredLogger)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+import tempfile
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.storage.match_store import MatchStore
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols
+from src.protocols.enums import GameActions
+
+class TestMatchStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = MatchStore(os.path.join(self.tmp.name, "matches.db"), batch_size=8)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.tmp.cleanup()
+
+    def _room(self) -> GameManager:
+        gm = GameManager()
+        self.store.attach(gm)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.start_game()
+        gm.switch_current_player()
+        return gm
+
+    def _play(self, gm: GameManager, slots) -> None:
+        for slot in slots:
+            gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+
+    def test_finished_match_is_stored(self) -> None:
+        gm = self._room()
+        self._play(gm, (0, 3, 1, 4, 2))
+        self.store.flush()
+        [match] = self.store.recent()
+        self.assertListEqual(match["moves"], [0, 3, 1, 4, 2])
+        self.assertEqual(match["winner"], 0)
+        self.assertEqual(match["variant"], "classic")
+        self.assertGreaterEqual(match["duration"], 0)
+        self.assertListEqual(match["players"], [[0, "Sato", "o"], [1, "Diogo", "x"]])
+
+    def test_batches_and_restarts(self) -> None:
+        gm = self._room()
+        for _ in range(5):
+            self._play(gm, (0, 3, 1, 4, 2))
+            gm.start_game()
+            gm.switch_current_player()
+        gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        self.store.flush()
+        self.assertEqual(self.store.written, 6)
+        self.assertLessEqual(self.store.batches, 6)
+        self.assertListEqual(self.store.recent(1)[0]["moves"], [])
+
+    def test_not_started_is_not_stored(self) -> None:
+        gm = GameManager()
+        self.store.attach(gm)
+        gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        self.assertFalse(self.store.submit(gm))
+        self.store.flush()
+        self.assertEqual(self.store.written, 0)
+
+    def test_full_queue_drops(self) -> None:
+        store = MatchStore(os.path.join(self.tmp.name, "small.db"), max_queue=1)
+        gm = self._room()
+        gm.store = store
+        store.close() # Sem a thread, a fila não esvazia
+        self._play(gm, (0, 3, 1, 4, 2))
+        gm.start_game()
+        gm.switch_current_player()
+        self._play(gm, (0, 3, 1, 4, 2))
+        self.assertEqual(store.dropped, 1)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestMatchStore)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.matchmaking import Matchmaker
+from src.core.config import GameSymbols, GameVariant
+from src.protocols.enums import GameStatus
+
+class TestMatchmaker(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.matches = []
+        self.mm = Matchmaker(
+            rating_bucket=100,
+            on_match=lambda room, first, second: self.matches.append(room)
+        )
+
+    def test_pairs_and_starts_match(self) -> None:
+        first = self.mm.join("Sato", rating=1000)
+        self.assertIsNone(first.room)
+        second = self.mm.join("Diogo", rating=1050)
+        self.assertIs(first.room, second.room)
+        room = second.room
+        self.assertTrue(room.is_current_state(GameStatus.ONGOING))
+        self.assertEqual(room.get_player(first.player_id).symbol, GameSymbols.CIRCLE)
+        self.assertEqual(room.get_player(second.player_id).symbol, GameSymbols.CROSS)
+        self.assertIsNotNone(room.get_current_player())
+        self.assertEqual(self.mm.time_to_match.count, 2)
+        self.assertListEqual(self.matches, [room])
+
+    def test_neighbour_bucket(self) -> None:
+        self.mm.join("Sato", rating=1000)
+        self.assertIsNotNone(self.mm.join("Diogo", rating=1150).room)
+
+    def test_distant_ratings_wait(self) -> None:
+        self.mm.join("Sato", rating=1000)
+        self.assertIsNone(self.mm.join("Diogo", rating=1400).room)
+        self.assertEqual(len(self.mm), 2)
+
+    def test_variants_do_not_mix(self) -> None:
+        self.mm.join("Sato", variant=GameVariant.ULTIMATE)
+        self.assertIsNone(self.mm.join("Diogo").room)
+
+    def test_cancelled_ticket_is_skipped(self) -> None:
+        first = self.mm.join("Sato")
+        self.assertTrue(self.mm.cancel(first))
+        second = self.mm.join("Diogo")
+        self.assertIsNone(second.room)
+        self.assertIsNotNone(self.mm.join("Input").room)
+        self.assertIsNone(first.room)
+        self.assertEqual(len(self.mm), 0)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestMatchmaker)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+from time import perf_counter
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.ai.mcts import MCTSBot
+from src.core.config import GameSymbols
+from src.managers.game_manager import GameManager
+from src.protocols.enums import GameActions, GameStatus
+
+class TestMCTSBot(unittest.TestCase):
+
+    def test_takes_immediate_win(self) -> None:
+        #   o | o | o | -
+        #   x | x | x | -
+        #   - | - | - | -
+        #   - | - | - | -
+        board = [0, 0, 0, None, 1, 1, 1, None] + [None] * 8
+        bot = MCTSBot(time_budget=1, max_iterations=2000, seed=1)
+        self.assertEqual(bot.choose_move(board, 0), 3)
+
+    def test_reuses_subtree(self) -> None:
+        bot = MCTSBot(time_budget=1, max_iterations=2000, seed=1)
+        board = [None] * 16
+        board[bot.choose_move(board, 0)] = 0
+        reply = board.index(None)
+        board[reply] = 1
+        root = bot._root # pylint: disable=protected-access
+        subtree = next(child for child in root.children if child.move == reply)
+        visits = subtree.visits
+        bot.choose_move(board, 0)
+        self.assertEqual(subtree.visits, visits + 2000)
+
+    def test_move_time_is_capped(self) -> None:
+        bot = MCTSBot(time_budget=10, max_move_time=0.05, seed=1)
+        start = perf_counter()
+        bot.choose_move([None] * 25, 0)
+        self.assertLess(perf_counter() - start, 0.5)
+
+    def test_bots_play_full_match(self) -> None:
+        gm = GameManager(size=4)
+        gm.add_bot("Bot 1", GameSymbols.CIRCLE, MCTSBot(max_iterations=50, seed=1))
+        gm.add_bot("Bot 2", GameSymbols.CROSS, MCTSBot(max_iterations=50, seed=2))
+        gm.apply_action({"type": GameActions.START, "payload": {}})
+        gm.start_game()
+        gm.switch_current_player()
+        moves = 0
+        while gm.play_bot_turn() is not None:
+            moves += 1
+        self.assertTrue(gm.is_current_state(GameStatus.FINISHED))
+        self.assertLessEqual(moves, 16)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestMCTSBot)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,76 @@
+import unittest
+import os
+import sys
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols, GameVariant
+from src.protocols.state_sync import state_delta, track
+from src.utils.memory_utils import room_memory_report
+from src.utils.timer_wheel import TimerWheel
+
+class TestRoomMemory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.gm = GameManager()
+        self.gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        self.gm.add_player("Diogo", GameSymbols.CROSS, None)
+
+    def test_objects_have_no_dict(self) -> None:
+        ultimate = GameManager(variant=GameVariant.ULTIMATE)
+        for obj in (self.gm, self.gm.game, self.gm.players[0], ultimate.game):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_player_keeps_key_access(self) -> None:
+        player = self.gm.players[0]
+        self.assertEqual(player["symbol"], player.symbol)
+        with self.assertRaises(KeyError):
+            player["unknown"] # pylint: disable=pointless-statement
+
+    def test_room_report(self) -> None:
+        report = room_memory_report(self.gm)
+        self.assertEqual(report["total"], sum(v for k, v in report.items() if k != "total"))
+        self.assertEqual(report["bots"], 0)
+        # Antes dos slots, a mesma sala passava de 1400 bytes (sem a trava)
+        self.assertLess(report["total"] - report["lock"], 800)
+
+    def test_report_counts_moves(self) -> None:
+        before = room_memory_report(self.gm)
+        self.gm.start_game()
+        self.gm.switch_current_player()
+        for slot in (0, 4, 8):
+            response = self.gm.apply_action({"type": "make_movement", "payload": {"slot": slot}})
+            self.assertTrue(response["payload"]["success"])
+        after = room_memory_report(self.gm)
+        self.assertEqual(len(self.gm.moves), 3)
+        self.assertGreater(after["moves"], before["moves"])
+        self.assertEqual(after["total"] - before["total"], after["moves"] - before["moves"])
+
+    def test_report_counts_clock_and_history(self) -> None:
+        self.assertEqual(room_memory_report(self.gm)["clock"], 0)
+        self.gm.set_time_control(TimerWheel(clock=lambda: 0.0), move_time=5.0)
+        self.gm.start_game()
+        self.gm.switch_current_player()
+        track(self.gm)
+        before = room_memory_report(self.gm)
+        self.assertGreater(before["lock"], 0)
+        self.assertGreater(before["clock"], 0)
+        self.assertGreater(before["state_tracker"], 0)
+        for slot in (0, 4, 8):
+            self.gm.apply_action({"type": "make_movement", "payload": {"slot": slot}})
+            state_delta(self.gm)
+        after = room_memory_report(self.gm)
+        self.assertEqual(len(self.gm.state_tracker.history), 3)
+        self.assertGreater(after["state_tracker"], before["state_tracker"])
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestRoomMemory)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,74 @@
+import unittest
+import os
+import sys
+from time import perf_counter
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.ai.parallel import ParallelBot, ParallelSearch
+from src.core.bitboard import pack_board
+
+class TestParallelSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.trees = ParallelSearch(workers=2, mode="trees", max_iterations=300, seed=1)
+        cls.split = ParallelSearch(workers=2, mode="split", max_iterations=300, seed=1)
+
+    def setUp(self) -> None:
+        #   o | o | - | -
+        #   x | x | - | -
+        #   o | x | - | -
+        #   - | - | - | -
+        self.board = [0, 0, None, None, 1, 1, None, None, 0, 1] + [None] * 6
+
+    def test_trees_merge_visits(self) -> None:
+        statistics = self.trees.search(pack_board([None] * 9, 0), 3, 1)
+        self.assertEqual(len(statistics), 9)
+        # O limite de simulações é da busca toda, não de cada processo
+        self.assertEqual(sum(visits for visits, _ in statistics.values()), 300)
+
+    def test_split_covers_all_moves(self) -> None:
+        statistics = self.split.search(pack_board([None] * 9, 0), 3, 1)
+        self.assertSetEqual(set(statistics), set(range(9)))
+
+    def test_bot_returns_legal_move(self) -> None:
+        for search in (self.trees, self.split):
+            move = ParallelBot(search, time_budget=1).choose_move(self.board, 0)
+            self.assertIsNone(self.board[move])
+
+    def test_timeout_returns_partial_result(self) -> None:
+        slow = ParallelSearch(workers=1, mode="trees", seed=1)
+        try:
+            slow.search(pack_board([None] * 9, 0), 3, 0.01) # Sobe o pool
+            start = perf_counter()
+            statistics = slow.search(pack_board([None] * 9, 0), 3, 2.0, timeout=0.2)
+            self.assertLess(perf_counter() - start, 1.0)
+            self.assertDictEqual(statistics, {})
+            self.assertEqual(slow.best_move(pack_board([0] + [None] * 8, 1), 3, 2.0, timeout=0.0), 1)
+        finally:
+            slow.close()
+
+    def test_split_ignores_rarely_visited_moves(self) -> None:
+        search = ParallelSearch(workers=1, mode="split")
+        statistics = {0: (1, 1.0), 4: (60, 40.0), 8: (60, 30.0)}
+        search.search = lambda *_: statistics # type: ignore
+        self.assertEqual(search.best_move(pack_board([None] * 9, 0), 3, 1), 4)
+        statistics = {0: (3, 3.0), 4: (5, 1.0)}
+        self.assertEqual(search.best_move(pack_board([None] * 9, 0), 3, 1), 4)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.trees.close()
+        cls.split.close()
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestParallelSearch)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,91 @@
+import unittest
+import os
+import sys
+import tempfile
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.ai.position_db import MAX_BOARD_SIZE, PositionDatabase, build_solved_database, write_database
+from src.ai.hint_cache import HintCache, open_position_database
+from src.ai.solver import WIN, DRAW
+from src.core.bitboard import pack_board, unpack_board, symmetries
+from src.core.game import TicTacToe
+
+class TestPositionDatabase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.temp_dir.name, "positions.bin")
+        build_solved_database(cls.path)
+
+    def setUp(self) -> None:
+        self.db = PositionDatabase(self.path)
+        self.game = TicTacToe()
+
+    def test_pack_roundtrip(self) -> None:
+        self.game.board = [0, None, 1, None, 0, None, None, None, 1]
+        self.game.current_player = 1
+        board, player = unpack_board(self.game.pack())
+        self.assertListEqual(board, self.game.board)
+        self.assertEqual(player, 1)
+
+    def test_empty_board_is_draw(self) -> None:
+        outcome, _ = self.db.lookup(self.game.pack())
+        self.assertEqual(outcome, DRAW)
+
+    def test_takes_immediate_win(self) -> None:
+        #   o | o | -
+        #   - | x | -
+        #   - | x | -
+        self.game.board = [0, 0, None, None, 1, None, None, 1, None]
+        self.game.current_player = 0
+        self.assertTupleEqual(self.db.lookup(self.game.pack()), (WIN, 2))
+
+    def test_symmetric_positions_agree(self) -> None:
+        board = [0, 0, None, None, 1, None, None, 1, None]
+        for perm in symmetries(3):
+            rotated = [None] * 9
+            for i, cell in enumerate(board):
+                rotated[perm[i]] = cell
+            outcome, move = self.db.lookup(pack_board(rotated, 0))
+            self.assertEqual(outcome, WIN)
+            self.assertEqual(move, perm[2])
+
+    def test_missing_section(self) -> None:
+        self.assertIsNone(self.db.lookup(0, size=4))
+
+    def test_oversized_board_is_rejected(self) -> None:
+        path = os.path.join(self.temp_dir.name, "large.bin")
+        with self.assertRaises(ValueError):
+            write_database(path, {MAX_BOARD_SIZE + 1: [(0, DRAW, 0)]})
+        self.assertFalse(os.path.exists(path + ".tmp"))
+        self.assertIsNone(self.db.lookup(0, size=6))
+
+    def test_hint_cache_opens_database(self) -> None:
+        self.assertIsNone(open_position_database(os.path.join(self.temp_dir.name, "missing.bin")))
+        database = open_position_database(self.path)
+        self.assertIsNotNone(database)
+        cache = HintCache(database=database)
+        self.game.board = [0, 0, None, None, 1, None, None, 1, None]
+        self.game.current_player = 0
+        self.assertEqual(cache.get_hint(self.game.pack()), 2)
+        database.close()
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestPositionDatabase)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,80 @@
+import unittest
+import os
+import sys
+import socket
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.common.rate_limiter import RateLimiter
+from src.common.connection_handler import ConnectionHandler
+from src.protocols.enums import GameActions
+from src.protocols.errors import GameError
+from src.protocols.message_protocol import create_message
+from src.protocols.serialize import deserialize
+from src.protocols.framing import recv_frame
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(
+            {"make_movement": (2.0, 3)}, default=(1.0, 1), clock=self.clock
+        )
+
+    def test_burst_then_refill(self) -> None:
+        results = [self.limiter.allow("make_movement") for _ in range(5)]
+        self.assertListEqual(results, [True, True, True, False, False])
+        self.clock.now = 0.5
+        self.assertTrue(self.limiter.allow("make_movement"))
+        self.assertFalse(self.limiter.allow("make_movement"))
+        self.assertDictEqual(self.limiter.throttled, {"make_movement": 3})
+
+    def test_refill_is_capped(self) -> None:
+        self.clock.now = 100.0
+        results = [self.limiter.allow("make_movement") for _ in range(4)]
+        self.assertListEqual(results, [True, True, True, False])
+
+    def test_unknown_types_share_default_bucket(self) -> None:
+        self.assertTrue(self.limiter.allow("foo"))
+        self.assertFalse(self.limiter.allow("bar"))
+        self.assertEqual(self.limiter.total_throttled, 1)
+
+    def test_unlimited_without_default(self) -> None:
+        limiter = RateLimiter({}, default=None, clock=self.clock)
+        self.assertTrue(all(limiter.allow("restart") for _ in range(100)))
+
+class TestHandlerLimit(unittest.TestCase):
+
+    def test_throttled_message_gets_error(self) -> None:
+        server_side, client_side = socket.socketpair()
+        limiter = RateLimiter({"restart": (0.001, 1)}, default=None)
+        handler = ConnectionHandler(server_side, ("local", 0), rate_limiter=limiter)
+        message = create_message(GameActions.RESTART, {})
+        handler.handle_message(message)
+        first = deserialize(recv_frame(client_side))
+        handler.handle_message(message)
+        second = deserialize(recv_frame(client_side))
+        self.assertNotEqual(first["type"], GameError.RATE_LIMITED.value)
+        self.assertEqual(second["type"], GameError.RATE_LIMITED.value)
+        self.assertFalse(second["payload"]["success"])
+        handler.release()
+        client_side.close()
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestRateLimiter, TestHandlerLimit):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
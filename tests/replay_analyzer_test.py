@@ -0,0 +1,104 @@
+import unittest
+import os
+import sys
+import tempfile
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.tools.replay_analyzer import (
+    GameHistory, ILLEGAL_MOVE, MOVE_AFTER_END, WINNER_MISMATCH,
+    analyze, analyze_files, iter_histories
+)
+from src.managers.game_manager import GameManager
+from src.storage.journal import MatchJournal
+from src.storage.match_store import MatchStore
+from src.core.config import GameSymbols
+from src.protocols.enums import GameActions
+
+# O abre no canto, X responde na borda (erro) e perde
+BLUNDER = [0, 1, 4, 2, 8]
+DRAW = [4, 0, 8, 2, 1, 7, 6, 3, 5]
+
+class TestReplayAnalyzer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _play(self, gm: GameManager, games) -> None:
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        for slots in games:
+            gm.start_game()
+            gm.switch_current_player()
+            for slot in slots:
+                gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+        gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+
+    def _journal(self, name: str, games) -> str:
+        directory = os.path.join(self.tmp.name, name)
+        journal = MatchJournal(directory, shards=1)
+        gm = GameManager()
+        journal.attach(gm, 1)
+        self._play(gm, games)
+        journal.close()
+        return journal.journal_path(0)
+
+    def test_journal_stats(self) -> None:
+        path = self._journal("a", [BLUNDER, DRAW])
+        games = list(iter_histories(path))
+        self.assertListEqual([game.moves for game in games], [BLUNDER, DRAW])
+        stats = analyze(games)
+        self.assertEqual(stats.games, 2)
+        self.assertEqual(stats.flagged, 0)
+        self.assertEqual(stats.judged_moves, 14)
+        self.assertEqual(stats.mistakes, 1)
+        self.assertEqual(stats.to_dict()["average_length"], 7.0)
+        self.assertEqual(stats.openings[(0, 1)], 1)
+
+    def test_store_source(self) -> None:
+        path = os.path.join(self.tmp.name, "matches.db")
+        store = MatchStore(path)
+        gm = GameManager()
+        store.attach(gm)
+        self._play(gm, [BLUNDER, [4, 0, 8]])
+        store.close()
+        stats = analyze(iter_histories(path))
+        self.assertEqual(stats.games, 2)
+        self.assertEqual(stats.flagged, 0)
+        self.assertEqual(stats.mistakes, 1)
+
+    def test_flags(self) -> None:
+        occupied = GameHistory("x", "1")
+        occupied.moves = [0, 0]
+        late = GameHistory("x", "2")
+        late.moves = [0, 3, 1, 4, 2, 5]
+        wrong = GameHistory("x", "3")
+        wrong.moves = [0, 3, 1, 4, 2]
+        wrong.winner, wrong.finished = GameSymbols.CROSS, True
+        stats = analyze([occupied, late, wrong])
+        self.assertEqual(stats.flagged, 3)
+        self.assertEqual(stats.flags[ILLEGAL_MOVE], 1)
+        self.assertEqual(stats.flags[MOVE_AFTER_END], 1)
+        self.assertEqual(stats.flags[WINNER_MISMATCH], 1)
+        self.assertEqual(stats.judged_moves, 0)
+
+    def test_parallel_files(self) -> None:
+        paths = [self._journal("a", [BLUNDER]), self._journal("b", [DRAW, BLUNDER])]
+        stats = analyze_files(paths, workers=2)
+        self.assertEqual(stats.games, 3)
+        self.assertEqual(stats.mistakes, 2)
+        self.assertDictEqual(stats.to_dict(), analyze_files(paths, workers=1).to_dict())
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestReplayAnalyzer)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
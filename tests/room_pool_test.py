@@ -0,0 +1,128 @@
+import unittest
+import os
+import sys
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.room_pool import RoomPool
+from src.managers.session_manager import SessionManager
+from src.utils.timer_wheel import TimerWheel
+from src.core.config import GameSymbols, GameVariant
+from src.protocols.enums import GameActions, GameStatus
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestRoomPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pool = RoomPool(high_water=1)
+
+    def _play(self):
+        gm = self.pool.acquire()
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.start_game()
+        gm.switch_current_player()
+        gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": 4}})
+        return gm
+
+    def test_released_room_is_reset_and_reused(self) -> None:
+        gm = self._play()
+        board = gm.game.board
+        self.assertTrue(self.pool.release(gm))
+        reused = self.pool.acquire()
+        self.assertIs(reused, gm)
+        self.assertIs(reused.game.board, board)
+        self.assertFalse(reused.board_was_used())
+        self.assertListEqual(reused.players, [])
+        self.assertTrue(reused.is_current_state(GameStatus.WAITING))
+        self.assertDictEqual(
+            self.pool.stats(),
+            {"created": 1, "reused": 1, "dropped": 0, "free": 0}
+        )
+
+    def test_high_water(self) -> None:
+        first, second = self.pool.acquire(), self.pool.acquire()
+        self.assertTrue(self.pool.release(first))
+        self.assertFalse(self.pool.release(second))
+        self.assertEqual(self.pool.dropped, 1)
+
+    def test_dropped_room_is_reset_and_clock_stopped(self) -> None:
+        clock = FakeClock()
+        wheel = TimerWheel(clock=clock)
+        self.assertTrue(self.pool.release(self.pool.acquire()))
+        gm = self.pool.acquire()
+        gm.set_time_control(wheel, move_time=5.0)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.start_game()
+        gm.switch_current_player()
+        self.pool.release(self.pool.acquire())
+        self.assertEqual(len(wheel), 1)
+        self.assertFalse(self.pool.release(gm))
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(gm.clock)
+        self.assertListEqual(gm.players, [])
+        clock.now += 10.0
+        wheel.advance()
+        self.assertIsNone(gm.winner)
+        self.assertTrue(gm.is_current_state(GameStatus.WAITING))
+
+    def test_release_if_idle(self) -> None:
+        gm = self._play()
+        self.assertFalse(self.pool.release_if_idle(gm))
+        gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        self.assertTrue(self.pool.release_if_idle(gm))
+
+    def test_double_release_is_ignored(self) -> None:
+        gm = self.pool.acquire()
+        self.assertIs(gm.pool, self.pool)
+        self.assertTrue(self.pool.release(gm))
+        self.assertFalse(self.pool.release(gm))
+        self.assertIsNone(gm.pool)
+        self.assertEqual(self.pool.stats()["free"], 1)
+        self.assertIs(self.pool.acquire(), gm)
+        self.assertIsNot(self.pool.acquire(), gm)
+
+    def test_room_returns_when_last_player_leaves(self) -> None:
+        wheel = TimerWheel(clock=FakeClock())
+        sessions = SessionManager(wheel=wheel)
+        gm = self.pool.acquire()
+        _, session = sessions.open(gm, "Sato", GameSymbols.CIRCLE, None, object())
+        self.assertEqual(len(self.pool), 0)
+        sessions.close(session)
+        self.assertEqual(len(self.pool), 1)
+        self.assertIsNone(gm.pool)
+
+    def test_room_returns_after_clock_forfeit(self) -> None:
+        clock = FakeClock()
+        wheel = TimerWheel(clock=clock)
+        gm = self._play()
+        gm.set_time_control(wheel, move_time=5.0)
+        gm.switch_current_player()
+        clock.now += 10.0
+        wheel.advance()
+        self.assertEqual(len(self.pool), 1)
+        self.assertTrue(gm.is_current_state(GameStatus.WAITING))
+
+    def test_variants_are_kept_apart(self) -> None:
+        self.pool.prefill(1, variant=GameVariant.ULTIMATE)
+        self.assertEqual(self.pool.acquire().game.variant, GameVariant.CLASSIC)
+        self.assertEqual(self.pool.acquire(variant=GameVariant.ULTIMATE).game.variant, GameVariant.ULTIMATE)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestRoomPool)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
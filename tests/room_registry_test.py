@@ -0,0 +1,82 @@
+import unittest
+import os
+import sys
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.room_registry import RoomRegistry
+from src.managers.room_pool import RoomPool
+from src.managers.matchmaking import Matchmaker
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols
+from src.protocols.enums import GameActions, GameStatus
+
+class TestRoomRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.registry = RoomRegistry()
+
+    def _room(self, players: int = 0) -> GameManager:
+        room = GameManager()
+        self.registry.register(room)
+        for name, symbol in (("Sato", GameSymbols.CIRCLE), ("Diogo", GameSymbols.CROSS))[:players]:
+            room.add_player(name, symbol, None)
+        return room
+
+    def test_register_assigns_ids(self) -> None:
+        first, second = self._room(), self._room()
+        self.assertListEqual([first.room_id, second.room_id], [1, 2])
+        self.assertIn(first, self.registry)
+        other = GameManager()
+        other.room_id = 1
+        with self.assertRaises(ValueError):
+            self.registry.register(other)
+
+    def test_seat_index(self) -> None:
+        empty, half, full = self._room(0), self._room(1), self._room(2)
+        self.assertListEqual(self.registry.find(GameStatus.WAITING, free_seats=1), [half])
+        self.assertListEqual(self.registry.find(free_seats=2), [empty])
+        self.assertIs(self.registry.first(GameStatus.WAITING, 0), full)
+        half.remove_player(0)
+        self.assertListEqual(self.registry.find(free_seats=2), [empty, half])
+        self.assertEqual(self.registry.summary()["open_seats"], 4)
+
+    def test_status_transitions(self) -> None:
+        room = self._room(2)
+        room.apply_action({"type": GameActions.START, "payload": {}})
+        self.assertEqual(self.registry.count(GameStatus.READY_TO_START), 1)
+        room.start_game()
+        room.switch_current_player()
+        self.assertEqual(self.registry.count(GameStatus.ONGOING), 1)
+        self.assertEqual(self.registry.count(GameStatus.WAITING), 0)
+        room.apply_action({"type": GameActions.RESTART, "payload": {}})
+        self.assertEqual(self.registry.count(GameStatus.WAITING, free_seats=0), 1)
+        room.apply_action({"type": GameActions.EXIT, "payload": {}})
+        summary = self.registry.summary()
+        self.assertEqual(summary[GameStatus.FINISHED.value], 1)
+        self.assertEqual(summary["total"], 1)
+
+    def test_unregister_and_pool(self) -> None:
+        room = self._room(2)
+        self.assertTrue(RoomPool().release(room))
+        self.assertEqual(len(self.registry), 0)
+        self.assertEqual(self.registry.count(GameStatus.WAITING), 0)
+        self.assertIsNone(room.registry)
+        self.assertFalse(self.registry.unregister(room))
+
+    def test_matchmaker_registers_rooms(self) -> None:
+        mm = Matchmaker(registry=self.registry)
+        mm.join("Sato")
+        room = mm.join("Diogo").room
+        self.assertListEqual(self.registry.find(GameStatus.ONGOING), [room])
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestRoomRegistry)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,180 @@
+import unittest
+import os
+import sys
+import multiprocessing
+from threading import Event, Thread
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.storage.room_snapshots import SnapshotPublisher, SnapshotReader
+from src.managers.game_manager import GameManager
+from src.protocols.state_sync import state_delta, track
+from src.protocols.enums import GameActions, GameStatus
+from src.core.config import GameSymbols, GameVariant
+from src.managers.session_manager import SessionManager
+from src.utils.timer_wheel import TimerWheel
+
+def _room(room_id: int, variant: GameVariant = GameVariant.CLASSIC) -> GameManager:
+    manager = GameManager(variant=variant)
+    manager.room_id = room_id
+    manager.add_player("Sato", GameSymbols.CIRCLE, None)
+    manager.add_player("Diogo", GameSymbols.CROSS, None)
+    track(manager)
+    return manager
+
+def _play(manager: GameManager, slot: int) -> None:
+    response = manager.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+    assert response["payload"]["success"]
+    state_delta(manager)
+
+def _read_in_child(name: str, room_id: int, results) -> None:
+    reader = SnapshotReader(name)
+    snapshot = reader.find(room_id)
+    results.put((snapshot.version, snapshot.board))
+    reader.close()
+
+class TestRoomSnapshots(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.publisher = SnapshotPublisher(slots=4)
+        self.reader = SnapshotReader(self.publisher.name)
+
+    def tearDown(self) -> None:
+        self.reader.close()
+        self.publisher.close()
+
+    def test_publish_each_version(self) -> None:
+        manager = _room(1)
+        self.publisher.attach(manager)
+        manager.start_game()
+        manager.switch_current_player()
+        state_delta(manager)
+        for slot in (4, 0):
+            _play(manager, slot)
+            snapshot = self.reader.find(1)
+            self.assertEqual(snapshot.version, manager.version)
+            self.assertListEqual(snapshot.board, list(manager.game.board))
+            self.assertEqual(snapshot.current_player, manager.get_current_player())
+            self.assertEqual(snapshot.status, GameStatus.ONGOING)
+        self.assertIsNone(snapshot.winner)
+
+    def test_ultimate_board(self) -> None:
+        manager = _room(2, GameVariant.ULTIMATE)
+        self.publisher.attach(manager)
+        manager.start_game()
+        manager.switch_current_player()
+        _play(manager, 40)
+        self.assertListEqual(self.reader.find(2).board, list(manager.game.board))
+
+    def test_large_player_ids(self) -> None:
+        manager = GameManager()
+        manager.room_id = 3
+        manager.next_player_id = 300
+        manager.add_player("Sato", GameSymbols.CIRCLE, None)
+        manager.add_player("Diogo", GameSymbols.CROSS, None)
+        self.publisher.attach(manager)
+        manager.start_game()
+        manager.switch_current_player()
+        self.publisher.publish(manager)
+        self.assertEqual(self.reader.find(3).current_player, 300)
+
+    def test_clock_forfeit_is_published(self) -> None:
+        now = [0.0]
+        wheel = TimerWheel(clock=lambda: now[0])
+        manager = _room(4)
+        manager.set_time_control(wheel, move_time=1.0)
+        self.publisher.attach(manager)
+        manager.start_game()
+        manager.switch_current_player()
+        state_delta(manager)
+        self.assertEqual(self.reader.find(4).status, GameStatus.ONGOING)
+        now[0] = 2.0
+        wheel.advance()
+        snapshot = self.reader.find(4)
+        self.assertEqual(snapshot.status, GameStatus.FINISHED)
+        self.assertEqual(snapshot.version, manager.version)
+        self.assertEqual(snapshot.winner, 1)
+
+    def test_leave_is_published(self) -> None:
+        sessions = SessionManager(wheel=TimerWheel())
+        manager = GameManager()
+        manager.room_id = 5
+        self.publisher.attach(manager)
+        _, session = sessions.open(manager, "Sato", GameSymbols.CIRCLE, None, object())
+        state_delta(manager)
+        version = self.reader.find(5).version
+        sessions.close(session)
+        self.assertGreater(self.reader.find(5).version, version)
+        self.assertEqual(self.reader.find(5).version, manager.version)
+
+    def test_detach_and_full(self) -> None:
+        rooms = [_room(room_id) for room_id in range(1, 6)]
+        for manager in rooms[:4]:
+            self.publisher.attach(manager)
+        self.assertFalse(self.publisher.publish(rooms[4]))
+        self.assertEqual(self.publisher.dropped, 1)
+        self.publisher.detach(rooms[0])
+        self.assertIsNone(rooms[0].snapshots)
+        self.assertIsNone(self.reader.find(1))
+        self.publisher.attach(rooms[4])
+        self.assertListEqual(sorted(s.room_id for s in self.reader.rooms()), [2, 3, 4, 5])
+        with self.assertRaises(ValueError):
+            self.publisher.attach(GameManager())
+
+    def test_publish_after_close(self) -> None:
+        manager = _room(6)
+        self.publisher.attach(manager)
+        self.reader.close()
+        self.publisher.close()
+        self.assertTrue(self.publisher.closed)
+        self.assertFalse(self.publisher.publish(manager))
+        self.publisher.detach(manager)
+
+    def test_no_torn_reads(self) -> None:
+        first, second = _room(1), _room(1)
+        second.version = 7
+        second.start_game()
+        second.switch_current_player()
+        second.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": 8}})
+        expected = {0: list(first.game.board), 7: list(second.game.board)}
+        self.publisher.publish(first)
+        stop = Event()
+
+        def write() -> None:
+            while not stop.is_set():
+                self.publisher.publish(second)
+                self.publisher.publish(first)
+
+        writer = Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(2000):
+                snapshot = self.reader.find(1)
+                self.assertListEqual(snapshot.board, expected[snapshot.version])
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_other_process(self) -> None:
+        manager = _room(9)
+        self.publisher.attach(manager)
+        manager.start_game()
+        manager.switch_current_player()
+        _play(manager, 4)
+        results = multiprocessing.Queue()
+        child = multiprocessing.Process(target=_read_in_child, args=(self.publisher.name, 9, results))
+        child.start()
+        version, board = results.get(timeout=10)
+        child.join(10)
+        self.assertEqual(version, manager.version)
+        self.assertListEqual(board, list(manager.game.board))
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestRoomSnapshots))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,213 @@
+import unittest
+import os
+import sys
+import socket
+import tempfile
+from threading import Thread
+from time import perf_counter
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.common.server import Server
+from src.common.client import Client
+from src.common.transport import InProcessTransport, TcpTransport, UnixTransport
+from src.managers.game_manager import GameManager
+from src.protocols.enums import ConnectionActions, GameActions, GameStatus, ServerWarning
+from src.utils.logger import get_logger
+
+TIMEOUT = 5.0
+WIN = (0, 3, 1, 4, 2)
+
+class TestServer(unittest.TestCase):
+    """Server, ConnectionHandler, GameManager e Client juntos, sem TCP."""
+
+    def setUp(self) -> None:
+        self.room = GameManager()
+        self.transport = InProcessTransport()
+        # Sem limite de mensagens: os testes mandam rajadas de propósito.
+        self.server = Server(
+            transport=self.transport, game_manager=self.room,
+            rate_limits={}, rate_limit_default=None
+        )
+        self.thread = Thread(target=self.server.start_server, daemon=True)
+        self.thread.start()
+        self.clients = []
+
+    def tearDown(self) -> None:
+        for client in self.clients:
+            client.close()
+        self.server.stop()
+        self.thread.join(TIMEOUT)
+
+    def _client(self, transport=None) -> Client:
+        client = Client(transport=transport or self.transport)
+        self.clients.append(client)
+        return client
+
+    def _join(self):
+        first, second = self._client(), self._client()
+        first.request(ConnectionActions.JOIN, {"name": "Sato", "symbol": "o"}, TIMEOUT)
+        second.request(ConnectionActions.JOIN, {"name": "Diogo", "symbol": "x"}, TIMEOUT)
+        ready = first.request(GameActions.START, {}, TIMEOUT)
+        self.assertEqual(ready["type"], ServerWarning.GAME_READY_TO_START.value)
+        return first, second
+
+    def _play(self, first: Client, second: Client, slots) -> dict:
+        with self.room.lock:
+            self.room.start_game()
+            self.room.switch_current_player()
+        players = (first, second)
+        for i, slot in enumerate(slots):
+            response = players[i % 2].request(GameActions.MAKE_MOVEMENT, {"slot": slot}, TIMEOUT)
+            self.assertTrue(response["payload"]["success"])
+        return response
+
+    def test_full_match(self) -> None:
+        first, second = self._join()
+        self.assertEqual(len(self.room.players), 2)
+        last = self._play(first, second, WIN)
+        self.assertEqual(last["payload"]["state"]["winner"], 0)
+        self.assertTrue(self.room.is_current_state(GameStatus.FINISHED))
+        heartbeat = second.request(ConnectionActions.HEARTBEAT, {}, TIMEOUT)
+        self.assertEqual(heartbeat["type"], ServerWarning.HEARTBEAT_ACK.value)
+
+    def test_delta_reaches_other_players(self) -> None:
+        first, second = self._join()
+        with self.room.lock:
+            self.room.start_game()
+            self.room.switch_current_player()
+        moved = first.request(GameActions.MAKE_MOVEMENT, {"slot": 4}, TIMEOUT)
+        # Antes vem o delta do `start` do primeiro jogador
+        versions = []
+        while not versions or versions[-1] < moved["payload"]["version"]:
+            pushed = second.updates.get(timeout=TIMEOUT)
+            versions.append(pushed["payload"]["version"])
+        self.assertEqual(pushed["type"], ServerWarning.STATE_DELTA.value)
+        self.assertListEqual(versions, sorted(set(versions)))
+        self.assertEqual(pushed["payload"]["version"], moved["payload"]["version"])
+        self.assertEqual(pushed["payload"]["base"], moved["payload"]["version"] - 1)
+        self.assertIn([4, 0], pushed["payload"]["state"]["slots"])
+        answered = second.request(GameActions.MAKE_MOVEMENT, {"slot": 0}, TIMEOUT)
+        self.assertEqual(answered["payload"]["version"], pushed["payload"]["version"] + 1)
+        # Antes vem o delta da entrada do segundo jogador
+        update = first.updates.get(timeout=TIMEOUT)["payload"]
+        while update["version"] < answered["payload"]["version"]:
+            update = first.updates.get(timeout=TIMEOUT)["payload"]
+        self.assertEqual(update["version"], answered["payload"]["version"])
+        self.assertEqual(update["base"], moved["payload"]["version"])
+
+    def test_pipelined_messages(self) -> None:
+        client = self._client()
+        for _ in range(20):
+            client.send(ConnectionActions.HEARTBEAT, {})
+        acks = [client.receive(TIMEOUT) for _ in range(20)]
+        self.assertTrue(all(ack["type"] == ServerWarning.HEARTBEAT_ACK.value for ack in acks))
+
+    def test_resume_after_disconnect(self) -> None:
+        first = self._client()
+        joined = first.request(ConnectionActions.JOIN, {"name": "Sato", "symbol": "o"}, TIMEOUT)
+        first.close()
+        again = self._client()
+        resumed = again.request(
+            ConnectionActions.RESUME,
+            {"token": joined["payload"]["token"], "seq": joined["payload"]["seq"]},
+            TIMEOUT
+        )
+        self.assertEqual(resumed["type"], ServerWarning.SESSION_RESUMED.value)
+        self.assertEqual(resumed["payload"]["player_id"], 0)
+        self.assertEqual(len(self.room.players), 1)
+
+    def test_match_throughput(self) -> None:
+        matches = 20
+        first, second = self._join()
+        start = perf_counter()
+        for _ in range(matches):
+            last = self._play(first, second, WIN)
+            self.assertEqual(last["payload"]["state"]["winner"], 0)
+        elapsed = perf_counter() - start
+        print(f"\n{self.id()}: {matches / elapsed:.1f} partidas/s ({matches} em {elapsed:.3f}s)")
+
+    def test_stop_flushes_the_log(self) -> None:
+        logger = get_logger()
+        logger.flush()
+        written = logger.written
+        self.server.stop()
+        self.assertFalse(self.thread.is_alive())
+        # O `server_stopped` já foi escrito quando `stop` volta
+        self.assertGreater(logger.written, written)
+
+class TestTcpServer(unittest.TestCase):
+
+    def test_tcp_roundtrip(self) -> None:
+        try:
+            server = Server(transport=TcpTransport("127.0.0.1", 0))
+        except OSError as e:
+            self.skipTest(f"TCP indisponível: {e}")
+        thread = Thread(target=server.start_server, daemon=True)
+        thread.start()
+        client = Client(transport=server.transport)
+        try:
+            self.assertEqual(client.connection_result["code"], 0)
+            ack = client.request(ConnectionActions.HEARTBEAT, {}, TIMEOUT)
+            self.assertEqual(ack["type"], ServerWarning.HEARTBEAT_ACK.value)
+        finally:
+            client.close()
+            server.stop()
+            thread.join(TIMEOUT)
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Sem AF_UNIX")
+class TestUnixServer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "server.sock")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_unix_and_inprocess_listeners(self) -> None:
+        room = GameManager()
+        local = InProcessTransport()
+        unix = UnixTransport(self.path)
+        server = Server(transport=local, game_manager=room, extra_transports=[unix])
+        thread = Thread(target=server.start_server, daemon=True)
+        thread.start()
+        bot, player = Client(transport=unix), Client(transport=local)
+        try:
+            self.assertEqual(bot.connection_result["code"], 0)
+            bot.request(ConnectionActions.JOIN, {"name": "Bot", "symbol": "o"}, TIMEOUT)
+            player.request(ConnectionActions.JOIN, {"name": "Sato", "symbol": "x"}, TIMEOUT)
+            self.assertListEqual([p.name for p in room.players if p], ["Bot", "Sato"])
+            ack = bot.request(ConnectionActions.HEARTBEAT, {}, TIMEOUT)
+            self.assertEqual(ack["type"], ServerWarning.HEARTBEAT_ACK.value)
+        finally:
+            bot.close()
+            player.close()
+            server.stop()
+            thread.join(TIMEOUT)
+        self.assertFalse(thread.is_alive())
+
+    def test_stale_socket_is_replaced(self) -> None:
+        UnixTransport(self.path).listen().close()
+        self.assertTrue(os.path.exists(self.path))
+        listener = UnixTransport(self.path).listen()
+        listener.close()
+
+    def test_refused_without_server(self) -> None:
+        client = Client(transport=UnixTransport(self.path))
+        self.assertEqual(client.connection_result["code"], 1002)
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+        with self.assertRaises(FileExistsError):
+            UnixTransport(self.path).listen()
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestServer, TestTcpServer, TestUnixServer):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
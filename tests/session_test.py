@@ -0,0 +1,188 @@
+import unittest
+import os
+import sys
+import socket
+from threading import Event, Thread
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.managers.session_manager import ActionLog, SessionManager
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols
+from src.common.connection_handler import ConnectionHandler
+from src.utils.timer_wheel import TimerWheel
+from src.protocols.enums import ConnectionActions, GameActions, GameStatus, ServerWarning
+from src.protocols.errors import GameError
+from src.protocols.message_protocol import create_message
+from src.protocols.serialize import deserialize
+from src.protocols.framing import recv_frame
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestActionLog(unittest.TestCase):
+
+    def test_since(self) -> None:
+        log = ActionLog(max_size=3)
+        for i in range(5):
+            log.append({"type": "x", "payload": {"slot": i}})
+        self.assertListEqual([m["payload"]["slot"] for m in log.since(4)], [4])
+        self.assertListEqual([m["payload"]["slot"] for m in log.since(2)], [2, 3, 4])
+        self.assertListEqual(log.since(5), [])
+        self.assertIsNone(log.since(1))
+        self.assertIsNone(log.since(9))
+
+class BlockingPeer:
+
+    def __init__(self) -> None:
+        self.entered = Event()
+        self.unblock = Event()
+
+    def send(self, _: bytes) -> None:
+        self.entered.set()
+        self.unblock.wait(2)
+
+class TestSessionResume(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.wheel = TimerWheel(clock=self.clock)
+        self.sessions = SessionManager(grace_period=30.0, wheel=self.wheel)
+        self.room = GameManager()
+        self.sockets = []
+
+    def tearDown(self) -> None:
+        for sock in self.sockets:
+            sock.close()
+
+    def _connect(self):
+        server_side, client_side = socket.socketpair()
+        self.sockets += [server_side, client_side]
+        handler = ConnectionHandler(
+            server_side, ("local", 0), game_manager=self.room, sessions=self.sessions
+        )
+        return handler, client_side
+
+    def _send(self, handler, client, msg_type, payload):
+        handler.handle_message(create_message(msg_type, payload))
+        return deserialize(recv_frame(client))
+
+    def _play(self):
+        first, first_client = self._connect()
+        second, second_client = self._connect()
+        joined = self._send(first, first_client, ConnectionActions.JOIN, {"name": "Sato", "symbol": "o"})
+        self._send(second, second_client, ConnectionActions.JOIN, {"name": "Diogo", "symbol": "x"})
+        self.room.start_game()
+        self.room.switch_current_player()
+        self._send(first, first_client, GameActions.MAKE_MOVEMENT, {"slot": 4})
+        return first, second, second_client, joined["payload"]["token"]
+
+    def test_join_issues_token(self) -> None:
+        handler, client = self._connect()
+        response = self._send(handler, client, ConnectionActions.JOIN, {"name": "Sato", "symbol": "o"})
+        self.assertEqual(response["type"], ServerWarning.SESSION_OPENED.value)
+        self.assertEqual(response["payload"]["player_id"], 0)
+        self.assertEqual(len(self.sessions), 1)
+
+    def test_resume_receives_missed_actions(self) -> None:
+        first, second, second_client, token = self._play()
+        first.release()
+        self.assertEqual(len(self.room.players), 2)
+        seq = self.sessions.last_seq(self.room)
+        self._send(second, second_client, GameActions.MAKE_MOVEMENT, {"slot": 0})
+
+        handler, client = self._connect()
+        response = self._send(handler, client, ConnectionActions.RESUME, {"token": token, "seq": seq})
+        self.assertEqual(response["type"], ServerWarning.SESSION_RESUMED.value)
+        self.assertFalse(response["payload"]["resync"])
+        self.assertEqual(len(response["payload"]["actions"]), 1)
+        self.assertEqual(response["payload"]["actions"][0]["payload"]["seq"], seq + 1)
+        self.assertIs(handler.game_manager, self.room)
+
+        moved = self._send(handler, client, GameActions.MAKE_MOVEMENT, {"slot": 8})
+        self.assertTrue(moved["payload"]["success"])
+        self.clock.now = 60.0
+        self.wheel.advance()
+        self.assertEqual(len(self.room.players), 2)
+
+    def test_clock_forfeit_reaches_players(self) -> None:
+        self.room.set_time_control(self.wheel, move_time=5.0)
+        _, _, second_client, _ = self._play()
+        second_client.settimeout(1)
+        moved = deserialize(recv_frame(second_client))
+        self.clock.now = 6.0
+        self.wheel.advance()
+        pushed = deserialize(recv_frame(second_client))
+        self.assertEqual(pushed["type"], ServerWarning.STATE_DELTA.value)
+        self.assertEqual(pushed["payload"]["base"], moved["payload"]["version"])
+        self.assertEqual(pushed["payload"]["state"]["status"], GameStatus.FINISHED.value)
+        self.assertEqual(pushed["payload"]["seq"], self.sessions.last_seq(self.room))
+
+    def test_exit_counts_as_forfeit(self) -> None:
+        first, _, _, _ = self._play()
+        first.handle_message(create_message(GameActions.EXIT, {}))
+        self.assertTrue(self.room.is_current_state(GameStatus.FINISHED))
+        self.assertEqual(self.room.winner, self.room.get_player_id(GameSymbols.CROSS))
+
+    def test_grace_period_expires(self) -> None:
+        first, _, _, token = self._play()
+        first.release()
+        self.clock.now = 31.0
+        self.wheel.advance()
+        self.assertEqual(len(self.room.players), 1)
+        handler, client = self._connect()
+        response = self._send(handler, client, ConnectionActions.RESUME, {"token": token, "seq": 1})
+        self.assertEqual(response["type"], GameError.INVALID_SESSION.value)
+
+    def test_expiry_waits_for_room_lock(self) -> None:
+        first, _, _, token = self._play()
+        first.release()
+        self.clock.now = 31.0
+        with self.room.lock:
+            expiry = Thread(target=self.wheel.advance)
+            expiry.start()
+            expiry.join(timeout=0.1)
+            self.assertTrue(expiry.is_alive())
+            handler, client = self._connect()
+            response = self._send(handler, client, ConnectionActions.RESUME, {"token": token, "seq": 1})
+            self.assertEqual(response["type"], ServerWarning.SESSION_RESUMED.value)
+        expiry.join(timeout=1)
+        self.assertEqual(len(self.room.players), 2)
+        self.assertEqual(self.sessions.expired, 0)
+
+    def test_slow_peer_does_not_hold_the_room(self) -> None:
+        handler, client = self._connect()
+        self._send(handler, client, ConnectionActions.JOIN, {"name": "Sato", "symbol": "o"})
+        peer = BlockingPeer()
+        self.sessions.open(self.room, "Diogo", GameSymbols.CROSS, None, peer)
+        self.room.start_game()
+        self.room.switch_current_player()
+        action = Thread(
+            target=handler.handle_message,
+            args=(create_message(GameActions.MAKE_MOVEMENT, {"slot": 4}),)
+        )
+        action.start()
+        try:
+            self.assertTrue(peer.entered.wait(1))
+            self.assertTrue(self.room.lock.acquire(timeout=0.5))
+            self.room.lock.release()
+        finally:
+            peer.unblock.set()
+            action.join(timeout=1)
+        self.assertTrue(deserialize(recv_frame(client))["payload"]["success"])
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestActionLog, TestSessionResume):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
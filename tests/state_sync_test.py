@@ -0,0 +1,86 @@
+import unittest
+import os
+import sys
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.protocols.state_sync import state_delta, state_since, state_snapshot
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols, GameVariant
+from src.protocols.enums import GameActions, ServerWarning
+
+class TestStateSync(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.gm = GameManager()
+        self.gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        self.gm.add_player("Diogo", GameSymbols.CROSS, None)
+
+    def _move(self, slot: int) -> None:
+        self.gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+
+    def test_snapshot_on_join(self) -> None:
+        snapshot = state_snapshot(self.gm)
+        self.assertEqual(snapshot["type"], ServerWarning.STATE_SNAPSHOT.value)
+        state = snapshot["payload"]["state"]
+        self.assertListEqual(state["board"], [None] * 9)
+        self.assertListEqual(state["players"], [[0, "Sato", "o"], [1, "Diogo", "x"]])
+        self.assertEqual(state["status"], "waiting")
+
+    def test_delta_only_has_changes(self) -> None:
+        state_snapshot(self.gm)
+        self.gm.start_game()
+        self.gm.switch_current_player()
+        first = state_delta(self.gm)["payload"]
+        self.assertDictEqual(first["state"], {"current_player": 0, "status": "ongoing"})
+        self._move(4)
+        second = state_delta(self.gm)["payload"]
+        self.assertDictEqual(second["state"], {"slots": [[4, 0]], "current_player": 1})
+        self.assertEqual(second["version"], first["version"] + 1)
+        self.assertIsNone(state_delta(self.gm))
+
+    def test_since_merges_or_snapshots(self) -> None:
+        state_snapshot(self.gm)
+        self.gm.start_game()
+        self.gm.switch_current_player()
+        state_delta(self.gm)
+        for slot in (0, 3, 1):
+            self._move(slot)
+            state_delta(self.gm)
+        merged = state_since(self.gm, 1)["payload"]
+        self.assertEqual(merged["base"], 1)
+        self.assertListEqual(sorted(merged["state"]["slots"]), [[0, 0], [1, 0], [3, 1]])
+        self.assertEqual(state_since(self.gm, self.gm.version)["payload"]["state"], {})
+        gap = state_since(self.gm, -1)
+        self.assertEqual(gap["type"], ServerWarning.STATE_SNAPSHOT.value)
+
+    def test_restart_clears_slots(self) -> None:
+        self.gm.start_game()
+        self.gm.switch_current_player()
+        state_snapshot(self.gm)
+        self._move(4)
+        self.gm.apply_action({"type": GameActions.RESTART, "payload": {}})
+        changes = state_delta(self.gm)["payload"]["state"]
+        self.assertEqual(changes["status"], "waiting")
+        self.assertNotIn("slots", changes)
+
+    def test_ultimate(self) -> None:
+        gm = GameManager(variant=GameVariant.ULTIMATE)
+        gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        gm.add_player("Diogo", GameSymbols.CROSS, None)
+        gm.start_game()
+        gm.switch_current_player()
+        state_snapshot(gm)
+        gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": 40}})
+        self.assertListEqual(state_delta(gm)["payload"]["state"]["slots"], [[40, 0]])
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    all_methods = unittest.defaultTestLoader.loadTestsFromTestCase(TestStateSync)
+    suite.addTest(all_methods)
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,130 @@
+import unittest
+import os
+import sys
+from threading import Thread
+from time import sleep
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.utils.timer_wheel import TimerWheel
+from src.managers.game_manager import GameManager
+from src.core.config import GameSymbols
+from src.protocols.enums import GameActions, GameStatus
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestTimerWheel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.wheel = TimerWheel(tick=0.01, slots=8, levels=3, clock=self.clock)
+        self.fired = []
+
+    def _advance(self, seconds: float) -> int:
+        self.clock.now += seconds
+        return self.wheel.advance()
+
+    def test_fires_in_order_across_levels(self) -> None:
+        for delay in (3.0, 0.05, 0.5, 10.0):
+            self.wheel.schedule(delay, self.fired.append, delay)
+        self._advance(0.04)
+        self.assertListEqual(self.fired, [])
+        for _ in range(1100):
+            self._advance(0.01)
+        self.assertListEqual(self.fired, [0.05, 0.5, 3.0, 10.0])
+        self.assertEqual(len(self.wheel), 0)
+        self.assertLess(self.wheel.lateness.maximum, 0.011)
+
+    def test_cancel(self) -> None:
+        timer = self.wheel.schedule(0.1, self.fired.append, 1)
+        self.assertTrue(self.wheel.cancel(timer))
+        self.assertFalse(self.wheel.cancel(timer))
+        self._advance(1.0)
+        self.assertListEqual(self.fired, [])
+
+    def test_lateness_is_recorded(self) -> None:
+        self.wheel.schedule(0.1, self.fired.append, 1)
+        self.assertEqual(self._advance(0.5), 1)
+        self.assertAlmostEqual(self.wheel.lateness.maximum, 0.4)
+
+    def test_failing_callback_does_not_stop_the_wheel(self) -> None:
+        def fail() -> None:
+            raise OSError("disco cheio")
+
+        self.wheel.schedule(0.1, self.fired.append, 1)
+        self.wheel.schedule(0.1, fail)
+        self.wheel.schedule(0.1, self.fired.append, 2)
+        self.assertEqual(self._advance(0.2), 3)
+        self.wheel.schedule(0.1, self.fired.append, 3)
+        self._advance(0.2)
+        self.assertListEqual(self.fired, [1, 2, 3])
+        self.assertEqual(self.wheel.failed, 1)
+
+class TestTurnClock(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.wheel = TimerWheel(clock=self.clock)
+        self.gm = GameManager()
+        self.gm.set_time_control(self.wheel, move_time=5.0, bank=8.0)
+        self.gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        self.gm.add_player("Diogo", GameSymbols.CROSS, None)
+        self.gm.start_game()
+        self.gm.switch_current_player()
+
+    def _move(self, slot: int, seconds: float) -> None:
+        self.clock.now += seconds
+        self.wheel.advance()
+        self.gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}})
+
+    def test_move_timeout_forfeits(self) -> None:
+        self._move(4, 1.0)
+        self.clock.now += 5.5
+        self.wheel.advance()
+        self.assertTrue(self.gm.is_current_state(GameStatus.FINISHED))
+        self.assertEqual(self.gm.winner, 0)
+
+    def test_bank_runs_out(self) -> None:
+        self._move(0, 4.0)
+        self._move(1, 1.0)
+        self.assertAlmostEqual(self.gm.clock.time_left(0), 4.0)
+        self.clock.now += 4.5
+        self.wheel.advance()
+        self.assertEqual(self.gm.winner, 1)
+
+    def test_timeout_waits_for_room_lock(self) -> None:
+        # O relógio dispara em outra thread enquanto uma jogada roda:
+        # quando o lock é liberado a vez já mudou e ninguém perde.
+        self.clock.now += 5.5
+        ticker = Thread(target=self.wheel.advance)
+        with self.gm.lock:
+            ticker.start()
+            sleep(0.05)
+            self.assertTrue(ticker.is_alive())
+            self.gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": 4}})
+        ticker.join(1.0)
+        self.assertTrue(self.gm.is_current_state(GameStatus.ONGOING))
+        self.assertListEqual(self.gm.moves, [4])
+
+    def test_clock_stops_when_game_ends(self) -> None:
+        for slot in (0, 3, 1, 4, 2):
+            self._move(slot, 0.5)
+        self.assertEqual(self.gm.winner, 0)
+        self.assertEqual(len(self.wheel), 0)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestTimerWheel, TestTurnClock):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
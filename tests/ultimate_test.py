@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+from random import Random
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.core.ultimate import UltimateTicTacToe, SUB_BOARD_MASKS, ANY_SUB_BOARD
+from src.core.config import GameSymbols, GameVariant
+from src.managers.game_manager import GameManager
+from src.protocols.enums import GameActions, GameStatus, GameWarning
+from src.protocols.errors import GameError
+
+class TestUltimateTicTacToe(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.game = UltimateTicTacToe()
+        self.player1 = GameSymbols.CIRCLE
+        self.player2 = GameSymbols.CROSS
+
+    def _play(self, slots: list) -> None:
+        players = [self.player1, self.player2]
+        for i, slot in enumerate(slots):
+            self.game.set_current_player(players[i % 2])
+            self.game.make_movement(slot)
+
+    def test_move_selects_opponent_board(self) -> None:
+        self._play([4 * 9 + 2]) # Centro, casa 2
+        self.assertEqual(self.game.next_board, 2)
+        self.assertEqual(self.game.legal_moves(), SUB_BOARD_MASKS[2])
+        self.assertFalse(self.game.is_playable(4 * 9 + 3))
+
+    def test_local_win_closes_board(self) -> None:
+        # Circle: 0, 1, 2 no sub-tabuleiro 0; Cross: 9, 10 no sub-tabuleiro 1
+        self._play([0, 9, 1, 10, 2])
+        self.assertEqual(self.game.meta[0], 1)
+        self.assertEqual(self.game.closed & 1, 1)
+        # A casa 0 mandaria o adversário para o sub-tabuleiro 0, já fechado
+        self._play([18])
+        self.assertEqual(self.game.next_board, ANY_SUB_BOARD)
+        self.assertEqual(self.game.legal_moves() & SUB_BOARD_MASKS[0], 0)
+
+    def test_global_win(self) -> None:
+        board = [None] * 81
+        for sub_board in (0, 4, 8):
+            for cell in (0, 1, 2):
+                board[sub_board * 9 + cell] = 0
+        self.game.board = board
+        self.game.set_current_player(self.player1)
+        self.assertEqual(self.game.check_winner(with_symbols=True), self.player1)
+
+class TestUltimateGameManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.gm = GameManager(variant=GameVariant.ULTIMATE)
+        self.gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        self.gm.add_player("Diogo", GameSymbols.CROSS, None)
+        self.gm.apply_action({"type": GameActions.START, "payload": {}})
+        self.gm.start_game()
+        self.gm.switch_current_player()
+
+    def _move(self, slot: int) -> str:
+        message = self.gm.apply_action(
+            {"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": slot}}
+        )
+        return message["type"]
+
+    def test_illegal_board_is_rejected(self) -> None:
+        self._move(4 * 9 + 2)
+        self.assertEqual(self._move(5 * 9), GameError.ILLEGAL_MOVEMENT.value)
+        self.assertNotEqual(self._move(2 * 9 + 4), GameError.ILLEGAL_MOVEMENT.value)
+
+    def test_invalid_slot(self) -> None:
+        self.assertEqual(self._move(81), GameError.INVALID_SLOT.value)
+
+    def test_hint_is_not_available(self) -> None:
+        message = self.gm.apply_action({"type": GameActions.HINT, "payload": {}})
+        self.assertEqual(message["type"], GameError.INVALID_ACTION.value)
+
+    def test_match_finishes(self) -> None:
+        rng = Random(1)
+        while self.gm.is_current_state(GameStatus.ONGOING):
+            legal = self.gm.game.legal_moves()
+            slot = rng.choice([i for i in range(81) if legal >> i & 1])
+            self.assertEqual(self._move(slot), GameWarning.OK.value)
+        self.assertTrue(self.gm.is_current_state(GameStatus.FINISHED))
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestUltimateTicTacToe))
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestUltimateGameManager))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
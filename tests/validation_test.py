@@ -0,0 +1,111 @@
+import unittest
+import os
+import sys
+import socket
+from threading import Thread
+from rich.traceback import install
+
+install()
+
+root_dir = os.path.dirname(os.path.dirname(__file__))
+sys.path.append(root_dir)
+
+from src.protocols.validation import validate_message, validate_payload
+from src.managers.game_manager import GameManager
+from src.common.connection_handler import ConnectionHandler
+from src.core.config import GameSymbols
+from src.protocols.enums import ConnectionActions, GameActions
+from src.protocols.errors import GameError
+from src.protocols.serialize import deserialize
+from src.protocols.framing import frame, recv_frame
+
+class TestValidation(unittest.TestCase):
+
+    def test_valid_messages(self) -> None:
+        self.assertIsNone(validate_message({"type": "make_movement", "payload": {"slot": 4}}))
+        self.assertIsNone(validate_message({"type": GameActions.START, "payload": {}}))
+        self.assertIsNone(validate_message({"type": "join", "payload": {"name": "Sato", "symbol": "o"}}))
+        self.assertIsNone(validate_payload(ConnectionActions.SYNC, {"version": 0}))
+
+    def test_malformed_messages(self) -> None:
+        self.assertEqual(validate_message(["make_movement"]), GameError.INVALID_COMMAND)
+        self.assertEqual(validate_message({"payload": {}}), GameError.INVALID_COMMAND)
+        self.assertEqual(validate_message({"type": "fly", "payload": {}}), GameError.INVALID_ACTION)
+        self.assertEqual(validate_message({"type": [], "payload": {}}), GameError.INVALID_ACTION)
+        self.assertEqual(validate_message({"type": "start"}), GameError.INVALID_PAYLOAD)
+        self.assertEqual(validate_message({"type": "start", "payload": None}), GameError.INVALID_PAYLOAD)
+
+    def test_field_types(self) -> None:
+        for slot in ("4", None, True, 4.0):
+            self.assertEqual(
+                validate_payload(GameActions.MAKE_MOVEMENT, {"slot": slot}),
+                GameError.INVALID_PAYLOAD
+            )
+        self.assertEqual(validate_payload(ConnectionActions.RESUME, {"token": "abc"}), GameError.INVALID_PAYLOAD)
+        self.assertEqual(validate_payload(ConnectionActions.JOIN, {"name": 1, "symbol": "o"}), GameError.INVALID_PAYLOAD)
+
+class TestDispatch(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.gm = GameManager()
+        self.gm.add_player("Sato", GameSymbols.CIRCLE, None)
+        self.gm.add_player("Diogo", GameSymbols.CROSS, None)
+        self.gm.start_game()
+        self.gm.switch_current_player()
+
+    def test_unknown_action_does_not_raise(self) -> None:
+        response = self.gm.apply_action({"type": "fly", "payload": {}})
+        self.assertEqual(response["payload"]["error"], GameError.INVALID_ACTION)
+        self.assertFalse(response["payload"]["success"])
+
+    def test_bad_payload_is_rejected(self) -> None:
+        response = self.gm.apply_action({"type": GameActions.MAKE_MOVEMENT, "payload": {"slot": "4"}})
+        self.assertEqual(response["payload"]["error"], GameError.INVALID_PAYLOAD)
+        self.assertListEqual(list(self.gm.game.board), [None] * 9)
+
+    def test_dispatch(self) -> None:
+        response = self.gm.apply_action({"type": "make_movement", "payload": {"slot": 4}})
+        self.assertTrue(response["payload"]["success"])
+        response = self.gm.apply_action({"type": GameActions.EXIT, "payload": {}})
+        self.assertTrue(response["payload"]["success"])
+
+class TestHandlerValidation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server_side, self.client_side = socket.socketpair()
+        self.handler = ConnectionHandler(self.server_side, ("local", 0), game_manager=GameManager())
+
+    def tearDown(self) -> None:
+        self.server_side.close()
+        self.client_side.close()
+
+    def test_malformed_gets_error(self) -> None:
+        for message, error in (
+            ("oi", GameError.INVALID_COMMAND),
+            ({"type": "fly", "payload": {}}, GameError.INVALID_ACTION),
+            ({"type": "sync", "payload": {"version": "1"}}, GameError.INVALID_PAYLOAD),
+        ):
+            self.handler.handle_message(message)
+            response = deserialize(recv_frame(self.client_side))
+            self.assertEqual(response["type"], error.value)
+            self.assertFalse(response["payload"]["success"])
+
+    def test_undecodable_frame_keeps_connection(self) -> None:
+        reader = Thread(target=self.handler.run, daemon=True)
+        reader.start()
+        for data in (b"{nao e json", b"\xff\xfe"):
+            self.client_side.sendall(frame(data))
+            response = deserialize(recv_frame(self.client_side))
+            self.assertEqual(response["type"], GameError.INVALID_COMMAND.value)
+            self.assertFalse(response["payload"]["success"])
+        self.client_side.sendall(frame(b'{"type": "heartbeat", "payload": {}}'))
+        self.assertEqual(deserialize(recv_frame(self.client_side))["type"], "heartbeat_ack")
+        self.client_side.shutdown(socket.SHUT_WR)
+        reader.join(timeout=1)
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    for case in (TestValidation, TestDispatch, TestHandlerValidation):
+        suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)